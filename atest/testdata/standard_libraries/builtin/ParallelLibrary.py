@@ -0,0 +1,15 @@
+import time
+
+from robot.api import logger
+
+
+def sleep_and_log(seconds, message):
+    logger.info('Starting %s' % message)
+    time.sleep(float(seconds))
+    logger.info('Ending %s' % message)
+
+
+def print_lines(prefix, count):
+    for index in range(int(count)):
+        print '%s %d' % (prefix, index)
+        time.sleep(0.05)
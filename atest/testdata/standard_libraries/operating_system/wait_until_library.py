@@ -12,12 +12,13 @@ class wait_until_library:
             remover = os.rmdir if os.path.isdir(p) else os.remove
             self._run_after_sleeping(remover, p)
 
-    def create_file_after_sleeping(self, path):
-        self._run_after_sleeping(lambda: open(path, 'w').close())
+    def create_file_after_sleeping(self, path, delay=0.2):
+        self._run_after_sleeping(lambda: open(path, 'w').close(), delay=delay)
 
     def create_dir_after_sleeping(self, path):
         self._run_after_sleeping(os.mkdir, path)
 
-    def _run_after_sleeping(self, method, *args):
-        self._timers.append(Timer(0.2, method, args))
+    def _run_after_sleeping(self, method, *args, **config):
+        delay = float(config.get('delay', 0.2))
+        self._timers.append(Timer(delay, method, args))
         self._timers[-1].start()
@@ -0,0 +1,73 @@
+import sys
+from SimpleXMLRPCServer import SimpleXMLRPCServer, SimpleXMLRPCRequestHandler
+from SocketServer import ThreadingMixIn
+
+from remoteserver import announce_port
+
+
+class KeepAliveRequestHandler(SimpleXMLRPCRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        SimpleXMLRPCRequestHandler.setup(self)
+        self.server.statistics['connections'] += 1
+
+    def decode_request_content(self, data):
+        if self.headers.get('content-encoding') == 'gzip':
+            self.server.statistics['compressed requests'] += 1
+        return SimpleXMLRPCRequestHandler.decode_request_content(self, data)
+
+
+class BatchingServer(ThreadingMixIn, SimpleXMLRPCServer):
+    daemon_threads = True
+
+    def __init__(self, port=8270, port_file=None):
+        SimpleXMLRPCServer.__init__(self, ('127.0.0.1', int(port)),
+                                    requestHandler=KeepAliveRequestHandler)
+        self.statistics = {'connections': 0, 'compressed requests': 0,
+                           'run_keyword': 0, 'run_keywords': 0}
+        self.register_function(self.get_library_information)
+        self.register_function(self.run_keyword)
+        self.register_function(self.run_keywords)
+        announce_port(self.socket, port_file)
+        self.serve_forever()
+
+    def get_library_information(self):
+        return {'keywords': {
+                    '__intro__': {'doc': 'Server supporting batching.'},
+                    'add': {'args': ['a', 'b'], 'doc': 'Adds numbers.'},
+                    'echo': {'args': ['value'], 'doc': 'Returns value.'},
+                    'fail': {'args': ['message'], 'doc': 'Fails.'},
+                    'log_message': {'args': ['message']},
+                    'get_statistics': {'args': []}},
+                'capabilities': ['run_keywords', 'gzip']}
+
+    def run_keyword(self, name, args, kwargs=None):
+        self.statistics['run_keyword'] += 1
+        return self._run_keyword(name, args)
+
+    def run_keywords(self, calls):
+        self.statistics['run_keywords'] += 1
+        results = []
+        for name, args in calls:
+            results.append(self._run_keyword(name, args))
+            if results[-1]['status'] != 'PASS':
+                break
+        return results
+
+    def _run_keyword(self, name, args):
+        if name == 'add':
+            return {'status': 'PASS', 'return': int(args[0]) + int(args[1])}
+        if name == 'echo':
+            return {'status': 'PASS', 'return': args[0]}
+        if name == 'fail':
+            return {'status': 'FAIL', 'error': args[0]}
+        if name == 'log_message':
+            return {'status': 'PASS', 'output': args[0]}
+        if name == 'get_statistics':
+            return {'status': 'PASS', 'return': self.statistics.copy()}
+        return {'status': 'FAIL', 'error': 'Unknown keyword %s.' % name}
+
+
+if __name__ == '__main__':
+    BatchingServer(*sys.argv[1:])
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+"""Generates synthetic test data for Robot Framework benchmarks.
+
+Usage:  generate.py directory [options]
+
+Options:
+  --suites count     Number of generated suite files. Default 10.
+  --tests count      Number of tests in each suite. Default 10.
+  --keywords count   Number of top level keywords in each test. Default 10.
+  --depth count      Nesting depth of generated user keywords. Default 3.
+  --loop count       Iterations of the FOR loop in each test. Default 0.
+  --messages count   Number of messages each leaf keyword logs. Default 1.
+  --size chars       Length of each logged message. Default 50.
+  --variables count  Number of variables in the generated variable file.
+                     Default 0.
+  --globals count    Number of variables in the generated global variable
+                     file that is meant to be used with --variablefile.
+                     Default 0.
+
+Generated data consists of one resource file containing nested user
+keywords, suite files using that resource, and optional variable files.
+Generated data is always the same with the same options, which makes
+results comparable across commits.
+"""
+
+from __future__ import with_statement
+
+import os
+import sys
+from os.path import abspath, join
+
+
+DEFAULTS = {'suites': 10, 'tests': 10, 'keywords': 10, 'depth': 3, 'loop': 0,
+            'messages': 1, 'size': 50, 'variables': 0, 'globals': 0}
+
+
+def generate(directory, **config):
+    """Generates test data into `directory` and returns its absolute path."""
+    config = dict(DEFAULTS, **config)
+    directory = abspath(directory)
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    _write(join(directory, 'benchmark_resource.robot'), _resource(config))
+    if config['variables']:
+        _write(join(directory, 'benchmark_variables.py'), _variables(config))
+    if config['globals']:
+        _write(join(directory, 'benchmark_globals.py'), _globals(config))
+    for index in range(1, config['suites'] + 1):
+        _write(join(directory, 'suite_%04d.robot' % index),
+               _suite(index, config))
+    return directory
+
+
+def _write(path, lines):
+    with open(path, 'w') as output:
+        output.write('\n'.join(lines) + '\n')
+
+
+def _resource(config):
+    lines = ['*** Keywords ***']
+    depth = config['depth']
+    for level in range(1, depth + 1):
+        lines.append('Level %d' % level)
+        lines.append('    [Arguments]    ${arg}    ${default}=value')
+        if level < depth:
+            lines.append('    ${result} =    Level %d    ${arg}' % (level + 1))
+        else:
+            lines.append('    ${result} =    Set Variable    ${arg}')
+            message = 'x' * config['size']
+            for _ in range(config['messages']):
+                lines.append('    Log    ${arg} %s' % message)
+        lines.append('    [Return]    ${result}')
+        lines.append('')
+    return lines
+
+
+def _variables(config):
+    return ['VARIABLE_%05d = %r' % (index, 'value %d' % index)
+            for index in range(config['variables'])]
+
+
+def _globals(config):
+    return ['GLOBAL_%05d = %r' % (index, 'value %d' % index)
+            for index in range(config['globals'])]
+
+
+def _suite(index, config):
+    lines = ['*** Settings ***',
+             'Resource    benchmark_resource.robot']
+    if config['variables']:
+        lines.append('Variables    benchmark_variables.py')
+    lines.extend(['', '*** Test Cases ***'])
+    for test in range(1, config['tests'] + 1):
+        lines.append('Test %d.%d' % (index, test))
+        lines.append('    [Tags]    suite-%d    test-%d' % (index, test))
+        for kw in range(config['keywords']):
+            lines.append('    Level 1    argument %d' % kw)
+        if config['loop']:
+            lines.extend([':FOR    ${i}    IN RANGE    %d' % config['loop'],
+                          '\\    Level %d    ${i}' % config['depth']])
+        lines.append('')
+    return lines
+
+
+def _parse_args(args):
+    directory, config = None, {}
+    while args:
+        arg = args.pop(0)
+        if arg.startswith('--') and arg[2:] in DEFAULTS and args:
+            config[arg[2:]] = int(args.pop(0))
+        elif directory is None and not arg.startswith('--'):
+            directory = arg
+        else:
+            raise ValueError("Invalid argument '%s'." % arg)
+    if directory is None:
+        raise ValueError('Output directory not given.')
+    return directory, config
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 1 or '--help' in sys.argv:
+        print __doc__
+        sys.exit(251)
+    try:
+        directory, config = _parse_args(sys.argv[1:])
+    except ValueError, err:
+        sys.exit('%s\n\nTry --help for usage information.' % err)
+    print generate(directory, **config)
@@ -0,0 +1,341 @@
+#!/usr/bin/env python
+
+"""A script for running Robot Framework's performance benchmarks.
+
+Usage:  run_benchmarks.py [options] [benchmark(s)]
+
+Options:
+  --save path       Save results as JSON to the given file.
+  --compare path    Compare results against earlier results saved with --save.
+  --repeat count    How many times to run each benchmark. The best result is
+                    reported. Default 3.
+  --list            List available benchmarks and exit.
+
+Macro benchmarks generate synthetic test data (see `generate.py`), execute it
+in a separate process and then create log and report from the output with
+Rebot in another process. Reported metrics are execution and Rebot times,
+their peak RSS memory usage in kilobytes and sizes of created output files.
+Micro benchmarks measure hot code paths directly in this process.
+
+Benchmarks to run can be selected by giving their names as arguments.
+Names are matched case-insensitively and may contain `*` wildcards.
+
+Examples:
+$ benchmarks/run_benchmarks.py --save baseline.json
+$ benchmarks/run_benchmarks.py --compare baseline.json many_suites micro.*
+"""
+
+from __future__ import with_statement
+
+import fnmatch
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from os.path import abspath, dirname, getsize, join
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+CURDIR = dirname(abspath(__file__))
+SRC = join(CURDIR, '..', 'src')
+sys.path.insert(0, SRC)
+sys.path.insert(0, CURDIR)
+
+from generate import generate
+
+
+MACRO_BENCHMARKS = [
+    ('many_suites', {'suites': 200, 'tests': 10, 'keywords': 2}),
+    ('many_keywords', {'suites': 10, 'tests': 10, 'keywords': 100}),
+    ('deep_user_keywords', {'suites': 5, 'tests': 10, 'keywords': 20,
+                            'depth': 20}),
+    ('big_for_loops', {'suites': 2, 'tests': 2, 'keywords': 0,
+                       'loop': 10000}),
+    ('huge_outputs', {'suites': 5, 'tests': 10, 'keywords': 10,
+                      'messages': 10, 'size': 5000}),
+    ('many_variables', {'suites': 50, 'tests': 2, 'keywords': 2,
+                        'variables': 5000}),
+    ('many_globals', {'suites': 200, 'tests': 2, 'keywords': 2,
+                      'globals': 10000}),
+]
+
+
+def run_macro_benchmark(config, repeat=3):
+    tempdir = tempfile.mkdtemp(prefix='robotbenchmark-')
+    try:
+        datadir = generate(join(tempdir, 'data'), **config)
+        outdir = join(tempdir, 'results')
+        results = [_run_macro_benchmark_once(datadir, outdir)
+                   for _ in range(repeat)]
+    finally:
+        shutil.rmtree(tempdir)
+    return _best(results)
+
+
+def _run_macro_benchmark_once(datadir, outdir):
+    output = join(outdir, 'output.xml')
+    log, report = join(outdir, 'log.html'), join(outdir, 'report.html')
+    options = ['--output', output, '--log', 'NONE', '--report', 'NONE',
+               '--monitorcolors', 'off']
+    global_file = join(datadir, 'benchmark_globals.py')
+    if os.path.exists(global_file):
+        options.extend(['--variablefile', global_file])
+    run = _run_child('run', *(options + [datadir]))
+    rebot = _run_child('rebot', '--log', log, '--report', report, output)
+    return {'run time': run['time'], 'run rss': run['rss'],
+            'rebot time': rebot['time'], 'rebot rss': rebot['rss'],
+            'output size': getsize(output), 'log size': getsize(log),
+            'report size': getsize(report)}
+
+
+def _run_child(command, *args):
+    process = subprocess.Popen([sys.executable, abspath(__file__),
+                                '--child', command] + list(args),
+                               stdout=subprocess.PIPE)
+    stdout = process.communicate()[0]
+    return json.loads(stdout.splitlines()[-1])
+
+
+def _child(command, *args):
+    from robot import rebot_cli, run_cli
+    runner = {'run': run_cli, 'rebot': rebot_cli}[command]
+    with open(os.devnull, 'w') as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        start = time.time()
+        try:
+            runner(list(args))
+        except SystemExit:
+            pass
+        elapsed = time.time() - start
+        sys.stdout = stdout
+    print json.dumps({'time': elapsed, 'rss': _peak_rss()})
+
+
+def _peak_rss():
+    if not resource:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, OS X bytes.
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+
+def _best(results):
+    return dict((name, min(result[name] for result in results))
+                for name in results[0])
+
+
+class MicroBenchmarks(object):
+    """Micro benchmarks measuring time of hot code paths in seconds."""
+
+    def __init__(self, repeat=3):
+        self._repeat = repeat
+        self._tempdir = None
+        self._output = None
+
+    def __iter__(self):
+        for name in sorted(dir(self)):
+            if name.startswith('bench_'):
+                yield 'micro.' + name[6:], getattr(self, name)
+
+    def __enter__(self):
+        self._tempdir = tempfile.mkdtemp(prefix='robotbenchmark-')
+        return self
+
+    def __exit__(self, *exc_info):
+        shutil.rmtree(self._tempdir)
+
+    def _measure(self, func, number=1, setup=lambda: None):
+        timer = timeit.Timer(func, setup)
+        return {'time': min(timer.repeat(self._repeat, number))}
+
+    @property
+    def output(self):
+        if not self._output:
+            config = dict(MACRO_BENCHMARKS)['many_keywords']
+            datadir = generate(join(self._tempdir, 'data'), **config)
+            self._output = join(self._tempdir, 'output.xml')
+            _run_child('run', '--output', self._output, '--log', 'NONE',
+                       '--report', 'NONE', datadir)
+        return self._output
+
+    def bench_variable_replacer(self):
+        from robot.variables import Variables
+        variables = Variables()
+        for index in range(100):
+            variables['${var%d}' % index] = 'value %d' % index
+        variables['@{list}'] = range(100)
+        items = ['${var%d} and ${var%d}' % (i, i+1) for i in range(99)]
+        items += ['@{list}', '${list[1]}', '${var1.upper()}', '${42}']
+        return self._measure(lambda: variables.replace_list(items), 100)
+
+    def bench_user_keyword_arguments(self):
+        from robot.running.model import UserKeyword
+        from robot.running.userkeyword import UserKeywordHandler
+        from robot.variables import Variables
+        variables = Variables()
+        variables['${var}'] = 'value'
+        handler = UserKeywordHandler(UserKeyword('Keyword', args=[
+            '${a}', '${b}', '${c}=default']), 'resource')
+        calls = [['x', 'y', 'z'], ['${var}', 'y'], ['x', 'c=z', 'b=y']] * 100
+
+        def resolve():
+            for args in calls:
+                handler._resolve_arguments(args, variables)
+        return self._measure(resolve, 10)
+
+    def bench_item_list(self):
+        from robot.model import ItemList
+
+        class Item(object):
+            pass
+
+        def create():
+            items = ItemList(Item, {'parent': None})
+            for _ in range(1000):
+                items.append(Item())
+            for item in items:
+                pass
+        return self._measure(create, 10)
+
+    def bench_tag_patterns(self):
+        from robot.model import Tags, TagPatterns
+        patterns = TagPatterns(['tag-1', 'tag-2?', 'suite-*', 'AANDB',
+                                'tag-3ORtag-4', 'tag-5NOTsuite-1'])
+        tags = [Tags(['Tag %d' % i, 'Suite %d' % (i % 10), 'other'])
+                for i in range(1000)]
+
+        def match():
+            for test_tags in tags:
+                patterns.match(test_tags)
+                for tag in test_tags:
+                    patterns.match(tag)
+        return self._measure(match, 10)
+
+    def bench_filtered_logging(self):
+        from robot.conf import RobotSettings
+        from robot.output import output
+        from robot.output.logger import Logger
+        logger = Logger(register_console_logger=False)
+        logger.disable_message_cache()
+        original, output.LOGGER = output.LOGGER, logger
+        try:
+            out = output.Output(RobotSettings(output=os.devnull,
+                                              loglevel='INFO'))
+
+            def log():
+                for i in range(10000):
+                    logger.debug('Debug message %d' % i)
+                    logger.trace('Trace message %d' % i)
+                    # Keyword arguments and return values are logged so.
+                    out.trace(lambda: 'Arguments: [ %d ]' % i)
+            return self._measure(log, 10)
+        finally:
+            output.LOGGER = original
+
+    def bench_execution_result_builder(self):
+        from robot.api import ExecutionResult
+        output = self.output
+        return self._measure(lambda: ExecutionResult(output))
+
+    def bench_js_model_builder(self):
+        from robot.api import ExecutionResult
+        from robot.reporting.jsmodelbuilders import JsModelBuilder
+        result = ExecutionResult(self.output)
+        return self._measure(lambda: JsModelBuilder().build_from(result))
+
+
+def run_benchmarks(patterns=(), repeat=3):
+    results = {}
+    for name, config in MACRO_BENCHMARKS:
+        if _matches(name, patterns):
+            results[name] = _report(name, run_macro_benchmark(config, repeat))
+    with MicroBenchmarks(repeat) as micro:
+        for name, benchmark in micro:
+            if _matches(name, patterns):
+                results[name] = _report(name, benchmark())
+    return results
+
+
+def list_benchmarks():
+    with MicroBenchmarks() as micro:
+        return [name for name, _ in MACRO_BENCHMARKS] + [n for n, _ in micro]
+
+
+def _matches(name, patterns):
+    return not patterns or any(fnmatch.fnmatch(name.lower(), p.lower())
+                               for p in patterns)
+
+
+def _report(name, result):
+    print '%s:' % name
+    for metric in sorted(result):
+        print '  %-12s %s' % (metric, _format(metric, result[metric]))
+    sys.stdout.flush()
+    return result
+
+
+def _format(metric, value):
+    if value is None:
+        return 'N/A'
+    if metric.endswith('time'):
+        return '%.3f s' % value
+    return '%d' % value
+
+
+def compare(results, baseline):
+    print '\nComparison against baseline:'
+    for name in sorted(results):
+        if name not in baseline:
+            continue
+        print '%s:' % name
+        for metric in sorted(results[name]):
+            old, new = baseline[name].get(metric), results[name][metric]
+            if not (old and new):
+                continue
+            print '  %-12s %12s -> %-12s %+.1f%%' % (
+                metric, _format(metric, old), _format(metric, new),
+                (new - old) * 100.0 / old)
+
+
+def _parse_args(args):
+    options = {'save': None, 'compare': None, 'repeat': 3}
+    patterns = []
+    while args:
+        arg = args.pop(0)
+        if arg[2:] in options and args:
+            options[arg[2:]] = args.pop(0)
+        else:
+            patterns.append(arg)
+    options['repeat'] = int(options['repeat'])
+    return options, patterns
+
+
+def main(args):
+    options, patterns = _parse_args(args)
+    results = run_benchmarks(patterns, options['repeat'])
+    if options['compare']:
+        with open(options['compare']) as baseline:
+            compare(results, json.load(baseline))
+    if options['save']:
+        with open(options['save'], 'w') as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    if '--help' in sys.argv:
+        print __doc__
+        sys.exit(251)
+    if '--list' in sys.argv:
+        print '\n'.join(list_benchmarks())
+        sys.exit(0)
+    if sys.argv[1:2] == ['--child']:
+        _child(*sys.argv[2:])
+    else:
+        main(sys.argv[1:])
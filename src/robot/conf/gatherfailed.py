@@ -12,34 +12,121 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from __future__ import with_statement
+
 from robot.errors import DataError
-from robot.model import SuiteVisitor
-from robot.result import ExecutionResult
-from robot.utils import get_error_message
+from robot.utils import ET, ETSource, get_error_message
+
 
+class GatherFailed(object):
+    """Collects failed tests and suites from an output file in one pass.
 
-class GatherFailedTests(SuiteVisitor):
+    The output is parsed as a stream without building the result model.
+    Only names of suites being parsed and names of passed tests that may
+    still fail due to a suite teardown failure are kept in memory.
+    """
 
     def __init__(self):
         self.tests = []
+        self.suites = []
+        self._suites = []
+
+    def gather(self, source):
+        ets = ETSource(source)
+        try:
+            with ets as source:
+                context = ET.iterparse(source, events=('start', 'end'))
+                self._parse(context)
+        except IOError, err:
+            error = err.strerror
+        except:
+            error = get_error_message()
+        else:
+            return self
+        raise DataError("Reading XML source '%s' failed: %s"
+                        % (unicode(ets), error))
+
+    def _parse(self, context):
+        elems = []
+        for event, elem in context:
+            if not elems and elem.tag != 'robot':
+                raise DataError("Incompatible XML element '%s'." % elem.tag)
+            if event == 'start':
+                if elem.tag == 'suite':
+                    self._suites.append(_Suite(elem.get('name'),
+                                               self._longname))
+                elems.append(elem)
+                continue
+            elems.pop()
+            if elem.tag == 'status':
+                self._status(elem.get('status'), elems)
+            elif elem.tag == 'suite':
+                self._end_suite()
+                if not self._suites:
+                    break
+            if elems:
+                elems[-1].remove(elem)
+
+    @property
+    def _longname(self):
+        return self._suites[-1].longname if self._suites else None
+
+    def _status(self, status, parents):
+        parent = parents[-1]
+        if parent.tag == 'test':
+            name = '%s.%s' % (self._longname, parent.get('name'))
+            self._test(name, failed=status != 'PASS')
+        # Both 'PASS' and 'NOT_RUN' (used in dry-run) statuses are OK.
+        elif parent.tag == 'kw' and parent.get('type') == 'teardown' \
+                and parents[-2].tag == 'suite' and status == 'FAIL':
+            self._suites[-1].teardown_failed = True
+
+    def _test(self, name, failed):
+        suite = self._suites[-1]
+        if failed:
+            self.tests.append(name)
+            suite.failed = True
+        else:
+            suite.passed.append(name)
 
-    def visit_test(self, test):
-        if not test.passed:
-            self.tests.append(test.longname)
+    def _end_suite(self):
+        suite = self._suites.pop()
+        if suite.teardown_failed:
+            self.tests.extend(suite.passed)
+            suite.failed = suite.failed or bool(suite.passed)
+            suite.passed = []
+        if suite.failed:
+            self.suites.append(suite.longname)
+        if self._suites:
+            self._suites[-1].passed.extend(suite.passed)
 
-    def visit_keyword(self, kw):
-        pass
+
+class _Suite(object):
+    __slots__ = ['longname', 'passed', 'failed', 'teardown_failed']
+
+    def __init__(self, name, parent=None):
+        self.longname = '%s.%s' % (parent, name) if parent else name
+        self.passed = []
+        self.failed = False
+        self.teardown_failed = False
 
 
 def gather_failed_tests(output):
+    return _gather_failed(output, 'tests')
+
+
+def gather_failed_suites(output):
+    return _gather_failed(output, 'suites')
+
+
+def _gather_failed(output, item_type):
     if output.upper() == 'NONE':
         return []
-    gatherer = GatherFailedTests()
     try:
-        ExecutionResult(output, include_keywords=False).suite.visit(gatherer)
-        if not gatherer.tests:
+        items = getattr(GatherFailed().gather(output), item_type)
+        if not items:
             raise DataError('All tests passed.')
     except:
-        raise DataError("Collecting failed tests from '%s' failed: %s"
-                        % (output, get_error_message()))
-    return gatherer.tests
+        raise DataError("Collecting failed %s from '%s' failed: %s"
+                        % (item_type, output, get_error_message()))
+    return items
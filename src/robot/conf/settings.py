@@ -20,10 +20,11 @@ import time
 from robot import utils
 from robot.errors import DataError, FrameworkError
 from robot.output import LOGGER, loggerhelper
+from robot.output.forloopsampler import parse_sample_for_loops
 from robot.result.keywordremover import KeywordRemover
 from robot.result.flattenkeywordmatcher import FlattenKeywordMatcher
 
-from .gatherfailed import gather_failed_tests
+from .gatherfailed import gather_failed_suites, gather_failed_tests
 
 
 class _BaseSettings(object):
@@ -32,6 +33,7 @@ class _BaseSettings(object):
                  'Metadata'         : ('metadata', []),
                  'TestNames'        : ('test', []),
                  'ReRunFailed'      : ('rerunfailed', 'NONE'),
+                 'ReRunFailedSuites': ('rerunfailedsuites', 'NONE'),
                  'DeprecatedRunFailed': ('runfailed', 'NONE'),
                  'SuiteNames'       : ('suite', []),
                  'SetTag'           : ('settag', []),
@@ -63,7 +65,7 @@ class _BaseSettings(object):
                  'StdOut'           : ('stdout', None),
                  'StdErr'           : ('stderr', None),
                  'XUnitSkipNonCritical' : ('xunitskipnoncritical', False)}
-    _output_opts = ['Output', 'Log', 'Report', 'XUnit', 'DebugFile']
+    _output_opts = ['Output', 'Log', 'Report', 'XUnit', 'DebugFile', 'Profile']
 
     def __init__(self, options=None, **extra_options):
         self.start_timestamp = utils.format_time(time.time(), '', '-', '')
@@ -79,6 +81,7 @@ class _BaseSettings(object):
                 value = [value]
             self[name] = self._process_value(name, value)
         self['TestNames'] += self['ReRunFailed'] or self['DeprecatedRunFailed']
+        self['SuiteNames'] += self['ReRunFailedSuites']
         if self['DeprecatedXUnit']:
             self['XUnit'] = self['DeprecatedXUnit']
 
@@ -90,6 +93,8 @@ class _BaseSettings(object):
     def _process_value(self, name, value):
         if name in ['ReRunFailed', 'DeprecatedRunFailed']:
             return gather_failed_tests(value)
+        if name == 'ReRunFailedSuites':
+            return gather_failed_suites(value)
         if name == 'LogLevel':
             return self._process_log_level(value)
         if value == self._get_default_value(name):
@@ -131,6 +136,8 @@ class _BaseSettings(object):
             self._validate_remove_keywords(value)
         if name == 'FlattenKeywords':
             self._validate_flatten_keywords(value)
+        if name == 'SampleForLoops':
+            return self._process_sample_for_loops(value)
         return value
 
     def _escape_as_data(self, value):
@@ -196,7 +203,8 @@ class _BaseSettings(object):
     def _get_output_file(self, option):
         """Returns path of the requested output file and creates needed dirs.
 
-        `option` can be 'Output', 'Log', 'Report', 'XUnit' or 'DebugFile'.
+        `option` can be 'Output', 'Log', 'Report', 'XUnit', 'DebugFile'
+        or 'Profile'.
         """
         name = self._opts[option]
         if not name:
@@ -212,6 +220,9 @@ class _BaseSettings(object):
 
     def _process_output_name(self, option, name):
         base, ext = os.path.splitext(name)
+        if ext.lower() == '.gz':
+            base, inner_ext = os.path.splitext(base)
+            ext = inner_ext + ext
         if self['TimestampOutputs']:
             base = '%s-%s' % (base, self.start_timestamp)
         ext = self._get_output_extension(ext, option)
@@ -224,7 +235,7 @@ class _BaseSettings(object):
             return '.xml'
         if type_ in ['Log', 'Report']:
             return '.html'
-        if type_ == 'DebugFile':
+        if type_ in ['DebugFile', 'Profile']:
             return '.txt'
         raise FrameworkError("Invalid output file type: %s" % type_)
 
@@ -325,6 +336,12 @@ class _BaseSettings(object):
             except DataError, err:
                 raise DataError("Invalid value for option '--flattenkeywords'. %s" % err)
 
+    def _process_sample_for_loops(self, value):
+        try:
+            return parse_sample_for_loops(value)
+        except DataError, err:
+            raise DataError("Invalid value for option '--sampleforloops'. %s" % err)
+
     def __contains__(self, setting):
         return setting in self._cli_opts
 
@@ -404,18 +421,24 @@ class RobotSettings(_BaseSettings):
                        'Listeners'          : ('listener', []),
                        'MonitorWidth'       : ('monitorwidth', 78),
                        'MonitorMarkers'     : ('monitormarkers', 'AUTO'),
-                       'DebugFile'          : ('debugfile', None)}
+                       'DebugFile'          : ('debugfile', None),
+                       'Profile'            : ('profile', None),
+                       'BackgroundOutput'   : ('backgroundoutput', False),
+                       'SampleForLoops'     : ('sampleforloops', None)}
 
     def get_rebot_settings(self):
         settings = RebotSettings()
         settings._opts.update(self._opts)
-        for name in ['Variables', 'VariableFiles', 'Listeners']:
+        for name in ['Variables', 'VariableFiles', 'Listeners',
+                     'BackgroundOutput', 'SampleForLoops']:
             del(settings._opts[name])
         for name in ['Include', 'Exclude', 'TestNames', 'SuiteNames', 'Metadata']:
             settings._opts[name] = []
         for name in ['Name', 'Doc']:
             settings._opts[name] = None
-        settings._opts['Output'] = None
+        # xUnit output is written already during execution by XUnitLogger.
+        for name in ['Output', 'XUnit']:
+            settings._opts[name] = None
         settings._opts['LogLevel'] = 'TRACE'
         settings._opts['ProcessEmptySuite'] = self['RunEmptySuite']
         return settings
@@ -12,6 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import re
+
 
 class JsonWriter(object):
 
@@ -36,65 +38,103 @@ class JsonWriter(object):
 
 
 class JsonDumper(object):
+    _buffer_size = 1000
 
     def __init__(self, output):
         self._output = output
-        self._dumpers = (MappingDumper(self),
-                         IntegerDumper(self),
-                         TupleListDumper(self),
-                         StringDumper(self),
-                         NoneDumper(self),
-                         DictDumper(self))
+        self._buffer = []
+        self._mapped_types = ()
+        self._dumpers = (IntegerDumper(self._dump, self._write),
+                         TupleListDumper(self._dump, self._write),
+                         StringDumper(self._dump, self._write),
+                         NoneDumper(self._dump, self._write),
+                         DictDumper(self._dump, self._write))
+        self._mapping_dumper = MappingDumper(self._dump, self._write)
+        self._type_dumpers = dict((type_, dumper) for dumper in self._dumpers
+                                  for type_ in dumper.handled_types)
 
     def dump(self, data, mapping=None):
+        self._mapped_types = set(type(item) for item in mapping or ())
+        try:
+            self._dump(data, mapping)
+        finally:
+            self._flush()
+
+    def _dump(self, data, mapping):
+        if type(data) in self._mapped_types \
+                and self._mapping_dumper.handles(data, mapping):
+            dumper = self._mapping_dumper
+        else:
+            dumper = self._type_dumpers.get(type(data)) \
+                     or self._get_dumper(data, mapping)
+        dumper.dump(data, mapping)
+
+    def _get_dumper(self, data, mapping):
         for dumper in self._dumpers:
             if dumper.handles(data, mapping):
-                dumper.dump(data, mapping)
-                return
+                self._type_dumpers[type(data)] = dumper
+                return dumper
         raise ValueError('Dumping %s not supported' % type(data))
 
     def write(self, data):
-        self._output.write(data)
+        self._write(data)
+        self._flush()
+
+    def _write(self, data):
+        self._buffer.append(data)
+        if len(self._buffer) >= self._buffer_size:
+            self._flush()
+
+    def _flush(self):
+        if self._buffer:
+            self._output.write(''.join(self._buffer))
+            self._buffer = []
 
 
 class _Dumper(object):
-    _handled_types = None
+    handled_types = ()
 
-    def __init__(self, jsondumper):
-        self._dump = jsondumper.dump
-        self._write = jsondumper.write
+    def __init__(self, dump, write):
+        self._dump = dump
+        self._write = write
 
     def handles(self, data, mapping):
-        return isinstance(data, self._handled_types)
+        return isinstance(data, self.handled_types)
 
     def dump(self, data, mapping):
         raise NotImplementedError
 
 
 class StringDumper(_Dumper):
-    _handled_types = basestring
-    _search_and_replace = [('\\', '\\\\'), ('"', '\\"'), ('\t', '\\t'),
-                           ('\n', '\\n'), ('\r', '\\r'), ('</', '\\x3c/')]
+    handled_types = (str, unicode)
+    _replacements = {'\\': '\\\\', '"': '\\"', '\t': '\\t',
+                     '\n': '\\n', '\r': '\\r', '</': '\\x3c/'}
+    _escape_needed = re.compile(r'[\\"\t\n\r]|</')
+
+    def handles(self, data, mapping):
+        return isinstance(data, basestring)
 
     def dump(self, data, mapping):
         self._write('"%s"' % (self._encode(data) if data else ''))
 
     def _encode(self, string):
-        for search, replace in self._search_and_replace:
-            if search in string:
-                string = string.replace(search, replace)
+        if self._escape_needed.search(string):
+            string = self._escape_needed.sub(self._replace, string)
         return string.encode('UTF-8')
 
+    def _replace(self, match):
+        return self._replacements[match.group()]
+
 
 class IntegerDumper(_Dumper):
-    _handled_types = (int, long, bool)
+    handled_types = (int, long, bool)
 
     def dump(self, data, mapping):
         self._write(str(data).lower())
 
 
 class DictDumper(_Dumper):
-    _handled_types = dict
+    handled_types = (dict,)
 
     def dump(self, data, mapping):
         self._write('{')
@@ -109,7 +149,7 @@ class DictDumper(_Dumper):
 
 
 class TupleListDumper(_Dumper):
-    _handled_types = (tuple, list)
+    handled_types = (tuple, list)
 
     def dump(self, data, mapping):
         self._write('[')
@@ -134,6 +174,7 @@ class MappingDumper(_Dumper):
 
 
 class NoneDumper(_Dumper):
+    handled_types = (type(None),)
 
     def handles(self, data, mapping):
         return data is None
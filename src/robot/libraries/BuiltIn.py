@@ -23,7 +23,7 @@ from robot.errors import (ContinueForLoop, DataError, ExecutionFailed,
 from robot import utils
 from robot.utils import asserts
 from robot.variables import is_var, is_list_var
-from robot.running import Keyword, RUN_KW_REGISTER
+from robot.running import Keyword, ParallelKeywords, RUN_KW_REGISTER
 from robot.running.context import EXECUTION_CONTEXTS
 from robot.running.usererrorhandler import UserErrorHandler
 from robot.version import get_version
@@ -1239,6 +1239,44 @@ class _RunKeyword:
         """
         self._run_keywords(self._split_run_keywords(list(keywords)))
 
+    def run_keywords_in_parallel(self, timeout, *keywords):
+        """Executes all the given keywords concurrently in separate threads.
+
+        Keywords are given using the same syntax as with `Run Keywords`,
+        including the possibility to use upper case `AND` as a separator
+        between keywords with arguments. All keywords are started at the same
+        time and this keyword returns when all of them have finished.
+
+        `timeout` is applied separately to each of the keywords and it works
+        the same way as a user keyword timeout. It can be given in Robot
+        Framework's time format (e.g. `1 minute`, `2 min 3 s`, `4.5`) and
+        timeout can be disabled with `NONE`.
+
+        If one or more of the keywords fail, this keyword fails after all
+        keywords have finished and reports all the failures.
+
+        Log messages and other output of each keyword are collected while
+        the keywords run and written to the log file after all of them have
+        finished. Keywords are shown in the log in the same order as they are
+        given to this keyword regardless of the order they actually finished.
+        Listeners are notified about the keywords only at that point.
+
+        Examples:
+        | Run Keywords In Parallel | 1 min | Warm Up Server | AND | Provision | node1 | AND | Provision | node2 |
+        | Run Keywords In Parallel | NONE | @{SLOW KEYWORDS} |
+
+        The keywords share library instances and variables set using `Set
+        Test Variable`, `Set Suite Variable` or `Set Global Variable`, but
+        other variables they set are local to them. Using libraries that are
+        not thread-safe in the keywords, or sharing resources otherwise, can
+        cause problems.
+
+        New in Robot Framework 2.8.8.
+        """
+        keywords = [Keyword(name, list(args)) for name, args
+                    in self._split_run_keywords(list(keywords))]
+        ParallelKeywords(keywords, timeout).run(self._context)
+
     def _run_keywords(self, iterable):
         errors = []
         for kw, args in iterable:
@@ -17,7 +17,10 @@ import codecs
 import fnmatch
 import glob
 import os
+import re
+import select
 import shutil
+import struct
 import subprocess
 import sys
 import tempfile
@@ -125,6 +128,9 @@ class OperatingSystem:
     ROBOT_LIBRARY_SCOPE = 'GLOBAL'
     ROBOT_LIBRARY_VERSION = __version__
 
+    def __init__(self):
+        self._tail_positions = {}
+
     def run(self, command):
         """Runs the given command in the system and returns the output.
 
@@ -346,7 +352,8 @@ class OperatingSystem:
         with open(path, 'rb') as f:
             return f.read()
 
-    def grep_file(self, path, pattern, encoding='UTF-8', encoding_errors='strict'):
+    def grep_file(self, path, pattern, encoding='UTF-8', encoding_errors='strict',
+                  regexp=False, max_matches=None):
         """Returns the lines of the specified file that match the `pattern`.
 
         This keyword reads a file from the file system using the defined
@@ -359,31 +366,109 @@ class OperatingSystem:
         A line matches if it contains the `pattern` anywhere in it and
         it *does not need to match the pattern fully*. The pattern
         matching syntax is explained in `introduction`, and in this
-        case matching is case-sensitive.
+        case matching is case-sensitive. If `regexp` is given a true value
+        (e.g. any non-empty string), the pattern is considered to be
+        a regular expression instead. Also then it only needs to match
+        part of the line.
+
+        If `max_matches` is given, reading the file is stopped after that
+        many lines have matched.
 
         Examples:
         | ${errors} = | Grep File | /var/log/myapp.log | ERROR |
         | ${ret} = | Grep File | ${CURDIR}/file.txt | [Ww]ildc??d ex*ple |
+        | ${first} = | Grep File | ${CURDIR}/file.txt | ^\\d+ | regexp=yes | max_matches=1 |
 
-        If more complex pattern matching is needed, it is possible to use
-        `Get File` in combination with String library keywords like `Get
-        Lines Matching Regexp`.
+        The file is read line by line, so also very large files can be
+        searched. `Tail File` can be used to search only lines added to
+        a file after it was previously read.
 
-        `encoding_errors` argument is new in Robot Framework 2.8.5.
+        `encoding_errors` argument is new in Robot Framework 2.8.5 and
+        `regexp` and `max_matches` in Robot Framework 2.8.8.
         """
-        pattern = '*%s*' % pattern
+        matches = self._get_line_matcher(pattern, regexp)
+        max_matches = int(max_matches) if max_matches else None
         path = self._absnorm(path)
         lines = []
         total_lines = 0
         self._link("Reading file '%s'", path)
         with codecs.open(path, encoding=encoding, errors=encoding_errors) as f:
-            for line in f.readlines():
+            for line in f:
                 total_lines += 1
                 line = line.rstrip('\r\n')
-                if fnmatch.fnmatchcase(line, pattern):
+                if matches(line):
+                    lines.append(line)
+                    if len(lines) == max_matches:
+                        break
+        self._info('%d out of %d lines matched' % (len(lines), total_lines))
+        return '\n'.join(lines)
+
+    def _get_line_matcher(self, pattern, regexp=False):
+        if not regexp:
+            pattern = fnmatch.translate('*%s*' % pattern)
+            return re.compile(pattern).match
+        return re.compile(pattern).search
+
+    def tail_file(self, path, pattern=None, encoding='UTF-8',
+                  encoding_errors='strict', regexp=False):
+        """Returns lines added to the specified file after it was last read.
+
+        The first time this keyword is used with a certain file, all lines in
+        the file are returned. Subsequent calls with the same file return only
+        lines that have been appended to it after the previous call. This
+        makes it possible to, for example, verify that certain messages are
+        logged to an application log without reading the whole log again.
+        If the file has been replaced with a new file, for example, when
+        a log file is rotated, or it is smaller than when it was previously
+        read, it is read from the beginning. A file that is truncated and
+        then grows back to its earlier size before it is read again cannot
+        be detected, though.
+
+        Lines are returned as a single string catenated back together with
+        newlines. Possible last line that does not yet end with a newline is
+        not returned until it has been completed.
+
+        If `pattern` is given, only lines matching it are returned. Pattern
+        matching works the same way as with `Grep File`, including the
+        `regexp` argument. `encoding` and `encoding_errors` have the same
+        semantics as with `Get File`, but the encoding must be compatible
+        with ASCII, such as UTF-8 or ISO-8859-1.
+
+        Examples:
+        | ${lines} = | Tail File | /var/log/myapp.log | # Remember position |
+        | Do Something |
+        | ${errors} = | Tail File | /var/log/myapp.log | ERROR |
+        | Should Be Empty | ${errors} |
+
+        New in Robot Framework 2.8.8.
+        """
+        matches = self._get_line_matcher(pattern, regexp) if pattern else None
+        path = self._absnorm(path)
+        stat = os.stat(path)
+        identity = (stat.st_dev, stat.st_ino)
+        previous, position = self._tail_positions.get(path, (identity, 0))
+        if previous != identity or stat.st_size < position:
+            position = 0
+        lines = []
+        total_lines = 0
+        self._link("Reading file '%s'", path)
+        with open(path, 'rb') as f:
+            f.seek(position)
+            for line in f:
+                if not line.endswith('\n'):
+                    break
+                position += len(line)
+                total_lines += 1
+                line = line.decode(encoding, encoding_errors).rstrip('\r\n')
+                if not matches or matches(line):
                     lines.append(line)
-            self._info('%d out of %d lines matched' % (len(lines), total_lines))
-            return '\n'.join(lines)
+        self._tail_positions[path] = (identity, position)
+        if matches:
+            self._info('%d out of %d new lines matched'
+                       % (len(lines), total_lines))
+        else:
+            self._info('%d new line%s' % (total_lines, plural_or_not(total_lines)))
+        return '\n'.join(lines)
 
     def log_file(self, path, encoding='UTF-8', encoding_errors='strict'):
         """Wrapper for `Get File` that also logs the returned file.
@@ -520,15 +605,15 @@ class OperatingSystem:
 
         If the timeout is negative, the keyword is never timed-out. The keyword
         returns immediately, if the path does not exist in the first place.
+
+        On Linux the keyword is notified about file system changes and returns
+        immediately when the path is removed. On other systems the path is
+        checked periodically.
         """
         path = self._absnorm(path)
         timeout = timestr_to_secs(timeout)
-        maxtime = time.time() + timeout
-        while glob.glob(path):
-            time.sleep(0.1)
-            if timeout >= 0 and time.time() > maxtime:
-                raise AssertionError("'%s' was not removed in %s"
-                                     % (path, secs_to_timestr(timeout)))
+        self._wait_until([path], lambda exists: not exists[0], timeout,
+                         lambda exists: "'%s' was not removed" % path)
         self._link("'%s' was removed", path)
 
     def wait_until_created(self, path, timeout='1 minute'):
@@ -546,16 +631,114 @@ class OperatingSystem:
 
         If the timeout is negative, the keyword is never timed-out. The keyword
         returns immediately, if the path already exists.
+
+        On Linux the keyword is notified about file system changes and returns
+        immediately when the path is created. On other systems the path is
+        checked periodically.
         """
         path = self._absnorm(path)
         timeout = timestr_to_secs(timeout)
-        maxtime = time.time() + timeout
-        while not glob.glob(path):
-            time.sleep(0.1)
-            if timeout >= 0 and time.time() > maxtime:
-                raise AssertionError("'%s' was not created in %s"
-                                     % (path, secs_to_timestr(timeout)))
+        self._wait_until([path], lambda exists: exists[0], timeout,
+                         lambda exists: "'%s' was not created" % path)
+        self._link("'%s' was created", path)
+
+    def wait_until_any_is_created(self, *paths, **configuration):
+        """Waits until any of the given files or directories is created.
+
+        Paths can be given as exact paths or as glob patterns similarly as
+        with `Wait Until Created`. The maximum time to wait can be given
+        using `timeout=<time>` syntax and it defaults to one minute.
+        The created path is returned.
+
+        Example:
+        | ${path} = | Wait Until Any Is Created | ${DIR}/done.txt | ${DIR}/failed.txt | timeout=30s |
+
+        New in Robot Framework 2.8.8.
+        """
+        paths, timeout = self._get_paths_and_timeout(paths, configuration)
+        exists = self._wait_until(paths, any, timeout,
+                                  lambda exists: 'None of the paths %s was '
+                                                 'created' % seq2str(paths))
+        path = paths[exists.index(True)]
         self._link("'%s' was created", path)
+        return path
+
+    def wait_until_all_are_created(self, *paths, **configuration):
+        """Waits until all the given files or directories are created.
+
+        Paths can be given as exact paths or as glob patterns similarly as
+        with `Wait Until Created`. The maximum time to wait can be given
+        using `timeout=<time>` syntax and it defaults to one minute.
+
+        Example:
+        | Wait Until All Are Created | ${DIR}/first.txt | ${DIR}/second.txt | timeout=2 min |
+
+        New in Robot Framework 2.8.8.
+        """
+        paths, timeout = self._get_paths_and_timeout(paths, configuration)
+        self._wait_until(paths, all, timeout,
+                         lambda exists: 'Paths %s were not created' % seq2str(
+                             [p for p, e in zip(paths, exists) if not e]))
+        self._link(self._paths_message('created', paths), *paths)
+
+    def wait_until_any_is_removed(self, *paths, **configuration):
+        """Waits until any of the given files or directories is removed.
+
+        Paths can be given as exact paths or as glob patterns similarly as
+        with `Wait Until Removed`. The maximum time to wait can be given
+        using `timeout=<time>` syntax and it defaults to one minute.
+        The removed path is returned.
+
+        New in Robot Framework 2.8.8.
+        """
+        paths, timeout = self._get_paths_and_timeout(paths, configuration)
+        exists = self._wait_until(paths, lambda exists: not all(exists),
+                                  timeout,
+                                  lambda exists: 'None of the paths %s was '
+                                                 'removed' % seq2str(paths))
+        path = paths[exists.index(False)]
+        self._link("'%s' was removed", path)
+        return path
+
+    def wait_until_all_are_removed(self, *paths, **configuration):
+        """Waits until all the given files or directories are removed.
+
+        Paths can be given as exact paths or as glob patterns similarly as
+        with `Wait Until Removed`. The maximum time to wait can be given
+        using `timeout=<time>` syntax and it defaults to one minute.
+
+        New in Robot Framework 2.8.8.
+        """
+        paths, timeout = self._get_paths_and_timeout(paths, configuration)
+        self._wait_until(paths, lambda exists: not any(exists), timeout,
+                         lambda exists: 'Paths %s were not removed' % seq2str(
+                             [p for p, e in zip(paths, exists) if e]))
+        self._link(self._paths_message('removed', paths), *paths)
+
+    def _get_paths_and_timeout(self, paths, configuration):
+        if not paths:
+            raise RuntimeError('At least one path must be given.')
+        timeout = configuration.pop('timeout', '1 minute')
+        if configuration:
+            raise RuntimeError('Unsupported configuration %s.'
+                               % seq2str(sorted(configuration)))
+        return [self._absnorm(p) for p in paths], timestr_to_secs(timeout)
+
+    def _paths_message(self, action, paths):
+        return 'Paths %s were %s' % (', '.join(["'%s'"] * len(paths)), action)
+
+    def _wait_until(self, paths, condition, timeout, error):
+        maxtime = time.time() + timeout
+        with _FileSystemWatcher(paths) as watcher:
+            while True:
+                exists = [bool(glob.glob(p)) for p in paths]
+                if condition(exists):
+                    return exists
+                remaining = maxtime - time.time()
+                if timeout >= 0 and remaining < 0:
+                    raise AssertionError('%s in %s' % (error(exists),
+                                                       secs_to_timestr(timeout)))
+                watcher.wait(remaining if timeout >= 0 else None)
 
     # Dir/file empty
 
@@ -1520,3 +1703,100 @@ class _Process2(_Process):
         if not self.closed:
             self.stdout.close()
             self.closed = True
+
+
+class _FileSystemWatcher(object):
+    """Waits for changes to files or directories matching given paths.
+
+    On Linux changes are noticed using inotify. Otherwise, and if watching
+    some of the parent directories fails, `wait` just sleeps a moment so
+    that callers end up polling. Also with inotify `wait` returns at least
+    once a second to protect against changes that cannot be noticed, for
+    example, because a watched directory was itself moved.
+    """
+    _poll_interval = 0.1
+    _max_wait = 1.0
+    # Values from <sys/inotify.h> and <fcntl.h>.
+    _in_moved_from, _in_moved_to, _in_create, _in_delete = 0x40, 0x80, 0x100, 0x200
+    _in_delete_self, _in_move_self = 0x400, 0x800
+    _in_q_overflow, _in_ignored = 0x4000, 0x8000
+    _in_nonblock, _in_cloexec = 0x800, 0x80000
+    _mask = (_in_moved_from | _in_moved_to | _in_create | _in_delete |
+             _in_delete_self | _in_move_self)
+    _self_events = _in_delete_self | _in_move_self | _in_q_overflow | _in_ignored
+    _event_header = struct.Struct('iIII')
+
+    def __init__(self, paths):
+        self._fd = None
+        self._patterns = {}
+        if sys.platform.startswith('linux'):
+            try:
+                self._watch(paths)
+            except (EnvironmentError, ImportError, AttributeError):
+                self.close()
+
+    def _watch(self, paths):
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6',
+                           use_errno=True)
+        self._fd = libc.inotify_init1(self._in_nonblock | self._in_cloexec)
+        if self._fd < 0:
+            self._fd = None
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        for path in paths:
+            parent, pattern = os.path.split(path)
+            if glob.has_magic(parent):
+                raise OSError('Cannot watch pattern %s' % parent)
+            wd = libc.inotify_add_watch(self._fd, parent.encode(
+                sys.getfilesystemencoding() or 'UTF-8'), self._mask)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), 'Watching %s failed' % parent)
+            self._patterns.setdefault(wd, []).append(pattern)
+
+    def wait(self, timeout=None):
+        if self._fd is None:
+            time.sleep(self._poll_interval if timeout is None
+                       else max(min(timeout, self._poll_interval), 0))
+            return
+        if timeout is None or timeout > self._max_wait:
+            timeout = self._max_wait
+        maxtime = time.time() + timeout
+        while True:
+            remaining = max(maxtime - time.time(), 0)
+            if not select.select([self._fd], [], [], remaining)[0]:
+                return
+            if self._read_events():
+                return
+
+    def _read_events(self):
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except OSError:
+            return True
+        matched = False
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = self._event_header.unpack_from(data, offset)
+            offset += self._event_header.size
+            name = data[offset:offset+length].rstrip('\0')
+            offset += length
+            if mask & self._self_events or self._matches(wd, name):
+                matched = True
+        return matched
+
+    def _matches(self, wd, name):
+        name = name.decode(sys.getfilesystemencoding() or 'UTF-8', 'replace')
+        return any(fnmatch.fnmatch(name, pattern)
+                   for pattern in self._patterns.get(wd, []))
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -12,10 +12,13 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from __future__ import with_statement
+
 import httplib
 import re
 import socket
 import sys
+import threading
 import time
 import xmlrpclib
 try:
@@ -25,7 +28,8 @@ except ImportError:   # No expat in IronPython 2.7
         pass
 
 from robot.errors import RemoteError
-from robot.utils import is_list_like, is_dict_like, timestr_to_secs, unic
+from robot.utils import (is_list_like, is_dict_like, NormalizedDict,
+                         timestr_to_secs, unic)
 
 
 IRONPYTHON = sys.platform == 'cli'
@@ -33,6 +37,18 @@ IRONPYTHON = sys.platform == 'cli'
 
 class Remote(object):
     ROBOT_LIBRARY_SCOPE = 'TEST SUITE'
+    _batch_keyword = 'Run Remote Keywords'
+    _batch_doc = """Runs the given remote keywords using one remote call.
+
+    Keywords and their arguments are given like with BuiltIn keyword
+    `Run Keywords`, separating keywords from each other with `AND`.
+    Only positional arguments are supported. Execution stops to the first
+    failing keyword, and the return values of all keywords are returned
+    as a list.
+
+    This keyword is available only if the remote server supports
+    executing keywords in batches.
+    """
 
     def __init__(self, uri='http://127.0.0.1:8270', timeout=None):
         """Connects to a remote server at ``uri``.
@@ -56,39 +72,152 @@ class Remote(object):
             timeout = timestr_to_secs(timeout)
         self._uri = uri
         self._client = XmlRpcRemoteClient(uri, timeout)
+        self._info = None
+        self._remote_names = None
 
     def get_keyword_names(self, attempts=2):
         for i in range(attempts):
             try:
-                return self._client.get_keyword_names()
+                return self._get_keyword_names()
             except TypeError, err:
                 time.sleep(i)
         raise RuntimeError('Connecting remote server at %s failed: %s'
                            % (self._uri, err))
 
+    def _get_keyword_names(self):
+        self._load_library_information()
+        names = self._get_remote_names().values()
+        if self._batching_enabled():
+            names.append(self._batch_keyword)
+        return names
+
+    def _load_library_information(self):
+        self._info = RemoteLibraryInformation(
+            self._client.get_library_information())
+        if self._info.supports('gzip'):
+            self._client.enable_compression()
+
+    def _get_library_information(self):
+        # Library instances used for running keywords are not necessarily
+        # the ones used for getting keyword names.
+        if self._info is None:
+            try:
+                self._load_library_information()
+            except TypeError:
+                self._info = RemoteLibraryInformation()
+        return self._info
+
+    def _get_remote_names(self):
+        if self._remote_names is None:
+            names = (self._get_library_information().keyword_names or
+                     self._client.get_keyword_names())
+            self._remote_names = NormalizedDict([(n, n) for n in names],
+                                                ignore=['_'])
+        return self._remote_names
+
+    def _batching_enabled(self):
+        return (self._get_library_information().supports('run_keywords') and
+                self._batch_keyword not in self._get_remote_names())
+
     def get_keyword_arguments(self, name):
+        if self._is_batch_keyword(name):
+            return ['*keywords']
+        args = self._get_library_information().get(name, 'args')
+        if args is not None:
+            return args
         try:
             return self._client.get_keyword_arguments(name)
         except TypeError:
             return ['*args']
 
     def get_keyword_documentation(self, name):
+        if self._is_batch_keyword(name):
+            return self._batch_doc
+        doc = self._get_library_information().get(name, 'doc')
+        if doc is not None:
+            return doc
         try:
             return self._client.get_keyword_documentation(name)
         except TypeError:
             return None
 
+    def _is_batch_keyword(self, name):
+        return name == self._batch_keyword and self._batching_enabled()
+
     def run_keyword(self, name, args, kwargs):
+        if self._is_batch_keyword(name):
+            return self._run_keywords(args)
+        self._get_library_information()
         coercer = ArgumentCoercer()
         args = coercer.coerce(args)
         kwargs = coercer.coerce(kwargs)
         result = RemoteResult(self._client.run_keyword(name, args, kwargs))
+        return self._handle_result(result)
+
+    def _handle_result(self, result):
         sys.stdout.write(result.output)
         if result.status != 'PASS':
             raise RemoteError(result.error, result.traceback, result.fatal,
                               result.continuable)
         return result.return_
 
+    def _run_keywords(self, args):
+        calls = [[self._get_remote_name(name), ArgumentCoercer().coerce(args)]
+                 for name, args in self._split_keywords(list(args))]
+        results = self._client.run_keywords(calls)
+        if not is_list_like(results) or len(results) > len(calls):
+            raise RuntimeError('Invalid remote result list: %s' % results)
+        return [self._handle_result(RemoteResult(result))
+                for result in results]
+
+    def _split_keywords(self, args):
+        while args:
+            if 'AND' in args:
+                index = args.index('AND')
+                keyword, args = args[:index], args[index+1:]
+            else:
+                keyword, args = args, []
+            if not keyword:
+                raise RuntimeError("Keyword name missing before or after "
+                                   "'AND'.")
+            yield keyword[0], keyword[1:]
+
+    def _get_remote_name(self, name):
+        try:
+            return self._get_remote_names()[name]
+        except KeyError:
+            raise RuntimeError("No remote keyword with name '%s' found."
+                               % name)
+
+
+class RemoteLibraryInformation(object):
+    """Optional information the server returns from `get_library_information`.
+
+    The information is a dictionary possibly containing `keywords` and
+    `capabilities` items. The former maps keyword names to dictionaries
+    containing `args` and `doc`, and the latter is a list of supported
+    protocol extensions such as `run_keywords` and `gzip`.
+    """
+
+    def __init__(self, info=None):
+        if not is_dict_like(info):
+            info = {}
+        self._keywords = info.get('keywords') or {}
+        self._capabilities = set(info.get('capabilities') or [])
+
+    @property
+    def keyword_names(self):
+        return [name for name in self._keywords if name[:2] != '__']
+
+    def supports(self, capability):
+        return capability in self._capabilities
+
+    def get(self, name, item):
+        keyword = self._keywords.get(name)
+        if is_dict_like(keyword):
+            return keyword.get(item)
+        return None
+
 
 class ArgumentCoercer(object):
     binary = re.compile('[\x00-\x08\x0B\x0C\x0E-\x1F]')
@@ -183,9 +312,20 @@ class RemoteResult(object):
 class XmlRpcRemoteClient(object):
 
     def __init__(self, uri, timeout=None):
-        transport = TimeoutTransport(timeout=timeout)
+        self._transport = TimeoutTransport(timeout=timeout)
         self._server = xmlrpclib.ServerProxy(uri, encoding='UTF-8',
-                                             transport=transport)
+                                             transport=self._transport)
+
+    def get_library_information(self):
+        try:
+            return self._server.get_library_information()
+        except xmlrpclib.Fault:
+            return None
+        except (socket.error, xmlrpclib.Error), err:
+            raise TypeError(err)
+
+    def enable_compression(self, threshold=1400):
+        self._transport.encode_threshold = threshold
 
     def get_keyword_names(self):
         try:
@@ -207,8 +347,14 @@ class XmlRpcRemoteClient(object):
 
     def run_keyword(self, name, args, kwargs):
         run_keyword_args = [name, args, kwargs] if kwargs else [name, args]
+        return self._run(self._server.run_keyword, *run_keyword_args)
+
+    def run_keywords(self, calls):
+        return self._run(self._server.run_keywords, calls)
+
+    def _run(self, method, *args):
         try:
-            return self._server.run_keyword(*run_keyword_args)
+            return method(*args)
         except xmlrpclib.Fault, err:
             message = err.faultString
         except socket.error, err:
@@ -221,11 +367,41 @@ class XmlRpcRemoteClient(object):
         raise RuntimeError(message)
 
 
+class ConnectionPool(object):
+    """Keeps idle HTTP connections so that they can be reused.
+
+    Connections are shared by all Remote library instances using the same
+    host and timeout, so keep-alive connections are not closed and opened
+    again between test suites.
+    """
+
+    def __init__(self, max_idle=4):
+        self._max_idle = max_idle
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, host, timeout):
+        with self._lock:
+            idle = self._idle.get((host, timeout))
+            if idle:
+                return idle.pop()
+        return httplib.HTTPConnection(host, timeout=timeout)
+
+    def release(self, host, timeout, connection):
+        with self._lock:
+            idle = self._idle.setdefault((host, timeout), [])
+            if len(idle) < self._max_idle:
+                idle.append(connection)
+                return
+        connection.close()
+
+
 # Custom XML-RPC timeouts based on
 # http://stackoverflow.com/questions/2425799/timeout-for-xmlrpclib-client-requests
 
 
 class TimeoutTransport(xmlrpclib.Transport):
+    _pool = ConnectionPool()
 
     def __init__(self, use_datetime=0, timeout=None):
         xmlrpclib.Transport.__init__(self, use_datetime)
@@ -233,17 +409,38 @@ class TimeoutTransport(xmlrpclib.Transport):
             timeout = socket._GLOBAL_DEFAULT_TIMEOUT
         self.timeout = timeout
 
+    def request(self, host, handler, request_body, verbose=0):
+        try:
+            result = xmlrpclib.Transport.request(self, host, handler,
+                                                 request_body, verbose)
+        except xmlrpclib.Fault:
+            self._release_connection()
+            raise
+        except:
+            self.close()
+            raise
+        self._release_connection()
+        return result
+
     def make_connection(self, host):
         if self._connection and host == self._connection[0]:
             return self._connection[1]
         chost, self._extra_headers, x509 = self.get_host_info(host)
-        self._connection = host, httplib.HTTPConnection(chost, timeout=self.timeout)
+        self._connection = host, self._pool.acquire(chost, self.timeout)
         return self._connection[1]
 
+    def _release_connection(self):
+        host, connection = self._connection
+        if connection:
+            chost = self.get_host_info(host)[0]
+            self._pool.release(chost, self.timeout, connection)
+        self._connection = (None, None)
+
 
 if sys.version_info[:2] == (2, 6):
 
     class TimeoutTransport(TimeoutTransport):
+        request = xmlrpclib.Transport.request
 
         def make_connection(self, host):
             host, extra_headers, x509 = self.get_host_info(host)
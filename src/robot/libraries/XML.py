@@ -15,6 +15,7 @@
 from __future__ import with_statement
 
 import copy
+import os
 import re
 
 try:
@@ -420,6 +421,9 @@ class XML(object):
         if use_lxml and not lxml_etree:
             logger.warn('XML library reverted to use standard ElementTree '
                         'because lxml module is not installed.')
+        self._finder = ElementFinder(self.etree, self.modern_etree,
+                                     self.lxml_etree)
+        self._cache = _DocumentCache()
 
     def parse_xml(self, source, keep_clark_notation=False):
         """Parses the given XML file or string into an element structure.
@@ -463,6 +467,40 @@ class XML(object):
                 self._preserve_tail(comment, parent)
                 parent.remove(comment)
 
+    def set_xml_cache_size(self, size):
+        """Sets how many parsed XML documents are cached and returns the old size.
+
+        Keywords that only read XML, such as `Get Element Text`, `Element
+        Should Exist` and `Element Attribute Should Be`, cache documents
+        parsed from files and strings. Files are parsed again if their
+        modification time or size changes. Keywords returning elements,
+        such as `Parse XML` and `Get Element`, and keywords modifying XML
+        always parse the source again, so cached documents are never
+        modified.
+
+        By default 5 documents are cached and the least recently used
+        document is discarded when the cache is full. Setting the size to
+        zero disables caching.
+
+        Examples:
+        | ${old} = | Set XML Cache Size | 20 |
+        | Set XML Cache Size | 0 | # Disable caching |
+
+        New in Robot Framework 2.8.8.
+        """
+        old = self._cache.size
+        self._cache.resize(int(size))
+        return old
+
+    def clear_xml_cache(self):
+        """Removes all parsed documents from the cache.
+
+        See `Set XML Cache Size` for more information about caching.
+
+        New in Robot Framework 2.8.8.
+        """
+        self._cache.clear()
+
     def get_element(self, source, xpath='.'):
         """Returns an element in the ``source`` matching the ``xpath``.
 
@@ -525,8 +563,21 @@ class XML(object):
         """
         if isinstance(source, basestring):
             source = self.parse_xml(source)
-        finder = ElementFinder(self.etree, self.modern_etree, self.lxml_etree)
-        return finder.find_all(source, xpath)
+        return self._finder.find_all(source, xpath)
+
+    def _get_element(self, source, xpath='.'):
+        # Like `get_element` but may return elements from a cached parse
+        # result. Must only be used when elements are not modified or
+        # returned to the caller.
+        elements = self._get_elements(source, xpath)
+        if len(elements) != 1:
+            self._raise_wrong_number_of_matches(len(elements), xpath)
+        return elements[0]
+
+    def _get_elements(self, source, xpath):
+        if isinstance(source, basestring):
+            source = self._cache.get(source, self.parse_xml)
+        return self._finder.find_all(source, xpath)
 
     def get_child_elements(self, source, xpath='.'):
         """Returns the child elements of the specified element as a list.
@@ -556,7 +607,7 @@ class XML(object):
 
         New in Robot Framework 2.7.5.
         """
-        count = len(self.get_elements(source, xpath))
+        count = len(self._get_elements(source, xpath))
         logger.info("%d element%s matched '%s'." % (count, s(count), xpath))
         return count
 
@@ -625,7 +676,7 @@ class XML(object):
         See also `Get Elements Texts`, `Element Text Should Be` and
         `Element Text Should Match`.
         """
-        element = self.get_element(source, xpath)
+        element = self._get_element(source, xpath)
         text = ''.join(self._yield_texts(element))
         if normalize_whitespace:
             text = self._normalize_whitespace(text)
@@ -661,7 +712,7 @@ class XML(object):
         | Should Be Equal  | @{texts}[1]        | ${EMPTY}  |             |
         """
         return [self.get_element_text(elem, normalize_whitespace=normalize_whitespace)
-                for elem in self.get_elements(source, xpath)]
+                for elem in self._get_elements(source, xpath)]
 
     def element_text_should_be(self, source, expected, xpath='.',
                                normalize_whitespace=False, message=None):
@@ -730,7 +781,7 @@ class XML(object):
         See also `Get Element Attributes`, `Element Attribute Should Be`,
         `Element Attribute Should Match` and `Element Should Not Have Attribute`.
         """
-        return self.get_element(source, xpath).get(name, default)
+        return self._get_element(source, xpath).get(name, default)
 
     def get_element_attributes(self, source, xpath='.'):
         """Returns all attributes of the specified element.
@@ -750,7 +801,7 @@ class XML(object):
 
         Use `Get Element Attribute` to get the value of a single attribute.
         """
-        return dict(self.get_element(source, xpath).attrib)
+        return dict(self._get_element(source, xpath).attrib)
 
     def element_attribute_should_be(self, source, name, expected, xpath='.',
                                     message=None):
@@ -886,7 +937,7 @@ class XML(object):
                           normalize_whitespace):
         normalizer = self._normalize_whitespace if normalize_whitespace else None
         comparator = ElementComparator(comparator, normalizer, exclude_children)
-        comparator.compare(self.get_element(source), self.get_element(expected))
+        comparator.compare(self._get_element(source), self._get_element(expected))
 
     def set_element_tag(self, source, tag, xpath='.'):
         """Sets the tag of the specified element.
@@ -1251,7 +1302,7 @@ class XML(object):
 
         New in Robot Framework 2.7.5.
         """
-        return copy.deepcopy(self.get_element(source, xpath))
+        return copy.deepcopy(self._get_element(source, xpath))
 
     def element_to_string(self, source, xpath='.'):
         """Returns the string representation of the specified element.
@@ -1265,7 +1316,7 @@ class XML(object):
 
         See also `Log Element` and `Save XML`.
         """
-        string = self.etree.tostring(self.get_element(source, xpath), encoding='UTF-8')
+        string = self.etree.tostring(self._get_element(source, xpath), encoding='UTF-8')
         return self._xml_declaration.sub('', string.decode('UTF-8')).strip()
 
     def log_element(self, source, level='INFO', xpath='.'):
@@ -1355,12 +1406,57 @@ class NameSpaceStripper(object):
             self.unstrip(child, ns)
 
 
+class _DocumentCache(object):
+
+    def __init__(self, size=5):
+        self.size = size
+        self._documents = {}
+        self._keys = []
+
+    def get(self, source, parse):
+        key = self._get_key(source)
+        if key is None:
+            return parse(source)
+        if key in self._documents:
+            self._keys.remove(key)
+        else:
+            self._documents[key] = parse(source)
+        self._keys.append(key)
+        self._discard_over_size()
+        return self._documents[key]
+
+    def _get_key(self, source):
+        if not self.size:
+            return None
+        if source.lstrip().startswith('<'):
+            return source
+        try:
+            stat = os.stat(source)
+        except OSError:
+            return None
+        return os.path.abspath(source), stat.st_mtime, stat.st_size
+
+    def resize(self, size):
+        self.size = max(size, 0)
+        self._discard_over_size()
+
+    def clear(self):
+        self._documents.clear()
+        self._keys = []
+
+    def _discard_over_size(self):
+        while len(self._keys) > self.size:
+            del self._documents[self._keys.pop(0)]
+
+
 class ElementFinder(object):
+    _max_compiled_xpaths = 1000
 
     def __init__(self, etree, modern=True, lxml=False):
         self.etree = etree
         self.modern = modern
         self.lxml = lxml
+        self._compiled_xpaths = {}
 
     def find_all(self, elem, xpath):
         xpath = self._get_xpath(xpath)
@@ -1368,8 +1464,14 @@ class ElementFinder(object):
             return [elem]
         if not self.lxml:
             return elem.findall(xpath)
-        finder = self.etree.ETXPath(xpath)
-        return finder(elem)
+        return self._get_compiled_xpath(xpath)(elem)
+
+    def _get_compiled_xpath(self, xpath):
+        if xpath not in self._compiled_xpaths:
+            if len(self._compiled_xpaths) >= self._max_compiled_xpaths:
+                self._compiled_xpaths.clear()
+            self._compiled_xpaths[xpath] = self.etree.ETXPath(xpath)
+        return self._compiled_xpaths[xpath]
 
     def _get_xpath(self, xpath):
         if not xpath:
@@ -12,7 +12,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from robot.utils import Matcher, NormalizedDict, setter
+import re
+
+from robot.utils import NormalizedDict, normalize, setter
 
 
 class Tags(object):
@@ -22,6 +24,7 @@ class Tags(object):
 
     @setter
     def _tags(self, tags):
+        self._normalized = None
         if not tags:
             return ()
         if isinstance(tags, basestring):
@@ -35,6 +38,11 @@ class Tags(object):
                 normalized.pop(removed)
         return tuple(normalized)
 
+    def _get_normalized(self):
+        if self._normalized is None:
+            self._normalized = frozenset(_normalize(t) for t in self._tags)
+        return self._normalized
+
     def add(self, tags):
         self._tags = tuple(self) + tuple(Tags(tags))
 
@@ -71,14 +79,27 @@ class Tags(object):
         return Tags(tuple(self) + tuple(Tags(other)))
 
 
+def _normalize(tag):
+    return normalize(tag, ignore='_')
+
+
+def _get_normalized_tags(tags):
+    if isinstance(tags, Tags):
+        return tags._get_normalized()
+    if isinstance(tags, basestring):
+        tag = _normalize(tags)
+        return frozenset([tag]) if tag not in ('', 'none') else frozenset()
+    return Tags(tags)._get_normalized()
+
+
 class TagPatterns(object):
 
     def __init__(self, patterns):
         self._patterns = tuple(TagPattern(p) for p in Tags(patterns))
+        self._matcher = _AnyTagPattern(self._patterns)
 
     def match(self, tags):
-        tags = tags if isinstance(tags, Tags) else Tags(tags)
-        return any(p.match(tags) for p in self._patterns)
+        return self._matcher.match(_get_normalized_tags(tags))
 
     def __contains__(self, tag):
         return self.match(tag)
@@ -103,34 +124,88 @@ def TagPattern(pattern):
     return _SingleTagPattern(pattern)
 
 
+# Patterns below match against frozensets of normalized tags. Patterns
+# without wildcards are matched using set operations and wildcard patterns
+# combined with OR are merged into one regular expression.
+
+_WILDCARDS = re.compile(r'(\*|\?)')
+
+
 class _SingleTagPattern(object):
 
     def __init__(self, pattern):
-        self._matcher = Matcher(pattern, ignore='_')
+        self._pattern = pattern
+        self.normalized = _normalize(pattern)
+        self.is_exact = not _WILDCARDS.search(self.normalized)
+        self._regexp = None if self.is_exact else _compile([self.normalized])
 
     def match(self, tags):
-        return self._matcher.match_any(tags)
+        if self.is_exact:
+            return self.normalized in tags
+        return _match_any_tag(self._regexp, tags)
 
     def __unicode__(self):
-        return self._matcher.pattern
+        return self._pattern
 
 
-class _AndTagPattern(object):
+def _compile(patterns):
+    regexps = [''.join('.*' if token == '*' else '.' if token == '?'
+                       else re.escape(token)
+                       for token in _WILDCARDS.split(pattern))
+               for pattern in patterns]
+    return re.compile('^(?:%s)$' % '|'.join(regexps), re.DOTALL)
+
+
+def _match_any_tag(regexp, tags):
+    for tag in tags:
+        if regexp.match(tag):
+            return True
+    return False
+
+
+def _group_patterns(patterns):
+    exact, wildcard, other = [], [], []
+    for pattern in patterns:
+        if not isinstance(pattern, _SingleTagPattern):
+            other.append(pattern)
+        elif pattern.is_exact:
+            exact.append(pattern.normalized)
+        else:
+            wildcard.append(pattern)
+    return frozenset(exact), tuple(wildcard), tuple(other)
+
+
+class _AnyTagPattern(object):
 
     def __init__(self, patterns):
-        self._patterns = tuple(TagPattern(p) for p in patterns)
+        self._exact, wildcard, self._other = _group_patterns(patterns)
+        self._regexp = _compile(p.normalized for p in wildcard) \
+            if wildcard else None
 
     def match(self, tags):
-        return all(p.match(tags) for p in self._patterns)
+        if not self._exact.isdisjoint(tags):
+            return True
+        if self._regexp and _match_any_tag(self._regexp, tags):
+            return True
+        return any(p.match(tags) for p in self._other)
 
 
-class _OrTagPattern(object):
+class _AndTagPattern(object):
 
     def __init__(self, patterns):
-        self._patterns = tuple(TagPattern(p) for p in patterns)
+        patterns = [TagPattern(p) for p in patterns]
+        self._exact, self._wildcard, self._other = _group_patterns(patterns)
 
     def match(self, tags):
-        return any(p.match(tags) for p in self._patterns)
+        return (self._exact.issubset(tags) and
+                all(p.match(tags) for p in self._wildcard) and
+                all(p.match(tags) for p in self._other))
+
+
+class _OrTagPattern(_AnyTagPattern):
+
+    def __init__(self, patterns):
+        _AnyTagPattern.__init__(self, [TagPattern(p) for p in patterns])
 
 
 class _NotTagPattern(object):
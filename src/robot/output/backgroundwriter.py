@@ -0,0 +1,155 @@
+#  Copyright 2008-2014 Nokia Solutions and Networks
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import atexit
+import os
+import Queue
+import threading
+
+from robot.utils import XmlWriter
+
+
+class BackgroundXmlWriter(XmlWriter):
+    """XmlWriter that writes to a file in a background thread.
+
+    Elements are serialized in the calling thread and only the resulting
+    text is handed to the writer thread, so the element order is the same
+    as with the normal writer. Each method call produces complete markup,
+    and open elements are tracked, so that the file can be closed to a
+    well-formed state even if execution is aborted.
+    """
+
+    def __init__(self, output, line_separator='\n', encoding='UTF-8'):
+        XmlWriter.__init__(self, BackgroundOutput(output), line_separator,
+                           encoding)
+        self._open_elements = []
+        self.output.commit()
+        atexit.register(self._close_if_aborted)
+
+    def start(self, name, attrs=None, newline=True):
+        XmlWriter.start(self, name, attrs, newline)
+        self._open_elements.append(name)
+        self.output.commit()
+
+    def content(self, content=None, escape=True, newline=False,
+                replace_newlines=False):
+        XmlWriter.content(self, content, escape, newline, replace_newlines)
+        self.output.commit()
+
+    def end(self, name, newline=True):
+        XmlWriter.end(self, name, newline)
+        self._open_elements.pop()
+        self.output.commit()
+
+    def element(self, name, content=None, attrs=None, escape=True,
+                newline=True, replace_newlines=False):
+        XmlWriter.start(self, name, attrs, newline=False)
+        XmlWriter.content(self, content, escape, replace_newlines)
+        XmlWriter.end(self, name, newline)
+        self.output.commit()
+
+    def sync(self):
+        """Makes sure everything written so far ends up on the disk."""
+        self.output.sync()
+
+    def _close_if_aborted(self):
+        if self.output.closed:
+            return
+        self.output.discard_uncommitted()
+        while self._open_elements:
+            self.end(self._open_elements[-1])
+        self.close()
+
+
+class BackgroundOutput(object):
+    """File like object passing written data to a dedicated writer thread.
+
+    `output` can be a path or an already opened file. Paths are opened
+    using a large buffer.
+
+    Written data is collected into chunks of about `chunk_size` bytes and
+    at most `max_chunks` chunks are queued. If the writer thread cannot keep
+    up, writing blocks until there is room in the queue. Data is made
+    visible to the writer thread only when it is committed.
+    """
+    _sync = object()
+
+    def __init__(self, output, chunk_size=64 * 1024, max_chunks=64,
+                 buffering=1024 * 1024):
+        if isinstance(output, basestring):
+            output = open(output, 'w', buffering)
+        self._file = output
+        self._chunk_size = chunk_size
+        self._queue = Queue.Queue(max_chunks)
+        self._uncommitted = []
+        self._chunk = []
+        self._chunk_length = 0
+        self._error = None
+        self._thread = threading.Thread(target=self._run,
+                                        name='Output writer')
+        self._thread.setDaemon(True)
+        self._thread.start()
+        self.closed = False
+
+    def write(self, data):
+        self._uncommitted.append(data)
+
+    def commit(self):
+        for data in self._uncommitted:
+            self._chunk.append(data)
+            self._chunk_length += len(data)
+        self._uncommitted = []
+        if self._chunk_length >= self._chunk_size:
+            self._put_chunk()
+
+    def discard_uncommitted(self):
+        self._uncommitted = []
+
+    def sync(self):
+        self._put_chunk()
+        self._queue.put(self._sync)
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.commit()
+        self._put_chunk()
+        self._queue.put(None)
+        self._thread.join()
+        self._file.close()
+        if self._error:
+            raise self._error
+
+    def _put_chunk(self):
+        if self._chunk:
+            self._queue.put(''.join(self._chunk))
+            self._chunk = []
+            self._chunk_length = 0
+
+    def _run(self):
+        while True:
+            data = self._queue.get()
+            if data is None:
+                return
+            if self._error:
+                continue
+            try:
+                if data is self._sync:
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+                else:
+                    self._file.write(data)
+            except EnvironmentError, err:
+                self._error = err
@@ -43,6 +43,10 @@ class _DebugFileWriter:
         self._outfile = outfile
         self._is_logged = IsLogged('DEBUG')
 
+    @property
+    def min_level(self):
+        return self._is_logged.level
+
     def start_suite(self, suite):
         self._separator('SUITE')
         self._start('SUITE', suite.longname)
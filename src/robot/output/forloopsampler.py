@@ -0,0 +1,184 @@
+#  Copyright 2008-2014 Nokia Solutions and Networks
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import copy
+from collections import deque
+
+from robot.errors import DataError
+from robot.utils import (elapsed_time_to_string, get_elapsed_time,
+                         plural_or_not)
+
+from .loggerhelper import IsLogged, Message
+from .recorder import OutputRecorder
+
+
+def parse_sample_for_loops(value):
+    """Parses `--sampleforloops` value `N` or `FIRST:LAST` to a tuple."""
+    try:
+        first, last = value.split(':') if ':' in value else (value, value)
+        first, last = int(first), int(last)
+        if first < 0 or last < 0:
+            raise ValueError
+    except ValueError:
+        raise DataError("Expected a non-negative number of iterations or "
+                        "two such numbers separated with a colon but got "
+                        "'%s'." % value)
+    return first, last
+
+
+class ForLoopSampler(object):
+    """Writes only a sample of FOR loop iterations to the wrapped logger.
+
+    The first `first` and the last `last` iterations of each loop are
+    written, as well as all iterations that fail or contain warnings.
+    Consecutive iterations between them are replaced with one summary
+    iteration containing their count and timing information.
+
+    Iterations after the first ones are recorded while they run, and at most
+    `last` passed iterations are kept in memory. Thus the output size and
+    the memory usage do not depend on the number of iterations.
+    """
+    _message = '%d passing iteration%s removed using --SampleForLoops option.'
+
+    def __init__(self, logger, first, last, log_level='TRACE'):
+        self._logger = logger
+        self._first = first
+        self._last = last
+        self._is_logged = IsLogged(log_level)
+        self._target = logger
+        self._loops = []
+
+    def set_log_level(self, level):
+        self._is_logged.set_level(level)
+        return self._logger.set_log_level(level)
+
+    def start_keyword(self, kw):
+        if kw.type == 'foritem' and self._loops:
+            self._target = self._loops[-1].start_iteration()
+        self._target.start_keyword(kw)
+        if kw.type == 'for':
+            self._loops.append(_SampledLoop(self._target, self._first,
+                                            self._last, self._message))
+
+    def end_keyword(self, kw):
+        if kw.type == 'for' and self._loops:
+            self._loops.pop().end()
+        self._target.end_keyword(kw)
+        if kw.type == 'foritem' and self._loops:
+            self._target = self._loops[-1].end_iteration(kw)
+
+    def log_message(self, msg):
+        if self._is_logged(msg.level):
+            self._target.log_message(msg)
+
+    def __getattr__(self, name):
+        return getattr(self._logger, name)
+
+
+class _SampledLoop(object):
+
+    def __init__(self, target, first, last, message):
+        self._target = target
+        self._first = first
+        self._last = last
+        self._message = message
+        self._started = 0
+        self._recorded = deque()
+        self._removed = None
+        self._recorder = None
+
+    def start_iteration(self):
+        self._started += 1
+        if self._started <= self._first:
+            self._recorder = None
+            return self._target
+        self._recorder = OutputRecorder()
+        return self._recorder
+
+    def end_iteration(self, kw):
+        recorder = self._recorder
+        if recorder:
+            if kw.status != 'PASS' or recorder.has_warnings:
+                self._flush()
+                recorder.replay(self._target)
+            else:
+                self._recorded.append((recorder, copy.copy(kw)))
+                if len(self._recorded) > self._last:
+                    self._remove(self._recorded.popleft()[1])
+        self._recorder = None
+        return self._target
+
+    def end(self):
+        self._flush()
+
+    def _remove(self, kw):
+        if not self._removed:
+            self._removed = _RemovedIterations(self._message)
+        self._removed.add(kw)
+
+    def _flush(self):
+        if self._removed:
+            self._removed.write_summary(self._target)
+            self._removed = None
+        while self._recorded:
+            self._recorded.popleft()[0].replay(self._target)
+
+
+class _RemovedIterations(object):
+
+    def __init__(self, message):
+        self._message = message
+        self._count = 0
+        self._starttime = None
+        self._endtime = None
+        self._total = 0
+        self._longest = 0
+
+    def add(self, kw):
+        elapsed = get_elapsed_time(kw.starttime, kw.endtime)
+        self._count += 1
+        self._starttime = self._starttime or kw.starttime
+        self._endtime = kw.endtime
+        self._total += elapsed
+        self._longest = max(self._longest, elapsed)
+
+    def write_summary(self, target):
+        count = self._count
+        summary = _SummaryIteration(
+            '%d iteration%s' % (count, plural_or_not(count)),
+            '_%s_' % (self._message % (count, plural_or_not(count))),
+            self._starttime, self._endtime)
+        target.start_keyword(summary)
+        target.log_message(Message(
+            'Elapsed time: total %s, average %s, longest %s.'
+            % (elapsed_time_to_string(self._total),
+               elapsed_time_to_string(self._total / count),
+               elapsed_time_to_string(self._longest)),
+            timestamp=self._endtime))
+        target.end_keyword(summary)
+
+
+class _SummaryIteration(object):
+    type = 'foritem'
+    status = 'PASS'
+    args = ()
+    timeout = ''
+    message = ''
+
+    def __init__(self, name, doc, starttime, endtime):
+        self.name = name
+        self.doc = doc
+        self.starttime = starttime
+        self.endtime = endtime
+
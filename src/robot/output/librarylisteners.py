@@ -22,23 +22,31 @@ class LibraryListeners(Listeners):
         self._running_test = False
         self._setup_or_teardown_type = None
         self._global_listeners = {}
+        self._listeners_used = False
 
     def __nonzero__(self):
         return True
 
-    def _notify_end_test(self, listener, test):
-        Listeners._notify_end_test(self, listener, test)
+    @property
+    def min_level(self):
+        # Libraries in use change between suites. Once libraries with
+        # listeners have been used, messages are always passed on.
+        if self._listeners:
+            self._listeners_used = True
+        return 'TRACE' if self._listeners_used else 'NONE'
+
+    def _notify_end_test(self, listener, test, attrs):
+        Listeners._notify_end_test(self, listener, test, attrs)
         if listener.library_scope == 'TESTCASE':
             listener.call_method(listener.close)
 
-    def _notify_end_suite(self, listener, suite):
-        Listeners._notify_end_suite(self, listener, suite)
+    def _notify_end_suite(self, listener, suite, attrs):
+        Listeners._notify_end_suite(self, listener, suite, attrs)
         if listener.library_scope == 'TESTSUITE':
             listener.call_method(listener.close)
 
     def end_suite(self, suite):
-        for listener in self._listeners:
-            self._notify_end_suite(listener, suite)
+        self._end_suite(suite)
         if not suite.parent:
             for listener in self._global_listeners.values():
                 listener.call_method(listener.close)
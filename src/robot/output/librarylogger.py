@@ -31,12 +31,17 @@ LOGGING_THREADS = ('MainThread', 'RobotFrameworkTimeoutThread')
 
 
 def write(msg, level, html=False):
+    if not LOGGER.is_logged(level):
+        return
     # Callable messages allow lazy logging internally, but we don't want to
     # expose this functionality publicly. See the following issue for details:
     # http://code.google.com/p/robotframework/issues/detail?id=1505
     if callable(msg):
         msg = unic(msg)
-    if threading.currentThread().getName() in LOGGING_THREADS:
+    logger = LOGGER.thread_logger
+    if logger:
+        logger.message(Message(msg, level, html))
+    elif threading.currentThread().getName() in LOGGING_THREADS:
         LOGGER.log_message(Message(msg, level, html))
 
 
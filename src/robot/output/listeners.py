@@ -14,6 +14,9 @@
 
 import inspect
 import os.path
+import Queue
+import threading
+from collections import deque
 
 from robot import utils
 from robot.errors import DataError
@@ -56,6 +59,7 @@ class Listeners(object):
     _start_attrs = ('id', 'doc', 'starttime', 'longname')
     _end_attrs = _start_attrs + ('endtime', 'elapsedtime', 'status', 'message')
     _kw_extra_attrs = ('args', '-id', '-longname', '-message')
+    _attr_names = {}
 
     def __init__(self, listeners):
         self._listeners = self._import_listeners(listeners)
@@ -65,6 +69,13 @@ class Listeners(object):
     def __nonzero__(self):
         return bool(self._listeners)
 
+    @property
+    def min_level(self):
+        # Messages are passed to listeners regardless their level.
+        if any(listener.version == 2 for listener in self._listeners):
+            return 'TRACE'
+        return 'NONE'
+
     def _import_listeners(self, listener_data):
         listeners = []
         for name, args in listener_data:
@@ -78,14 +89,23 @@ class Listeners(object):
         return listeners
 
     def start_suite(self, suite):
-        for listener in self._listeners:
+        listeners = self._listeners
+        attrs = self._get_start_suite_attrs(suite) \
+            if self._has_version_2(listeners) else None
+        for listener in listeners:
             if listener.version == 1:
                 listener.call_method(listener.start_suite, suite.name, suite.doc)
             else:
-                attrs = self._get_start_attrs(suite, 'metadata')
-                attrs.update(self._get_suite_attrs(suite))
                 listener.call_method(listener.start_suite, suite.name, attrs)
 
+    def _has_version_2(self, listeners):
+        return any(listener.version == 2 for listener in listeners)
+
+    def _get_start_suite_attrs(self, suite):
+        attrs = self._get_start_attrs(suite, 'metadata')
+        attrs.update(self._get_suite_attrs(suite))
+        return attrs
+
     def _get_suite_attrs(self, suite):
         return {
             'tests' : [t.name for t in suite.tests],
@@ -95,63 +115,91 @@ class Listeners(object):
         }
 
     def end_suite(self, suite):
-        for listener in self._listeners:
-            self._notify_end_suite(listener, suite)
-
-    def _notify_end_suite(self, listener, suite):
+        self._end_suite(suite)
+
+    def _end_suite(self, suite):
+        listeners = self._listeners
+        attrs = self._get_end_suite_attrs(suite) \
+            if self._has_version_2(listeners) else None
+        for listener in listeners:
+            self._notify_end_suite(listener, suite, attrs)
+
+    def _get_end_suite_attrs(self, suite):
+        attrs = self._get_end_attrs(suite, 'metadata')
+        attrs['statistics'] = suite.stat_message
+        attrs.update(self._get_suite_attrs(suite))
+        return attrs
+
+    def _notify_end_suite(self, listener, suite, attrs):
         if listener.version == 1:
             listener.call_method(listener.end_suite, suite.status,
                            suite.full_message)
         else:
-            attrs = self._get_end_attrs(suite, 'metadata')
-            attrs['statistics'] = suite.stat_message
-            attrs.update(self._get_suite_attrs(suite))
             listener.call_method(listener.end_suite, suite.name, attrs)
 
     def start_test(self, test):
         self._running_test = True
-        for listener in self._listeners:
+        listeners = self._listeners
+        attrs = self._get_test_attrs(test, start=True) \
+            if self._has_version_2(listeners) else None
+        for listener in listeners:
             if listener.version == 1:
                 listener.call_method(listener.start_test, test.name, test.doc,
                                      list(test.tags))
             else:
-                attrs = self._get_start_attrs(test, 'tags')
-                attrs['critical'] = 'yes' if test.critical else 'no'
-                attrs['template'] = test.template or ''
                 listener.call_method(listener.start_test, test.name, attrs)
 
+    def _get_test_attrs(self, test, start):
+        if start:
+            attrs = self._get_start_attrs(test, 'tags')
+        else:
+            attrs = self._get_end_attrs(test, 'tags')
+        attrs['critical'] = 'yes' if test.critical else 'no'
+        attrs['template'] = test.template or ''
+        return attrs
+
     def end_test(self, test):
         self._running_test = False
-        for listener in self._listeners:
-            self._notify_end_test(listener, test)
+        listeners = self._listeners
+        attrs = self._get_test_attrs(test, start=False) \
+            if self._has_version_2(listeners) else None
+        for listener in listeners:
+            self._notify_end_test(listener, test, attrs)
 
-    def _notify_end_test(self, listener, test):
+    def _notify_end_test(self, listener, test, attrs):
         if listener.version == 1:
             listener.call_method(listener.end_test, test.status, test.message)
         else:
-            attrs = self._get_end_attrs(test, 'tags')
-            attrs['critical'] = 'yes' if test.critical else 'no'
-            attrs['template'] = test.template or ''
             listener.call_method(listener.end_test, test.name, attrs)
 
     def start_keyword(self, kw):
-        for listener in self._listeners:
+        listeners = self._listeners
+        attrs = self._get_keyword_attrs(kw, start=True) \
+            if self._has_version_2(listeners) else None
+        for listener in listeners:
             if listener.version == 1:
                 listener.call_method(listener.start_keyword, kw.name, kw.args)
             else:
-                attrs = self._get_start_attrs(kw, *self._kw_extra_attrs)
-                attrs['type'] = self._get_keyword_type(kw, start=True)
                 listener.call_method(listener.start_keyword, kw.name, attrs)
 
     def end_keyword(self, kw):
-        for listener in self._listeners:
+        listeners = self._listeners
+        attrs = self._get_keyword_attrs(kw, start=False) \
+            if self._has_version_2(listeners) else None
+        for listener in listeners:
             if listener.version == 1:
                 listener.call_method(listener.end_keyword, kw.status)
             else:
-                attrs = self._get_end_attrs(kw, *self._kw_extra_attrs)
-                attrs['type'] = self._get_keyword_type(kw, start=False)
                 listener.call_method(listener.end_keyword, kw.name, attrs)
 
+    def _get_keyword_attrs(self, kw, start):
+        if start:
+            attrs = self._get_start_attrs(kw, *self._kw_extra_attrs)
+        else:
+            attrs = self._get_end_attrs(kw, *self._kw_extra_attrs)
+        attrs['type'] = self._get_keyword_type(kw, start)
+        return attrs
+
     def _get_keyword_type(self, kw, start=True):
         # When running setup or teardown, only the top level keyword has type
         # set to setup/teardown but we want to pass that type also to all
@@ -167,14 +215,17 @@ class Listeners(object):
                           kw.type.title())
 
     def log_message(self, msg):
-        for listener in self._listeners:
-            if listener.version == 2:
-                listener.call_method(listener.log_message, self._create_msg_dict(msg))
+        self._notify_message('log_message', msg)
 
     def message(self, msg):
+        self._notify_message('message', msg)
+
+    def _notify_message(self, method, msg):
+        attrs = None
         for listener in self._listeners:
             if listener.version == 2:
-                listener.call_method(listener.message, self._create_msg_dict(msg))
+                attrs = attrs or self._create_msg_dict(msg)
+                listener.call_method(getattr(listener, method), attrs)
 
     def _create_msg_dict(self, msg):
         return {'timestamp': msg.timestamp, 'message': msg.message,
@@ -187,6 +238,7 @@ class Listeners(object):
     def close(self):
         for listener in self._listeners:
             listener.call_method(listener.close)
+            listener.wait_until_done()
 
     def _get_start_attrs(self, item, *extra):
         return self._get_attrs(item, self._start_attrs, extra)
@@ -199,13 +251,16 @@ class Listeners(object):
         return dict((n, self._get_attr_value(item, n)) for n in names)
 
     def _get_attr_names(self, default, extra):
-        names = list(default)
-        for name in extra:
-            if not name.startswith('-'):
-                names.append(name)
-            elif name[1:] in names:
-                names.remove(name[1:])
-        return names
+        key = (default, extra)
+        if key not in self._attr_names:
+            names = list(default)
+            for name in extra:
+                if not name.startswith('-'):
+                    names.append(name)
+                elif name[1:] in names:
+                    names.remove(name[1:])
+            self._attr_names[key] = tuple(names)
+        return self._attr_names[key]
 
     def _get_attr_value(self, item, name):
         value = getattr(item, name)
@@ -223,7 +278,8 @@ class ListenerProxy(AbstractLoggerProxy):
     _methods = ['start_suite', 'end_suite', 'start_test', 'end_test',
                 'start_keyword', 'end_keyword', 'log_message', 'message',
                 'output_file', 'report_file', 'log_file', 'debug_file',
-                'xunit_file', 'close']
+                'xunit_file', 'profile_file', 'close']
+    _async_caller = None
 
     def __init__(self, name, args):
         listener = self._import_listener(name, args)
@@ -231,6 +287,8 @@ class ListenerProxy(AbstractLoggerProxy):
         self.name = name
         self.version = self._get_version(listener)
         self.is_java = self._is_java(listener)
+        if self.version == 2 and self._is_async(listener):
+            self._async_caller = _AsyncCaller(self._call_method, name)
 
     def _is_java(self, listener):
         return utils.is_jython and isinstance(listener, Object)
@@ -246,16 +304,38 @@ class ListenerProxy(AbstractLoggerProxy):
         except ValueError:
             return 1
 
+    def _is_async(self, listener):
+        return bool(getattr(listener, 'ROBOT_LISTENER_ASYNC', False))
+
     def call_method(self, method, *args):
+        if self._async_caller:
+            self._report_failures(self._async_caller.pop_failures())
+            self._async_caller.call(method, args)
+        else:
+            self._report_failures([self._call_method(method, args)])
+
+    def wait_until_done(self):
+        """Waits until all queued calls to an asynchronous listener are done."""
+        if self._async_caller:
+            self._async_caller.stop()
+            self._report_failures(self._async_caller.pop_failures())
+
+    def _call_method(self, method, args):
         if self.is_java:
             args = [self._to_map(a) if isinstance(a, dict) else a for a in args]
         try:
             method(*args)
         except:
             message, details = utils.get_error_details()
-            LOGGER.error("Calling listener method '%s' of listener '%s' failed: %s"
-                     % (method.__name__, self.name, message))
-            LOGGER.info("Details:\n%s" % details)
+            return method.__name__, message, details
+
+    def _report_failures(self, failures):
+        for failure in failures:
+            if failure:
+                name, message, details = failure
+                LOGGER.error("Calling listener method '%s' of listener '%s' "
+                             "failed: %s" % (name, self.name, message))
+                LOGGER.info("Details:\n%s" % details)
 
     def _to_map(self, dictionary):
         map = HashMap()
@@ -264,6 +344,47 @@ class ListenerProxy(AbstractLoggerProxy):
         return map
 
 
+class _AsyncCaller(object):
+    """Calls listener methods in a dedicated thread.
+
+    At most `buffer_size` calls are queued and adding more blocks until
+    the listener has caught up. Failures are collected and must be
+    reported in the main thread because logging is not thread-safe.
+    """
+
+    def __init__(self, call, name, buffer_size=1000):
+        self._call = call
+        self._queue = Queue.Queue(buffer_size)
+        self._failures = deque()
+        self._thread = threading.Thread(target=self._run,
+                                        name='Listener %s' % name)
+        self._thread.setDaemon(True)
+        self._thread.start()
+
+    def call(self, method, args):
+        self._queue.put((method, args))
+
+    def stop(self):
+        if self._thread.isAlive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def pop_failures(self):
+        failures = []
+        while self._failures:
+            failures.append(self._failures.popleft())
+        return failures
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            failure = self._call(*item)
+            if failure:
+                self._failures.append(failure)
+
+
 # TODO: Remove in 2.9, left here in 2.8.5 for backwards compatibility.
 # Consider also decoupling importing from __init__ to ease extending.
 _ListenerProxy = ListenerProxy
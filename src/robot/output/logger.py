@@ -13,11 +13,12 @@
 #  limitations under the License.
 
 import os
+from thread import get_ident
 
 from robot.errors import DataError
 
 from .filelogger import FileLogger
-from .loggerhelper import AbstractLogger, AbstractLoggerProxy
+from .loggerhelper import AbstractLogger, AbstractLoggerProxy, LEVELS
 from .monitor import CommandLineMonitor
 from .stdoutlogsplitter import StdoutLogSplitter
 
@@ -32,16 +33,23 @@ class Logger(AbstractLogger):
     Tools using Robot Framework's internal modules should register their own
     loggers at least to get notifications about errors and warnings. A shortcut
     to get errors/warnings into console is using 'register_console_logger'.
+
+    Messages below the lowest level that any registered logger is interested
+    in are ignored already before they are created. Loggers tell their level
+    using an optional 'min_level' attribute and 'update_min_level' must be
+    called if it changes.
     """
 
     def __init__(self, register_console_logger=True):
         self._loggers = LoggerCollection()
+        self._min_level = LEVELS['TRACE']
         self._message_cache = []
         self._console_logger = None
         self._started_keywords = 0
         self._error_occurred = False
         self._error_listener = None
         self._prev_log_message_handlers = []
+        self._thread_loggers = {}
         if register_console_logger:
             self.register_console_logger()
 
@@ -52,10 +60,12 @@ class Logger(AbstractLogger):
         for log in loggers:
             logger = self._loggers.register_regular_logger(log)
             self._relay_cached_messages_to(logger)
+        self.update_min_level()
 
     def register_context_changing_logger(self, logger):
         log = self._loggers.register_context_changing_logger(logger)
         self._relay_cached_messages_to(log)
+        self.update_min_level()
 
     def _relay_cached_messages_to(self, logger):
         if self._message_cache:
@@ -65,6 +75,28 @@ class Logger(AbstractLogger):
     def unregister_logger(self, *loggers):
         for log in loggers:
             self._loggers.unregister_logger(log)
+        self.update_min_level()
+
+    def update_min_level(self):
+        """Updates the level below which messages are ignored.
+
+        Warnings and errors are never ignored because they are also used
+        for other purposes than logging.
+        """
+        levels = [LEVELS[logger.min_level] for logger in self._loggers]
+        self._min_level = min(levels + [LEVELS['WARN']])
+
+    def is_logged(self, level):
+        """Returns False if no logger is interested in messages with `level`.
+
+        All messages are considered logged as long as they are cached.
+        """
+        if self._message_cache is not None:
+            return True
+        try:
+            return LEVELS[level.upper()] >= self._min_level
+        except KeyError:    # HTML and invalid levels are handled by Message
+            return True
 
     def register_console_logger(self, width=78, colors='AUTO', markers='AUTO',
                                 stdout=None, stderr=None):
@@ -73,6 +105,7 @@ class Logger(AbstractLogger):
             self._loggers.unregister_logger(self._console_logger)
         self._console_logger = logger
         self._loggers.register_regular_logger(logger)
+        self.update_min_level()
 
     def unregister_console_logger(self):
         if not self._console_logger:
@@ -80,6 +113,7 @@ class Logger(AbstractLogger):
         logger = self._console_logger
         self._loggers.unregister_logger(logger)
         self._console_logger = None
+        self.update_min_level()
         return logger
 
     # TODO: Remove in RF 2.9. Not used outside utests since 2.8.4 but may
@@ -104,6 +138,28 @@ class Logger(AbstractLogger):
         if self._error_occurred:
             listener()
 
+    @property
+    def thread_logger(self):
+        """Logger registered for the current thread or `None`."""
+        if not self._thread_loggers:
+            return None
+        return self._thread_loggers.get(get_ident())
+
+    def register_thread_logger(self, logger):
+        """Routes log messages written in the current thread to `logger`.
+
+        Used when keywords are executed in parallel in separate threads.
+        Messages are passed to the `message` method of the `logger`.
+        """
+        self._thread_loggers[get_ident()] = logger
+
+    def unregister_thread_logger(self):
+        self._thread_loggers.pop(get_ident(), None)
+
+    def write(self, message, level, html=False):
+        if self.is_logged(level):
+            AbstractLogger.write(self, message, level, html)
+
     def message(self, msg):
         """Messages about what the framework is doing, warnings, errors, ..."""
         for logger in self._loggers.all_loggers():
@@ -125,8 +181,10 @@ class Logger(AbstractLogger):
     log_message = message
 
     def log_output(self, output):
+        logger = self.thread_logger
+        log_message = logger.message if logger else self.log_message
         for msg in StdoutLogSplitter(output):
-            self.log_message(msg)
+            log_message(msg)
 
     def enable_library_import_logging(self):
         self._prev_log_message_handlers.append(self.log_message)
@@ -144,6 +202,7 @@ class Logger(AbstractLogger):
         for logger in self._loggers.all_loggers():
             logger.close()
         self._loggers = LoggerCollection()
+        self._min_level = LEVELS['TRACE']
         self._message_cache = []
 
     def start_suite(self, suite):
@@ -222,5 +281,15 @@ class _LoggerProxy(AbstractLoggerProxy):
                 'start_suite', 'end_suite', 'start_test', 'end_test',
                 'start_keyword', 'end_keyword']
 
+    @property
+    def min_level(self):
+        if hasattr(self.logger, 'min_level'):
+            return self.logger.min_level
+        for name in 'message', 'log_message':
+            for method_name in self._get_method_names(name):
+                if hasattr(self.logger, method_name):
+                    return 'TRACE'
+        return 'NONE'
+
 
 LOGGER = Logger()
@@ -36,6 +36,10 @@ class AbstractLogger:
     def set_level(self, level):
         return self._is_logged.set_level(level)
 
+    @property
+    def min_level(self):
+        return self._is_logged.level
+
     def trace(self, msg):
         self.write(msg, 'TRACE')
 
@@ -111,6 +115,10 @@ class IsLogged:
     def __call__(self, level):
         return self._level_to_int(level) >= self._int_level
 
+    @property
+    def level(self):
+        return self._str_level.upper()
+
     def set_level(self, level):
         old = self._str_level.upper()
         self.__init__(level)
@@ -61,6 +61,10 @@ class CommandLineMonitor(object):
         if self._running_test and not self._started_keywords:
             self._writer.keyword_marker(kw)
 
+    @property
+    def min_level(self):
+        return self._is_logged.level
+
     def message(self, msg):
         if self._is_logged(msg.level):
             self._writer.error(msg.message, msg.level, clear=self._running_test)
@@ -14,29 +14,47 @@
 
 from . import pyloggingconf
 from .debugfile import DebugFile
+from .forloopsampler import ForLoopSampler
 from .librarylisteners import LibraryListeners
 from .listeners import Listeners
 from .logger import LOGGER
+from .profiler import Profiler
 from .loggerhelper import AbstractLogger
 from .xmllogger import XmlLogger
+from .xunitlogger import XUnitLogger
 
 
 class Output(AbstractLogger):
 
     def __init__(self, settings):
         AbstractLogger.__init__(self)
-        self._xmllogger = XmlLogger(settings['Output'], settings['LogLevel'])
-        self._register_loggers(settings['Listeners'], settings['DebugFile'])
+        self._xmllogger = self._get_xml_logger(settings)
+        self._register_loggers(settings['Listeners'], settings['DebugFile'],
+                               settings['Profile'])
+        self._register_xunit_logger(settings['XUnit'],
+                                    settings['XUnitSkipNonCritical'])
         self._settings = settings
 
-    def _register_loggers(self, listeners, debugfile):
+    def _get_xml_logger(self, settings):
+        logger = XmlLogger(settings['Output'], settings['LogLevel'],
+                           background=settings['BackgroundOutput'])
+        if settings['SampleForLoops']:
+            first, last = settings['SampleForLoops']
+            logger = ForLoopSampler(logger, first, last, settings['LogLevel'])
+        return logger
+
+    def _register_loggers(self, listeners, debugfile, profile):
         LOGGER.register_context_changing_logger(self._xmllogger)
         for logger in (Listeners(listeners), LibraryListeners(),
-                       DebugFile(debugfile)):
+                       DebugFile(debugfile), Profiler(profile)):
             if logger:
                 LOGGER.register_logger(logger)
         LOGGER.disable_message_cache()
 
+    def _register_xunit_logger(self, path, skip_noncritical):
+        if path:
+            LOGGER.register_logger(XUnitLogger(path, skip_noncritical))
+
     def register_error_listener(self, listener):
         LOGGER.register_error_listener(listener)
 
@@ -64,10 +82,16 @@ class Output(AbstractLogger):
     def end_keyword(self, kw):
         LOGGER.end_keyword(kw)
 
+    def write(self, message, level, html=False):
+        if LOGGER.is_logged(level):
+            AbstractLogger.write(self, message, level, html)
+
     def message(self, msg):
         LOGGER.log_message(msg)
 
     def set_log_level(self, level):
         pyloggingconf.set_level(level)
-        return self._xmllogger.set_log_level(level)
+        old = self._xmllogger.set_log_level(level)
+        LOGGER.update_min_level()
+        return old
 
@@ -0,0 +1,216 @@
+#  Copyright 2008-2014 Nokia Solutions and Networks
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import math
+import os.path
+import random
+import time
+
+from .logger import LOGGER
+
+
+def Profiler(path):
+    if not path:
+        return None
+    stacks_path = os.path.splitext(path)[0] + '.folded'
+    try:
+        stats = open(path, 'w')
+        stacks = open(stacks_path, 'w')
+    except EnvironmentError, err:
+        LOGGER.error("Opening profile file '%s' failed: %s"
+                     % (err.filename, err.strerror))
+        return None
+    LOGGER.info('Profile file: %s' % path)
+    return _ProfileWriter(stats, stacks)
+
+
+class KeywordStatistics(object):
+    """Timing statistics of all the calls of one keyword.
+
+    Call count and total, minimum and maximum times are exact. Percentiles
+    are calculated from a random sample of at most `sample_size` call times
+    to keep memory usage constant regardless the number of calls.
+    """
+    sample_size = 1000
+
+    def __init__(self, name, type='kw'):
+        self.name = name
+        self.type = type
+        self.calls = 0
+        self.total_time = 0.0
+        self.self_time = 0.0
+        self.min_time = 0.0
+        self.max_time = 0.0
+        self._sample = []
+        self._random = random.Random(name)
+
+    def add(self, total_time, self_time):
+        self.calls += 1
+        self.total_time += total_time
+        self.self_time += self_time
+        if self.calls == 1 or total_time < self.min_time:
+            self.min_time = total_time
+        if self.calls == 1 or total_time > self.max_time:
+            self.max_time = total_time
+        self._add_to_sample(total_time)
+
+    def _add_to_sample(self, time):
+        if len(self._sample) < self.sample_size:
+            self._sample.append(time)
+        else:
+            index = self._random.randint(0, self.calls - 1)
+            if index < self.sample_size:
+                self._sample[index] = time
+
+    @property
+    def average_time(self):
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def percentile(self, percent):
+        """Returns the given percentile of call times using nearest rank."""
+        if not self._sample:
+            return 0.0
+        times = sorted(self._sample)
+        index = int(math.ceil(percent / 100.0 * len(times))) - 1
+        return times[max(0, min(index, len(times) - 1))]
+
+
+class ExecutionProfile(object):
+    """Collects per-keyword timing aggregates and collapsed call stacks.
+
+    Times are measured when start and end notifications are received, which
+    makes the profiler independent of the millisecond resolution timestamps
+    used in outputs. Self time is the total time minus the time spent in
+    child keywords. Self time of library keywords is reported as library time
+    and everything else, including the time spent in user keywords, loops
+    and between keywords, as framework overhead.
+    """
+    _library_types = ('library',)
+
+    def __init__(self, timer=time.time):
+        self.keywords = {}
+        self.stacks = {}
+        self.library_time = 0.0
+        self.elapsed_time = 0.0
+        self._timer = timer
+        self._frames = []
+
+    def start_suite(self, suite):
+        self._start(suite.name)
+
+    def end_suite(self, suite):
+        frame, total_time = self._end()
+        if not self._frames:
+            self.elapsed_time += total_time
+
+    def start_test(self, test):
+        self._start(test.name)
+
+    def end_test(self, test):
+        self._end()
+
+    def start_keyword(self, kw):
+        self._start(self._get_keyword_name(kw))
+
+    def end_keyword(self, kw):
+        frame, total_time = self._end()
+        key = frame.name, kw.type
+        if key not in self.keywords:
+            self.keywords[key] = KeywordStatistics(*key)
+        self.keywords[key].add(total_time, frame.self_time)
+        if getattr(kw, 'handler_type', None) in self._library_types:
+            self.library_time += frame.self_time
+
+    def _get_keyword_name(self, kw):
+        if kw.type == 'foritem':
+            return '%s (iteration)' % self._frames[-1].name
+        return kw.name.split('} = ', 1)[-1]  # Remove possible variables
+
+    def _start(self, name):
+        self._frames.append(_Frame(name, self._timer()))
+
+    def _end(self):
+        frame = self._frames.pop()
+        total_time = frame.end(self._timer())
+        if self._frames:
+            self._frames[-1].child_time += total_time
+        stack = tuple(f.name for f in self._frames) + (frame.name,)
+        self.stacks[stack] = self.stacks.get(stack, 0.0) + frame.self_time
+        return frame, total_time
+
+    @property
+    def overhead_time(self):
+        return max(self.elapsed_time - self.library_time, 0.0)
+
+
+class _Frame(object):
+    __slots__ = ['name', 'start_time', 'child_time', 'self_time']
+
+    def __init__(self, name, start_time):
+        self.name = name
+        self.start_time = start_time
+        self.child_time = 0.0
+        self.self_time = 0.0
+
+    def end(self, end_time):
+        total_time = max(end_time - self.start_time, 0.0)
+        self.self_time = max(total_time - self.child_time, 0.0)
+        return total_time
+
+
+class _ProfileWriter(ExecutionProfile):
+    _columns = ('Calls', 'Total', 'Self', 'Min', 'Median', 'P90', 'P99', 'Max')
+
+    def __init__(self, stats, stacks):
+        ExecutionProfile.__init__(self)
+        self._stats = stats
+        self._stacks = stacks
+
+    def end_suite(self, suite):
+        ExecutionProfile.end_suite(self, suite)
+        if not self._frames:
+            self._write_statistics()
+            self._write_stacks()
+            LOGGER.output_file('Profile', self._stats.name)
+            self.close()
+
+    def close(self):
+        for output in self._stats, self._stacks:
+            if not output.closed:
+                output.close()
+
+    def _write_statistics(self):
+        self._write(self._stats, 'Elapsed time: %.3f s' % self.elapsed_time)
+        self._write(self._stats, 'Library time: %.3f s' % self.library_time)
+        self._write(self._stats, 'Framework overhead: %.3f s'
+                                 % self.overhead_time)
+        self._write(self._stats, '')
+        self._write(self._stats, '\t'.join(self._columns + ('Type', 'Name')))
+        for stat in sorted(self.keywords.values(),
+                           key=lambda stat: stat.self_time, reverse=True):
+            values = ['%d' % stat.calls] + ['%.6f' % value for value in (
+                stat.total_time, stat.self_time, stat.min_time,
+                stat.percentile(50), stat.percentile(90),
+                stat.percentile(99), stat.max_time)]
+            self._write(self._stats, '\t'.join(values + [stat.type, stat.name]))
+
+    def _write_stacks(self):
+        for stack in sorted(self.stacks):
+            micros = int(round(self.stacks[stack] * 1000000))
+            if micros:
+                names = ';'.join(name.replace(';', ',') for name in stack)
+                self._write(self._stacks, '%s %d' % (names, micros))
+
+    def _write(self, output, text):
+        output.write(text.replace('\n', ' ').encode('UTF-8') + '\n')
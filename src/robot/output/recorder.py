@@ -0,0 +1,73 @@
+#  Copyright 2008-2014 Nokia Solutions and Networks
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import with_statement
+
+import copy
+import threading
+
+from .loggerhelper import AbstractLogger
+
+
+class OutputRecorder(AbstractLogger):
+    """Records keywords and messages so that they can be written later.
+
+    Recorded events are replayed to a target using methods with the same
+    names that were used when recording. Messages can thus be recorded
+    both with `message` and `log_message`.
+
+    After the recorder has been closed, new events are discarded. Recording,
+    replaying and closing can be done in different threads.
+    """
+
+    def __init__(self):
+        AbstractLogger.__init__(self)
+        self.has_warnings = False
+        self._events = []
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def start_keyword(self, kw):
+        self._record('start_keyword', copy.copy(kw))
+
+    def end_keyword(self, kw):
+        self._record('end_keyword', copy.copy(kw))
+
+    def message(self, msg):
+        self._record_message('message', msg)
+
+    def log_message(self, msg):
+        self._record_message('log_message', msg)
+
+    def _record_message(self, method, msg):
+        # Lazy messages may depend on state that changes before replaying.
+        msg.message
+        if msg.level == 'WARN':
+            self.has_warnings = True
+        self._record(method, msg)
+
+    def _record(self, method, item):
+        with self._lock:
+            if not self._closed:
+                self._events.append((method, item))
+
+    def replay(self, target):
+        with self._lock:
+            events, self._events = self._events, []
+        for method, item in events:
+            getattr(target, method)(item)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
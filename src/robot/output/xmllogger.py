@@ -12,27 +12,33 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import gzip
+
 from robot.errors import DataError
 from robot.utils import XmlWriter, NullMarkupWriter, get_timestamp, unic
 from robot.version import get_full_version
 from robot.result.visitor import ResultVisitor
 
+from .backgroundwriter import BackgroundXmlWriter
 from .loggerhelper import IsLogged
 
 
 class XmlLogger(ResultVisitor):
 
-    def __init__(self, path, log_level='TRACE', generator='Robot'):
+    def __init__(self, path, log_level='TRACE', generator='Robot',
+                 background=False):
         self._log_message_is_logged = IsLogged(log_level)
         self._error_message_is_logged = IsLogged('WARN')
+        self._background = background and bool(path)
         self._writer = self._get_writer(path, generator)
         self._errors = []
 
     def _get_writer(self, path, generator):
         if not path:
             return NullMarkupWriter()
+        writer_class = BackgroundXmlWriter if self._background else XmlWriter
         try:
-            writer = XmlWriter(path, encoding='UTF-8')
+            writer = writer_class(self._open_output(path), encoding='UTF-8')
         except EnvironmentError, err:
             raise DataError("Opening output file '%s' failed: %s" %
                             (path, err.strerror))
@@ -40,6 +46,11 @@ class XmlLogger(ResultVisitor):
                                'generated': get_timestamp()})
         return writer
 
+    def _open_output(self, path):
+        if isinstance(path, basestring) and path.lower().endswith('.gz'):
+            return gzip.open(path, 'wb', compresslevel=6)
+        return path
+
     def close(self):
         self.start_errors()
         for msg in self._errors:
@@ -51,6 +62,10 @@ class XmlLogger(ResultVisitor):
     def set_log_level(self, level):
         return self._log_message_is_logged.set_level(level)
 
+    @property
+    def min_level(self):
+        return self._log_message_is_logged.level
+
     def message(self, msg):
         if self._error_message_is_logged(msg.level):
             self._errors.append(msg)
@@ -103,6 +118,8 @@ class XmlLogger(ResultVisitor):
         self._writer.end('metadata')
         self._write_status(suite)
         self._writer.end('suite')
+        if self._background:
+            self._writer.sync()
 
     def start_statistics(self, stats):
         self._writer.start('statistics')
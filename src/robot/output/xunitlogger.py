@@ -0,0 +1,206 @@
+#  Copyright 2008-2014 Nokia Solutions and Networks
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import cPickle as pickle
+import tempfile
+
+from robot.utils import XmlWriter
+
+from .logger import LOGGER
+
+
+class XUnitStream(object):
+    """Writes xUnit compatible output based on incrementally received results.
+
+    Suites are started and ended and tests added one by one. Test results are
+    buffered into a temporary file and the actual output is written only
+    after all results have been received, because the root element needs
+    the final statistics. Memory usage is thus bounded by the size of
+    a single test.
+
+    Suite teardown failures mark all the tests in the suite failed similarly
+    as the result model does.
+    """
+    _teardown_msg = 'Parent suite teardown failed:\n'
+    _also_teardown_msg = '\n\nAlso parent suite teardown failed:\n'
+
+    def __init__(self, skip_noncritical=False):
+        self._skip_noncritical = skip_noncritical
+        self._records = tempfile.TemporaryFile()
+        self._suites = []
+        self._failed_teardowns = []
+        self._root_name = None
+        self._child_counts = [0]
+        self.total = self.failed = 0
+        self.critical_total = self.critical_failed = 0
+
+    def start_suite(self, name):
+        if self._root_name is None:
+            self._root_name = name
+        self._child_counts[-1] += 1
+        parent = self._suites[-1].id if self._suites else 's'
+        separator = '-s' if self._suites else ''
+        suite_id = '%s%s%d' % (parent, separator, self._child_counts[-1])
+        self._suites.append(_SuiteCounts(suite_id))
+        self._child_counts.append(0)
+
+    def end_suite(self, teardown_failure=None):
+        suite = self._suites.pop()
+        self._child_counts.pop()
+        if teardown_failure is not None:
+            self._failed_teardowns.append((suite.id, teardown_failure))
+            self.failed += suite.passed
+            self.critical_failed += suite.critical_passed
+        elif self._suites:
+            self._suites[-1].passed += suite.passed
+            self._suites[-1].critical_passed += suite.critical_passed
+
+    def test(self, classname, name, elapsedtime, status, message, critical):
+        suite = self._suites[-1]
+        passed = status == 'PASS'
+        self.total += 1
+        self.critical_total += bool(critical)
+        if passed:
+            suite.passed += 1
+            suite.critical_passed += bool(critical)
+        else:
+            self.failed += 1
+            self.critical_failed += bool(critical)
+        record = (suite.id, classname, name, elapsedtime, status, message,
+                  critical)
+        pickle.dump(record, self._records, pickle.HIGHEST_PROTOCOL)
+
+    @property
+    def return_code(self):
+        return min(self.critical_failed, 250)
+
+    def write(self, output):
+        """Writes the xUnit output to the given path or open file."""
+        writer = XmlWriter(output, encoding='UTF-8')
+        writer.start('testsuite', self._get_suite_attrs())
+        for record in self._read_records():
+            self._write_test(writer, *self._handle_teardowns(*record))
+        writer.end('testsuite')
+        writer.close()
+
+    def close(self):
+        self._records.close()
+
+    def _get_suite_attrs(self):
+        if self._skip_noncritical:
+            failures = self.critical_failed
+            skip = self.total - self.critical_total
+        else:
+            failures = self.failed
+            skip = 0
+        return {'name': self._root_name,
+                'tests': str(self.total),
+                'errors': '0',
+                'failures': str(failures),
+                'skip': str(skip)}
+
+    def _read_records(self):
+        self._records.seek(0)
+        while True:
+            try:
+                yield pickle.load(self._records)
+            except EOFError:
+                return
+
+    def _handle_teardowns(self, suite_id, classname, name, elapsedtime,
+                          status, message, critical):
+        # Failed teardowns are stored so that inner suites come first.
+        for failed_id, error in self._failed_teardowns:
+            if suite_id == failed_id or suite_id.startswith(failed_id + '-'):
+                status = 'FAIL'
+                message += (self._also_teardown_msg if message
+                            else self._teardown_msg) + error
+        return classname, name, elapsedtime, status, message, critical
+
+    def _write_test(self, writer, classname, name, elapsedtime, status,
+                    message, critical):
+        writer.start('testcase',
+                     {'classname': classname,
+                      'name': name,
+                      'time': self._time_as_seconds(elapsedtime)})
+        if self._skip_noncritical and not critical:
+            writer.element('skipped', '%s: %s' % (status, message)
+                                      if message else status)
+        elif status != 'PASS':
+            writer.element('failure', attrs={'message': message,
+                                             'type': 'AssertionError'})
+        writer.end('testcase')
+
+    def _time_as_seconds(self, millis):
+        return str(int(round(millis, -3) / 1000))
+
+
+class _SuiteCounts(object):
+    __slots__ = ['id', 'passed', 'critical_passed']
+
+    def __init__(self, suite_id):
+        self.id = suite_id
+        self.passed = 0
+        self.critical_passed = 0
+
+
+class XUnitLogger(object):
+    """Writes xUnit output during execution without needing output.xml."""
+
+    def __init__(self, path, skip_noncritical=False):
+        self._path = path
+        self._stream = XUnitStream(skip_noncritical)
+        self._running_test = False
+        self._keyword_level = 0
+        self._teardown_failure = []
+
+    def start_suite(self, suite):
+        self._stream.start_suite(suite.name)
+        self._teardown_failure.append(None)
+
+    def end_suite(self, suite):
+        self._stream.end_suite(self._teardown_failure.pop())
+        if not self._teardown_failure:
+            self._write()
+
+    def start_test(self, test):
+        self._running_test = True
+
+    def end_test(self, test):
+        self._running_test = False
+        self._stream.test(test.parent.longname, test.name, test.elapsedtime,
+                          test.status, test.message, test.critical)
+
+    def start_keyword(self, kw):
+        self._keyword_level += 1
+
+    def end_keyword(self, kw):
+        self._keyword_level -= 1
+        if (not self._running_test and self._keyword_level == 0 and
+                kw.type == 'teardown' and kw.status == 'FAIL'):
+            self._teardown_failure[-1] = kw.message
+
+    def _write(self):
+        try:
+            self._stream.write(self._path)
+        except EnvironmentError, err:
+            LOGGER.error("Writing xunit file '%s' failed: %s"
+                         % (self._path, err.strerror))
+        else:
+            LOGGER.output_file('XUnit', self._path)
+        self.close()
+
+    def close(self):
+        self._stream.close()
+
@@ -116,6 +116,9 @@ Options
                           specified. Given path, similarly as paths given to
                           --log, --report and --xunit, is relative to
                           --outputdir unless given as an absolute path.
+                          If the path has a `.gz` extension, the output is
+                          compressed using gzip. Compressed input files are
+                          also supported.
  -l --log file            HTML log file. Can be disabled by giving a special
                           name `NONE`. Default: log.html
                           Examples: `--log mylog.html`, `-l none`
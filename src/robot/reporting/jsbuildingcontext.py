@@ -31,6 +31,9 @@ class JsBuildingContext(object):
         self._split_log = split_log
         self._prune_input = prune_input
         self._strings = self._top_level_strings = StringCache()
+        # Formatting same documentation, typically library keyword docs,
+        # repeatedly is expensive. Indices are cached per string cache.
+        self._html = self._top_level_html = {}
         self.basemillis = None
         self.split_results = []
         self.min_level = 'NONE'
@@ -44,7 +47,9 @@ class JsBuildingContext(object):
         return self._strings.add(string)
 
     def html(self, string):
-        return self.string(html_format(string), escape=False)
+        if string not in self._html:
+            self._html[string] = self.string(html_format(string), escape=False)
+        return self._html[string]
 
     def relative_source(self, source):
         rel_source = get_link_path(source, self._log_dir) \
@@ -81,12 +86,14 @@ class JsBuildingContext(object):
     def start_splitting_if_needed(self, split=False):
         if self._split_log and split:
             self._strings = StringCache()
+            self._html = {}
             return True
         return False
 
     def end_splitting(self, model):
         self.split_results.append((model, self.strings))
         self._strings = self._top_level_strings
+        self._html = self._top_level_html
         return len(self.split_results)
 
     @contextmanager
@@ -20,7 +20,7 @@ from robot.utils import unic
 
 from .jsmodelbuilders import JsModelBuilder
 from .logreportwriters import LogWriter, ReportWriter
-from .xunitwriter import XUnitWriter
+from .xunitwriter import StreamingXUnitWriter, XUnitWriter
 
 
 class ResultWriter(object):
@@ -51,6 +51,8 @@ class ResultWriter(object):
             are not given.
         """
         settings = settings or RebotSettings(options)
+        if self._can_stream_xunit(settings):
+            return self._stream_xunit(settings)
         results = Results(settings, *self._sources)
         if settings.output:
             self._write_output(results.result, settings.output)
@@ -67,6 +69,33 @@ class ResultWriter(object):
                                settings.report_config)
         return results.return_code
 
+    def _can_stream_xunit(self, settings):
+        # xUnit output can be created without building the result model
+        # if it is the only output and results are not modified.
+        if not settings.xunit or len(self._sources) != 1 \
+                or isinstance(self._sources[0], Result):
+            return False
+        if settings.output or settings.log or settings.report \
+                or settings.merge:
+            return False
+        config = settings.suite_config
+        return not any(config[name] for name in
+                       ('name', 'set_tags', 'include_tags', 'exclude_tags',
+                        'include_suites', 'include_tests'))
+
+    def _stream_xunit(self, settings):
+        config = settings.suite_config
+        writer = StreamingXUnitWriter(self._sources[0],
+                                      settings.xunit_skip_noncritical,
+                                      config['critical_tags'],
+                                      config['non_critical_tags'],
+                                      config['empty_suite_ok'])
+        try:
+            self._write('XUnit', writer.parse().write, settings.xunit)
+        finally:
+            writer.close()
+        return writer.return_code if settings.status_rc else 0
+
     def _write_output(self, result, path):
         self._write('Output', result.save, path)
 
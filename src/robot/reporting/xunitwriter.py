@@ -12,10 +12,14 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-import os
+from __future__ import with_statement
 
+from robot.errors import DataError
+from robot.model import Criticality, Tags
+from robot.output.xunitlogger import XUnitStream
 from robot.result.visitor import ResultVisitor
-from robot.utils import XmlWriter
+from robot.utils import (ET, ETSource, XmlWriter, get_elapsed_time,
+                         get_error_message)
 
 
 class XUnitWriter(object):
@@ -99,3 +103,117 @@ class XUnitFileWriter(ResultVisitor):
 
     def end_result(self, result):
         self._writer.close()
+
+
+class StreamingXUnitWriter(object):
+    """Creates xUnit output directly from an output XML file.
+
+    The output is parsed as a stream and parsed elements are discarded
+    immediately, so the result model is never built and memory usage does
+    not depend on the size of the output. Can be used only when results
+    are not otherwise modified, e.g. filtered or renamed, before writing.
+    """
+
+    def __init__(self, source, skip_noncritical=False, critical_tags=None,
+                 non_critical_tags=None, empty_suite_ok=False):
+        self._source = source
+        self._criticality = Criticality(critical_tags, non_critical_tags)
+        self._empty_suite_ok = empty_suite_ok
+        self._stream = XUnitStream(skip_noncritical)
+
+    @property
+    def return_code(self):
+        return self._stream.return_code
+
+    def parse(self):
+        ets = ETSource(self._source)
+        try:
+            with ets as source:
+                context = ET.iterparse(source, events=('start', 'end'))
+                name = self._parse(context, self._stream)
+        except IOError, err:
+            error = err.strerror
+        except:
+            error = get_error_message()
+        else:
+            if not (self._stream.total or self._empty_suite_ok):
+                raise DataError("Suite '%s' contains no tests." % name)
+            return self
+        raise DataError("Reading XML source '%s' failed: %s"
+                        % (unicode(ets), error))
+
+    def write(self, output):
+        self._stream.write(output)
+
+    def close(self):
+        self._stream.close()
+
+    def _parse(self, context, stream):
+        elems = []
+        suites = []
+        test = None
+        for event, elem in context:
+            tag = elem.tag
+            if event == 'start':
+                if tag == 'suite':
+                    suites.append(_SuiteInfo(elem.get('name'), suites))
+                    stream.start_suite(elem.get('name'))
+                elif tag == 'test':
+                    test = _TestInfo(elem.get('name'))
+                elems.append(elem)
+                continue
+            elems.pop()
+            parent = elems[-1] if elems else None
+            if tag == 'suite':
+                suite = suites.pop()
+                stream.end_suite(suite.teardown_failure)
+                if not suites:
+                    return suite.name
+            elif tag == 'test':
+                self._add_test(stream, suites[-1], test)
+                test = None
+            elif tag == 'tag' and test and elems[-2].tag == 'test':
+                test.tags.add(elem.text or '')
+            elif tag == 'status' and parent.tag == 'test':
+                test.set_status(elem)
+            elif tag == 'status' and parent.tag == 'kw' \
+                    and parent.get('type') == 'teardown' \
+                    and elems[-2].tag == 'suite' \
+                    and elem.get('status') == 'FAIL':
+                suites[-1].teardown_failure = elem.text or ''
+            if elems:
+                elems[-1].remove(elem)
+        return None
+
+    def _add_test(self, stream, suite, test):
+        critical = self._criticality.test_is_critical(test)
+        stream.test(suite.longname, test.name, test.elapsedtime,
+                    test.status, test.message, critical)
+
+
+class _SuiteInfo(object):
+    __slots__ = ['name', 'longname', 'teardown_failure']
+
+    def __init__(self, name, parents):
+        self.name = name
+        self.longname = '%s.%s' % (parents[-1].longname, name) \
+            if parents else name
+        self.teardown_failure = None
+
+
+class _TestInfo(object):
+    __slots__ = ['name', 'tags', 'status', 'message', 'elapsedtime']
+
+    def __init__(self, name):
+        self.name = name
+        self.tags = Tags()
+        self.status = 'FAIL'
+        self.message = ''
+        self.elapsedtime = 0
+
+    def set_status(self, elem):
+        self.status = elem.get('status', 'FAIL')
+        self.message = elem.text or ''
+        times = [elem.get(name) for name in ('starttime', 'endtime')]
+        times = [time if time != 'N/A' else None for time in times]
+        self.elapsedtime = get_elapsed_time(*times)
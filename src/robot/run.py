@@ -111,6 +111,10 @@ Options
  -R --rerunfailed output  Select failed tests from an earlier output file to be
                           re-executed. Equivalent to selecting same tests
                           individually using --test option.
+    --rerunfailedsuites output  Select suites containing failed tests from
+                          an earlier output file to be re-executed. Equivalent
+                          to selecting same suites individually using --suite
+                          option.
     --runfailed output    Deprecated since RF 2.8.4. Use --rerunfailed instead.
  -c --critical tag *      Tests having given tag are considered critical. If no
                           critical tags are set, all tags are critical. Tags
@@ -148,7 +152,13 @@ Options
                           can also be further processed with Rebot tool. Can be
                           disabled by giving a special value `NONE`. In this
                           case, also log and report are automatically disabled.
+                          If the path has a `.gz` extension, the output is
+                          compressed using gzip.
                           Default: output.xml
+    --backgroundoutput    Write the output file in a background thread using
+                          a large write buffer. Reduces the effect of slow
+                          disks on execution time. The output is synced to
+                          the disk after each suite.
  -l --log file            HTML log file. Can be disabled by giving a special
                           value `NONE`. Default: log.html
                           Examples: `--log mylog.html`, `-l NONE`
@@ -160,6 +170,14 @@ Options
     --xunitskipnoncritical  Mark non-critical tests on xUnit output as skipped.
  -b --debugfile file      Debug file written during execution. Not created
                           unless this option is specified.
+    --profile file        Profile file written at the end of the execution.
+                          Contains per keyword call counts and total, self,
+                          min, median, percentile and max times as well as
+                          framework overhead versus library time. Also
+                          a collapsed stack file usable with flame graph
+                          tools is created with the same base name and
+                          extension `.folded`. Not created unless this option
+                          is specified. Example: `--profile profile.txt`
  -T --timestampoutputs    When this option is used, timestamp in a format
                           `YYYYMMDD-hhmmss` is added to all generated output
                           files between their basename and extension. For
@@ -247,6 +265,14 @@ Options
                           name:<pattern>:  flatten matched keywords using same
                                    matching rules as with
                                    `--removekeywords name:<pattern>`
+    --sampleforloops first[:last]  Write only the first and the last given
+                          number of iterations of each for loop to the output
+                          file. Failing iterations and iterations containing
+                          warnings are always written, and other iterations
+                          are replaced with a summary. Keeps output size
+                          bounded regardless of the number of iterations.
+                          Examples: --sampleforloops 10 (first and last 10)
+                                    --sampleforloops 5:1
     --listener class *    A class for monitoring test execution. Gets
                           notifications e.g. when a test case starts and ends.
                           Arguments to listener class can be given after class
@@ -407,7 +433,7 @@ class RobotFramework(Application):
             result = suite.run(settings)
             LOGGER.info("Tests execution ended. Statistics:\n%s"
                         % result.suite.stat_message)
-            if settings.log or settings.report or settings.xunit:
+            if settings.log or settings.report:
                 writer = ResultWriter(settings.output if settings.log
                                       else result)
                 writer.write_results(settings.get_rebot_settings())
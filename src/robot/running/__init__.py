@@ -102,6 +102,7 @@ from .builder import TestSuiteBuilder
 from .context import EXECUTION_CONTEXTS
 from .keywords import Keyword
 from .model import TestSuite, TestCase
+from .parallel import ParallelKeywords
 from .testlibraries import TestLibrary
 from .runkwregister import RUN_KW_REGISTER
 
@@ -14,7 +14,9 @@
 
 from __future__ import with_statement
 
+import copy
 from contextlib import contextmanager
+from thread import get_ident
 
 from robot.errors import DataError
 from robot.variables import GLOBAL_VARIABLES
@@ -24,11 +26,31 @@ class ExecutionContexts(object):
 
     def __init__(self):
         self._contexts = []
+        self._thread_contexts = {}
 
     @property
     def current(self):
+        if self._thread_contexts:
+            context = self._thread_contexts.get(get_ident())
+            if context:
+                return context
         return self._contexts[-1] if self._contexts else None
 
+    @property
+    def thread_context(self):
+        """Context registered for the current thread or `None`."""
+        return self._thread_contexts.get(get_ident())
+
+    def register_thread_context(self, context):
+        """Makes `context` current in the current thread.
+
+        Used when keywords are executed in parallel in separate threads.
+        """
+        self._thread_contexts[get_ident()] = context
+
+    def unregister_thread_context(self):
+        self._thread_contexts.pop(get_ident(), None)
+
     @property
     def top(self):
         return self._contexts[0] if self._contexts else None
@@ -65,6 +87,17 @@ class _ExecutionContext(object):
         self._started_keywords = 0
         self.timeout_occurred = False
 
+    def branch(self, output):
+        """Returns a copy of this context for running keywords in parallel.
+
+        The copy uses the given `output` and has its own variable scope and
+        user keyword stack, but otherwise it shares state with this context.
+        """
+        branch = copy.copy(self)
+        branch.namespace = self.namespace.branch()
+        branch.output = output
+        return branch
+
     # TODO: namespace should not have suite, test, or uk_handlers.
 
     @property
@@ -97,7 +97,7 @@ class _RunnableHandler(object):
         return self.library.name
 
     def init_keyword(self, varz):
-        pass
+        return self
 
     def run(self, context, args):
         if self.pre_run_messages:
@@ -122,8 +122,8 @@ class _RunnableHandler(object):
         return self._run_with_output_captured_and_signal_monitor(runner, context)
 
     def _log_args(self, positional, named):
-        positional = [utils.safe_repr(arg) for arg in positional]
-        named = ['%s=%s' % (utils.unic(name), utils.safe_repr(value))
+        positional = [utils.safe_repr_bounded(arg) for arg in positional]
+        named = ['%s=%s' % (utils.unic(name), utils.safe_repr_bounded(value))
                  for name, value in named.items()]
         return 'Arguments: [ %s ]' % ' | '.join(positional + named)
 
@@ -282,6 +282,8 @@ class _RunKeywordHandler(_PythonHandler):
             return list(self._get_run_kw_if_keywords(args))
         if self._handler_name == 'run_keywords':
             return list(self._get_run_kws_keywords(args))
+        if self._handler_name == 'run_keywords_in_parallel':
+            return list(self._get_run_kws_keywords(args[1:]))
         if 'name' in self.arguments.positional and self._get_args_to_process() > 0:
             return self._get_default_run_kw_keywords(args)
         return []
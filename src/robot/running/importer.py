@@ -21,6 +21,7 @@ from robot.errors import FrameworkError
 from robot import utils
 
 from .testlibraries import TestLibrary
+from .userkeyword import UserLibrary
 
 
 class Importer(object):
@@ -43,11 +44,17 @@ class Importer(object):
         return lib
 
     def import_resource(self, path):
+        """Returns the parsed resource file and its keywords as a library.
+
+        Both are cached and shared by all suites importing the resource.
+        """
         if path in self._resource_cache:
             LOGGER.info("Found resource file '%s' from cache" % path)
         else:
             resource = ResourceFile(path).populate()
-            self._resource_cache[path] = resource
+            library = UserLibrary(resource.keyword_table.keywords,
+                                  resource.source)
+            self._resource_cache[path] = (resource, library)
         return self._resource_cache[path]
 
     def _import_library(self, name, positional, named, lib):
@@ -12,13 +12,15 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import copy
+
 from robot.utils import (format_assign_message, get_elapsed_time,
-                         get_error_message, get_timestamp, plural_or_not, frange)
+                         get_error_message, get_timestamp, plural_or_not, xfrange)
 from robot.errors import (ContinueForLoop, DataError, ExecutionFailed,
                           ExecutionFailures, ExecutionPassed, ExitForLoop,
                           HandlerExecutionFailed)
 
-from robot.variables import is_scalar_var, VariableAssigner
+from robot.variables import is_list_var, is_scalar_var, VariableAssigner
 
 
 class Keywords(object):
@@ -98,8 +100,14 @@ class Keyword(_BaseKeyword):
         _BaseKeyword.__init__(self, name, args, type=type)
         self.assign = assign or []
         self.handler_name = name
+        self.handler_type = None
 
     def run(self, context):
+        # Keywords are shared by all runs of a user keyword and the state
+        # of a single run is stored to a copy.
+        return copy.copy(self)._run_keyword(context)
+
+    def _run_keyword(self, context):
         handler = self._start(context)
         try:
             return_value = self._run(handler, context)
@@ -115,8 +123,9 @@ class Keyword(_BaseKeyword):
 
     def _start(self, context):
         handler = context.get_handler(self.handler_name)
-        handler.init_keyword(context.variables)
+        handler = handler.init_keyword(context.variables)
         self.name = self._get_name(handler.longname)
+        self.handler_type = handler.type
         self.doc = handler.shortdoc
         self.timeout = getattr(handler, 'timeout', '')
         self.starttime = get_timestamp()
@@ -189,6 +198,9 @@ class ForLoop(_BaseKeyword):
                                  ' | '.join(data.items))
 
     def run(self, context):
+        copy.copy(self)._run_for_loop(context)
+
+    def _run_for_loop(self, context):
         self.starttime = get_timestamp()
         context.start_keyword(self)
         error = self._run_with_error_handling(self._validate_and_run, context)
@@ -228,9 +240,7 @@ class ForLoop(_BaseKeyword):
 
     def _run(self, context):
         errors = []
-        items, iteration_steps = self._get_items_and_iteration_steps(context)
-        for i in iteration_steps:
-            values = items[i:i+len(self.vars)]
+        for values in self._get_iteration_values(context):
             exception = self._run_one_round(context, self.vars, values)
             if exception:
                 if isinstance(exception, ExitForLoop):
@@ -252,11 +262,31 @@ class ForLoop(_BaseKeyword):
         if errors:
             raise ExecutionFailures(errors)
 
-    def _get_items_and_iteration_steps(self, context):
+    def _get_iteration_values(self, context):
         if context.dry_run:
-            return self.vars, [0]
+            return [self.vars]
         items = self._replace_vars_from_items(context.variables)
-        return items, range(0, len(items), len(self.vars))
+        if hasattr(items, '__len__'):
+            self._validate_item_count(len(items))
+        return self._group_items(items)
+
+    def _group_items(self, items):
+        values = []
+        count = 0
+        for item in items:
+            values.append(item)
+            count += 1
+            if len(values) == len(self.vars):
+                yield values
+                values = []
+        # Items that are not sequences are counted only after iterating them.
+        self._validate_item_count(count)
+
+    def _validate_item_count(self, count):
+        if count % len(self.vars):
+            raise DataError('Number of FOR loop values should be multiple of '
+                            'variables. Got %d variables but %d value%s.'
+                            % (len(self.vars), count, plural_or_not(count)))
 
     def _run_one_round(self, context, variables, values):
         foritem = _ForItem(variables, values)
@@ -269,14 +299,14 @@ class ForLoop(_BaseKeyword):
         return error
 
     def _replace_vars_from_items(self, variables):
-        items = variables.replace_list(self.items)
         if self.range:
-            items = self._get_range_items(items)
-        if len(items) % len(self.vars) == 0:
-            return items
-        raise DataError('Number of FOR loop values should be multiple of '
-                        'variables. Got %d variables but %d value%s.'
-                        % (len(self.vars), len(items), plural_or_not(items)))
+            return self._get_range_items(variables.replace_list(self.items))
+        if len(self.items) == 1 and is_list_var(self.items[0]):
+            items = variables[self.items[0]]
+            # Iterators are consumed lazily. Sequences are copied because
+            # the loop could otherwise modify the values it iterates over.
+            return list(items) if hasattr(items, '__len__') else items
+        return variables.replace_list(self.items)
 
     def _get_range_items(self, items):
         try:
@@ -287,7 +317,7 @@ class ForLoop(_BaseKeyword):
         if not 1 <= len(items) <= 3:
             raise DataError('FOR IN RANGE expected 1-3 arguments, '
                             'got %d instead.' % len(items))
-        return frange(*items)
+        return xfrange(*items)
 
     def _to_number_with_arithmetics(self, item):
         if isinstance(item, (int, long, float)):
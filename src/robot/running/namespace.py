@@ -86,11 +86,10 @@ class Namespace:
         path = self._resolve_name(import_setting)
         self._validate_not_importing_init_file(path)
         if overwrite or path not in self._kw_store.resources:
-            resource = IMPORTER.import_resource(path)
+            resource, library = IMPORTER.import_resource(path)
             self.variables.set_from_variable_table(resource.variable_table,
                                                    overwrite)
-            self._kw_store.resources[path] \
-                = UserLibrary(resource.keyword_table.keywords, resource.source)
+            self._kw_store.resources[path] = library
             self._handle_imports(resource.setting_table.imports)
         else:
             LOGGER.info("Resource file '%s' already imported by suite '%s'"
@@ -130,6 +129,8 @@ class Namespace:
                         % (lib.name, self.suite.longname))
             return
         self._kw_store.libraries[lib.name] = lib
+        if lib.has_listener:
+            LOGGER.update_min_level()
         lib.start_suite()
         if self.test:
             lib.start_test()
@@ -197,6 +198,12 @@ class Namespace:
         self.variables.end_uk()
         self.uk_handlers.pop()
 
+    def branch(self):
+        branch = copy.copy(self)
+        branch.variables = self.variables.branch()
+        branch.uk_handlers = self.uk_handlers[:]
+        return branch
+
     def get_library_instance(self, libname):
         return self._kw_store.get_library(libname).get_instance()
 
@@ -448,7 +455,6 @@ class KeywordRecommendationFinder(object):
 class _VariableScopes:
 
     def __init__(self, suite_variables, parent_variables):
-        suite_variables.update(GLOBAL_VARIABLES)
         self._suite = self.current = suite_variables
         self._parents = []
         if parent_variables is not None:
@@ -509,10 +515,23 @@ class _VariableScopes:
     def end_uk(self):
         self.current = self._uk_handlers.pop()
 
+    def branch(self):
+        branch = copy.copy(self)
+        branch.current = self.current.copy()
+        branch._uk_handlers = self._uk_handlers[:]
+        return branch
+
     def set_global(self, name, value):
         GLOBAL_VARIABLES.__setitem__(name, value)
         for ns in EXECUTION_CONTEXTS.namespaces:
-            ns.variables.set_suite(name, value)
+            ns.variables._remove_hiding_global(name)
+
+    def _remove_hiding_global(self, name):
+        # Global variables are visible through all scopes unless a variable
+        # with the same name in the scope hides them.
+        for varz in [self._suite, self._test, self.current] + self._uk_handlers:
+            if varz is not None:
+                varz.store.remove(name)
 
     def set_suite(self, name, value):
         self._suite.__setitem__(name, value)
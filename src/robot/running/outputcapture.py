@@ -12,8 +12,12 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from __future__ import with_statement
+
 import sys
+from contextlib import contextmanager
 from StringIO import StringIO
+from thread import get_ident
 
 from robot.output import LOGGER
 from robot.utils import decode_output, encode_output
@@ -53,23 +57,75 @@ class OutputCapturer(object):
         return stdout, stderr
 
 
+@contextmanager
+def thread_specific_streams():
+    """Makes it possible to capture stdout and stderr separately in threads.
+
+    While active, `sys.stdout` and `sys.stderr` are replaced with
+    `ThreadSpecificStream` objects that `PythonCapturer` knows how to use.
+    """
+    original = sys.stdout, sys.stderr
+    if not isinstance(sys.stdout, ThreadSpecificStream):
+        sys.stdout = ThreadSpecificStream(sys.stdout)
+    if not isinstance(sys.stderr, ThreadSpecificStream):
+        sys.stderr = ThreadSpecificStream(sys.stderr)
+    try:
+        yield
+    finally:
+        sys.stdout, sys.stderr = original
+
+
+class ThreadSpecificStream(object):
+
+    def __init__(self, default):
+        self._default = default
+        self._streams = {}
+
+    @property
+    def current(self):
+        return self._streams.get(get_ident(), self._default)
+
+    def set_current(self, stream):
+        if stream is self._default:
+            self._streams.pop(get_ident(), None)
+        else:
+            self._streams[get_ident()] = stream
+
+    def write(self, data):
+        self.current.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.current, name)
+
+
 class PythonCapturer(object):
 
     def __init__(self, stdout=True):
         if stdout:
-            self._original = sys.stdout
+            self._original = self._get_current(sys.stdout)
             self._set_stream = self._set_stdout
         else:
-            self._original = sys.stderr
+            self._original = self._get_current(sys.stderr)
             self._set_stream = self._set_stderr
         self._stream = StringIO()
         self._set_stream(self._stream)
 
+    def _get_current(self, stream):
+        if isinstance(stream, ThreadSpecificStream):
+            return stream.current
+        return stream
+
     def _set_stdout(self, stream):
-        sys.stdout = stream
+        if isinstance(sys.stdout, ThreadSpecificStream):
+            sys.stdout.set_current(stream)
+        else:
+            sys.stdout = stream
 
     def _set_stderr(self, stream):
-        sys.stderr = stream
+        if isinstance(sys.stderr, ThreadSpecificStream):
+            sys.stderr.set_current(stream)
+        else:
+            sys.stderr = stream
 
     def release(self):
         # Original stream must be restored before closing the current
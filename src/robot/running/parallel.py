@@ -0,0 +1,172 @@
+#  Copyright 2008-2014 Nokia Solutions and Networks
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import with_statement
+
+import copy
+import sys
+import threading
+
+from robot.errors import (DataError, ExecutionFailed, ExecutionFailures,
+                          ExecutionPassed)
+from robot.output import LOGGER
+from robot.output.recorder import OutputRecorder
+from robot.utils import escape
+
+from .context import EXECUTION_CONTEXTS
+from .outputcapture import thread_specific_streams
+from .timeouts import KeywordTimeout
+
+
+class ParallelKeywords(object):
+    """Runs keywords concurrently so that each keyword has its own thread.
+
+    Keywords run in branches that have their own copy of the execution
+    context. Output of a branch is recorded while it runs and written to
+    the real output after all branches have finished. The result tree thus
+    contains the keywords in the order they were given.
+
+    If `timeout` is given, it is applied separately to each branch similarly
+    as a user keyword timeout.
+    """
+
+    def __init__(self, keywords, timeout=None):
+        self._keywords = keywords
+        self._timeout = timeout
+
+    def run(self, context):
+        branches = [_Branch(kw, context, self._get_timeout(context))
+                    for kw in self._keywords]
+        with thread_specific_streams():
+            for branch in branches:
+                branch.start()
+            interrupted = self._wait(branches)
+        for branch in branches:
+            branch.write_output(context.output)
+            if branch.timeout_occurred:
+                context.timeout_occurred = True
+        self._report_errors(branches, interrupted)
+
+    def _get_timeout(self, context):
+        if not self._timeout:
+            return None
+        # Timeout has already been resolved as a keyword argument.
+        timeout = KeywordTimeout(escape(self._timeout),
+                                 variables=context.variables)
+        if timeout.error:
+            raise DataError(timeout.error)
+        return timeout
+
+    def _wait(self, branches):
+        interrupted = None
+        for branch in branches:
+            while branch.running:
+                try:
+                    branch.wait(0.1)
+                except ExecutionFailed, err:
+                    # Stopped with a signal. Branches stop when they start
+                    # their next keyword.
+                    interrupted = err
+        return interrupted
+
+    def _report_errors(self, branches, interrupted):
+        errors = []
+        passed = None
+        for branch in branches:
+            error = branch.error
+            if isinstance(error, ExecutionPassed):
+                passed = passed or error
+            elif isinstance(error, ExecutionFailed):
+                errors.extend(error.get_errors())
+            elif error:
+                raise error, None, branch.traceback
+        if interrupted:
+            errors.extend(interrupted.get_errors())
+        if passed:
+            passed.set_earlier_failures(errors)
+            raise passed
+        if errors:
+            raise ExecutionFailures(errors)
+
+
+class _Branch(object):
+
+    def __init__(self, keyword, context, timeout=None):
+        self._keyword = keyword
+        self._output = _BranchOutput(context.output)
+        self._context = context.branch(self._output)
+        self._timeout = timeout
+        self._thread = threading.Thread(target=self._run,
+                                        name='RobotFrameworkParallelThread')
+        self._thread.setDaemon(True)
+        self.error = None
+        self.traceback = None
+
+    @property
+    def running(self):
+        return self._thread.isAlive()
+
+    @property
+    def timeout_occurred(self):
+        return self._context.timeout_occurred
+
+    def start(self):
+        self._thread.start()
+
+    def wait(self, timeout):
+        self._thread.join(timeout)
+
+    def _run(self):
+        EXECUTION_CONTEXTS.register_thread_context(self._context)
+        LOGGER.register_thread_logger(self._output)
+        if self._timeout:
+            self._context.keywords.append(_TimeoutHolder(self._timeout))
+        try:
+            self._keyword.run(self._context)
+        except:
+            self.error, self.traceback = sys.exc_info()[1:]
+        finally:
+            EXECUTION_CONTEXTS.unregister_thread_context()
+            LOGGER.unregister_thread_logger()
+
+    def write_output(self, output):
+        # Keywords that timed out may still run in their timeout threads.
+        # Their possible later output is discarded to keep the log valid.
+        self._output.close()
+        self._output.replay(output)
+        if self.timeout_occurred:
+            output.info('Possible output of keywords still running after '
+                        'the timeout is discarded.')
+
+
+class _TimeoutHolder(object):
+    # Handlers look for active timeouts from started user keywords.
+
+    def __init__(self, timeout):
+        self.timeout = copy.copy(timeout)
+        self.timeout.start()
+
+
+class _BranchOutput(OutputRecorder):
+
+    def __init__(self, output):
+        OutputRecorder.__init__(self)
+        self._output = output
+
+    def write(self, message, level, html=False):
+        if LOGGER.is_logged(level):
+            OutputRecorder.write(self, message, level, html)
+
+    def set_log_level(self, level):
+        return self._output.set_log_level(level)
@@ -17,7 +17,7 @@ from __future__ import with_statement
 from robot.errors import ExecutionFailed, DataError, PassExecution
 from robot.model import SuiteVisitor
 from robot.result import TestSuite, Result
-from robot.variables import GLOBAL_VARIABLES
+from robot.variables import GLOBAL_VARIABLES, Variables
 from robot.utils import get_timestamp, NormalizedDict
 
 from .context import EXECUTION_CONTEXTS
@@ -49,7 +49,13 @@ class Runner(SuiteVisitor):
         return ctx.variables if ctx else None
 
     def start_suite(self, suite):
-        variables = GLOBAL_VARIABLES.copy()
+        variables = Variables(GLOBAL_VARIABLES)
+        # Previous test variables are updated to globals when suites end,
+        # but each suite sees the values they had when the suite started.
+        for name in ['${PREV_TEST_NAME}',
+                     '${PREV_TEST_STATUS}',
+                     '${PREV_TEST_MESSAGE}']:
+            variables[name] = GLOBAL_VARIABLES[name]
         variables.set_from_variable_table(suite.variables)
         result = TestSuite(source=suite.source,
                            name=suite.name,
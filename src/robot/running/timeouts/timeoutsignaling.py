@@ -13,9 +13,12 @@
 #  limitations under the License.
 
 from signal import setitimer, signal, SIGALRM, ITIMER_REAL
+from threading import currentThread
 
 from robot.errors import TimeoutError
 
+from .timeoutthread import Timeout as ThreadTimeout
+
 
 class Timeout(object):
 
@@ -24,6 +27,10 @@ class Timeout(object):
         self._error = error
 
     def execute(self, runnable):
+        # Signals can be used only in the main thread. Other threads exist
+        # when keywords are run in parallel.
+        if currentThread().getName() != 'MainThread':
+            return ThreadTimeout(self._timeout, self._error).execute(runnable)
         self._start_timer()
         try:
             return runnable()
@@ -16,6 +16,9 @@ import sys
 from threading import Event
 
 from robot.errors import TimeoutError
+from robot.output import LOGGER
+
+from ..context import EXECUTION_CONTEXTS
 
 if sys.platform.startswith('java'):
     from java.lang import Thread, Runnable
@@ -36,12 +39,22 @@ class ThreadedRunner(Runnable):
         self._error = None
         self._traceback = None
         self._thread = None
+        # Keywords run in parallel have thread specific context and logger
+        # and they must be available also in the timeout thread.
+        self._context = EXECUTION_CONTEXTS.thread_context
+        self._logger = LOGGER.thread_logger
 
     def run(self):
+        if self._context:
+            EXECUTION_CONTEXTS.register_thread_context(self._context)
+            LOGGER.register_thread_logger(self._logger)
         try:
             self._result = self._runnable()
         except:
             self._error, self._traceback = sys.exc_info()[1:]
+        if self._context:
+            EXECUTION_CONTEXTS.unregister_thread_context()
+            LOGGER.unregister_thread_logger()
         self._notifier.set()
 
     __call__ = run
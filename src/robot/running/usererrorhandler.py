@@ -31,7 +31,7 @@ class UserErrorHandler:
         self.timeout = ''
 
     def init_keyword(self, varz):
-        pass
+        return self
 
     def run(self, *args):
         raise DataError(self.error)
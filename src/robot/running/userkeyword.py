@@ -14,6 +14,7 @@
 
 from __future__ import with_statement
 
+import copy
 import os
 import re
 
@@ -108,6 +109,7 @@ class UserLibrary(BaseLibrary):
 
 class UserKeywordHandler(object):
     type = 'user'
+    _needs_resolving = re.compile(r'[{=\\]').search
 
     def __init__(self, keyword, libname):
         self.name = keyword.name
@@ -118,6 +120,8 @@ class UserKeywordHandler(object):
         self.doc = self._doc = unicode(keyword.doc)
         self.arguments = UserKeywordArgumentParser().parse(tuple(keyword.args),
                                                            self.longname)
+        self._argument_resolver = ArgumentResolver(self.arguments)
+        self._argument_mapper = ArgumentMapper(self.arguments)
         self._timeout = keyword.timeout
 
     @property
@@ -129,10 +133,17 @@ class UserKeywordHandler(object):
         return self.doc.splitlines()[0] if self.doc else ''
 
     def init_keyword(self, variables):
-        self.doc = variables.replace_string(self._doc, ignore_errors=True)
+        """Returns a copy of this handler for running the keyword once.
+
+        Documentation and timeout of the copy have variables replaced.
+        The original handler is never modified, so it can be shared.
+        """
+        handler = copy.copy(self)
+        handler.doc = variables.replace_string(self._doc, ignore_errors=True)
         timeout = (self._timeout.value, self._timeout.message) if self._timeout else ()
-        self.timeout = KeywordTimeout(*timeout)
-        self.timeout.replace_variables(variables)
+        handler.timeout = KeywordTimeout(*timeout)
+        handler.timeout.replace_variables(variables)
+        return handler
 
     def run(self, context, arguments):
         context.start_user_keyword(self)
@@ -165,12 +176,21 @@ class UserKeywordHandler(object):
         return return_value
 
     def _resolve_arguments(self, arguments, variables=None):
-        resolver = ArgumentResolver(self.arguments)
-        mapper = ArgumentMapper(self.arguments)
-        positional, named = resolver.resolve(arguments, variables)
-        arguments, _ = mapper.map(positional, named, variables)
+        if self._are_plain_positional_arguments(arguments):
+            return list(arguments)
+        positional, named = self._argument_resolver.resolve(arguments,
+                                                            variables)
+        arguments, _ = self._argument_mapper.map(positional, named, variables)
         return arguments
 
+    def _are_plain_positional_arguments(self, arguments):
+        # Arguments matching positional arguments exactly and not containing
+        # variables, escapes or possible named arguments are used as-is.
+        return (len(arguments) == len(self.arguments.positional) and
+                not self.arguments.varargs and
+                all(isinstance(arg, basestring) and
+                    not self._needs_resolving(arg) for arg in arguments))
+
     def _execute(self, context, arguments):
         self._set_variables(arguments, context.variables)
         context.output.trace(lambda: self._log_args(context.variables))
@@ -210,7 +230,7 @@ class UserKeywordHandler(object):
         args = ['${%s}' % arg for arg in self.arguments.positional]
         if self.arguments.varargs:
             args.append('@{%s}' % self.arguments.varargs)
-        args = ['%s=%s' % (name, utils.safe_repr(variables[name]))
+        args = ['%s=%s' % (name, utils.safe_repr_bounded(variables[name]))
                 for name in args]
         return 'Arguments: [ %s ]' % ' | '.join(args)
 
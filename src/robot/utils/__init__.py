@@ -42,7 +42,7 @@ from .error import (get_error_message, get_error_details, ErrorDetails,
                     RERAISED_EXCEPTIONS)
 from .escaping import escape, unescape
 from .etreewrapper import ET, ETSource
-from .frange import frange
+from .frange import frange, xfrange
 from .markuputils import html_format, html_escape, xml_escape, attribute_escape
 from .markupwriters import HtmlWriter, XmlWriter, NullMarkupWriter
 from .importer import Importer
@@ -61,7 +61,8 @@ from .robottime import (get_timestamp, get_start_timestamp, format_time,
                         timestamp_to_secs, parse_time)
 from .setter import setter
 from .text import (cut_long_message, format_assign_message,
-                   pad_console_length, get_console_length)
+                   pad_console_length, get_console_length, unic_bounded,
+                   seq2str2_bounded, safe_repr_bounded)
 from .unic import unic, safe_repr
 from .utf8reader import Utf8Reader
 
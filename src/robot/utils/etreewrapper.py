@@ -12,6 +12,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from __future__ import with_statement
+
+import gzip
 import sys
 import os.path
 from StringIO import StringIO
@@ -78,11 +81,19 @@ class ETSource(object):
 
     def _open_source_if_necessary(self):
         if self._source_is_file_name():
+            if self._is_gzip_file(self._source):
+                return gzip.open(self._source, 'rb')
             return self._open_file(self._source)
         if isinstance(self._source, basestring):
             return self._open_string_io(self._source)
         return None
 
+    def _is_gzip_file(self, source):
+        if not os.path.isfile(source):
+            return False
+        with open(source, 'rb') as file:
+            return file.read(2) == '\x1f\x8b'
+
     if not _IRONPYTHON:
 
         # File is opened, and later closed, because ElementTree had a bug that
@@ -17,12 +17,45 @@ def frange(*args):
     """Like ``range()`` but accepts float arguments."""
     if all(isinstance(arg, (int, long)) for arg in args):
         return range(*args)
+    factor, args = _get_factor_and_integer_args(args)
+    return [x/float(factor) for x in range(*args)]
+
+
+def xfrange(*args):
+    """Like ``xrange()`` but accepts float arguments.
+
+    The returned object generates the values lazily but supports ``len()``.
+    Falls back to :func:`frange` if the values are too big for ``xrange()``.
+    """
+    try:
+        if all(isinstance(arg, (int, long)) for arg in args):
+            return xrange(*args)
+        factor, integers = _get_factor_and_integer_args(args)
+        return _ScaledRange(xrange(*integers), factor)
+    except OverflowError:
+        return frange(*args)
+
+
+def _get_factor_and_integer_args(args):
     start, stop, step = _get_start_stop_step(args)
     digits = max(_digits(start), _digits(stop), _digits(step))
     factor = pow(10, digits)
-    return [x/float(factor) for x in range(int(round(start*factor)),
-                                           int(round(stop*factor)),
-                                           int(round(step*factor)))]
+    return factor, (int(round(start*factor)), int(round(stop*factor)),
+                    int(round(step*factor)))
+
+
+class _ScaledRange(object):
+
+    def __init__(self, range, factor):
+        self._range = range
+        self._factor = float(factor)
+
+    def __iter__(self):
+        factor = self._factor
+        return (x/factor for x in self._range)
+
+    def __len__(self):
+        return len(self._range)
 
 
 def _get_start_stop_step(args):
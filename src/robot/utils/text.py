@@ -12,15 +12,21 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import sys
+
 from .charwidth import get_char_width
 from .misc import seq2str2
-from .unic import unic
+from .unic import safe_repr, unic
 
 
 _MAX_ASSIGN_LENGTH = 200
+_MAX_TRACE_LENGTH = 10000
 _MAX_ERROR_LINES = 40
 _MAX_ERROR_LINE_LENGTH = 78
 _ERROR_CUT_EXPLN = '    [ Message content over the limit has been removed. ]'
+# On IronPython `safe_repr` formats only lists itself, adding missing `u`
+# prefixes to their items, so other containers are formatted by it fully.
+_SAFE_REPR_CONTAINERS = (list,) if sys.platform == 'cli' else (list, tuple, dict)
 
 
 def cut_long_message(msg):
@@ -70,12 +76,115 @@ def _count_virtual_line_length(line):
 
 
 def format_assign_message(variable, value, cut_long=True):
-    value = unic(value) if variable.startswith('$') else seq2str2(value)
-    if cut_long and len(value) > _MAX_ASSIGN_LENGTH:
-        value = value[:_MAX_ASSIGN_LENGTH] + '...'
+    limit = _MAX_ASSIGN_LENGTH if cut_long else None
+    if variable.startswith('$'):
+        value = unic_bounded(value, limit)
+    else:
+        value = seq2str2_bounded(value, limit)
     return '%s = %s' % (variable, value)
 
 
+def unic_bounded(item, limit=None):
+    """Like `unic` but values longer than `limit` are cut and end with '...'.
+
+    Strings, lists, tuples and dictionaries are formatted only until the
+    limit is exceeded, so the cost does not depend on the size of the value.
+    """
+    return _format_bounded(item, _unic_pieces, unic, limit)
+
+
+def seq2str2_bounded(sequence, limit=None):
+    """Like `seq2str2` but bounded the same way as `unic_bounded`."""
+    return _format_bounded(sequence, _seq2str2_pieces, seq2str2, limit)
+
+
+def safe_repr_bounded(item, limit=_MAX_TRACE_LENGTH):
+    """Like `safe_repr` but bounded the same way as `unic_bounded`."""
+    return _format_bounded(item, _safe_repr_pieces, safe_repr, limit)
+
+
+def _format_bounded(item, get_pieces, format_fully, limit):
+    if limit is None:
+        return format_fully(item)
+    pieces = []
+    length = 0
+    try:
+        for piece in get_pieces(item, limit):
+            pieces.append(piece)
+            length += len(piece)
+            if length > limit:
+                return u''.join(pieces)[:limit] + '...'
+        return u''.join(pieces)
+    except:
+        # Let the normal formatter handle unrepresentable objects.
+        return _cut(format_fully(item), limit)
+
+def _cut(text, limit):
+    return text if len(text) <= limit else text[:limit] + '...'
+
+def _unic_pieces(item, limit):
+    if type(item) in (list, tuple, dict):
+        return _repr_pieces(item, limit)
+    if type(item) in (str, unicode) and len(item) > limit:
+        return [unic(item[:limit]), unic(item[limit:limit+1])]
+    return [unic(item)]
+
+def _seq2str2_pieces(sequence, limit):
+    if not sequence:
+        yield '[ ]'
+        return
+    yield '[ '
+    for index, item in enumerate(sequence):
+        if index:
+            yield ' | '
+        for piece in _unic_pieces(item, limit):
+            yield piece
+    yield ' ]'
+
+def _safe_repr_pieces(item, limit):
+    return _repr_pieces(item, limit, safe_repr, _SAFE_REPR_CONTAINERS)
+
+def _repr_pieces(item, limit, string_repr=repr,
+                 containers=(list, tuple, dict), parents=()):
+    if type(item) in (str, unicode):
+        if len(item) > limit:
+            # Closing quote is omitted because the value is cut anyway.
+            return [string_repr(item[:limit+1])[:-1]]
+        return [string_repr(item)]
+    if type(item) not in containers:
+        return [repr(item)]
+    if id(item) in parents:
+        return ['{...}' if type(item) is dict else '[...]']
+    args = limit, string_repr, containers, parents + (id(item),)
+    if type(item) is dict:
+        return _dict_repr_pieces(item, *args)
+    if type(item) is list:
+        return _sequence_repr_pieces(item, '[', ']', *args)
+    end = ',)' if len(item) == 1 else ')'
+    return _sequence_repr_pieces(item, '(', end, *args)
+
+def _sequence_repr_pieces(sequence, start, end, *args):
+    yield start
+    for index, item in enumerate(sequence):
+        if index:
+            yield ', '
+        for piece in _repr_pieces(item, *args):
+            yield piece
+    yield end
+
+def _dict_repr_pieces(dictionary, *args):
+    yield '{'
+    for index, (key, value) in enumerate(dictionary.iteritems()):
+        if index:
+            yield ', '
+        for piece in _repr_pieces(key, *args):
+            yield piece
+        yield ': '
+        for piece in _repr_pieces(value, *args):
+            yield piece
+    yield '}'
+
+
 def get_console_length(text):
     return sum(get_char_width(char) for char in text)
 
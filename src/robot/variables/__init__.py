@@ -27,6 +27,7 @@ from robot.output import LOGGER
 from .isvar import contains_var, is_var, is_scalar_var, is_list_var
 from .variables import Variables
 from .assigner import VariableAssigner
+from .filesetter import VariableFileImporter
 from .splitter import VariableSplitter, VariableIterator
 
 
@@ -35,6 +36,7 @@ GLOBAL_VARIABLES = Variables()
 
 def init_global_variables(settings):
     GLOBAL_VARIABLES.clear()
+    VariableFileImporter.clear_cache()
     _set_cli_vars(settings)
     for name, value in [ ('${TEMPDIR}', utils.abspath(tempfile.gettempdir())),
                          ('${EXECDIR}', utils.abspath('.')),
@@ -15,7 +15,8 @@
 import re
 
 from robot.errors import DataError
-from robot.utils import safe_repr, format_assign_message, get_error_message
+from robot.utils import (safe_repr_bounded, format_assign_message,
+                         get_error_message)
 
 from .isvar import is_list_var, is_scalar_var
 
@@ -29,7 +30,7 @@ class VariableAssigner(object):
         self.list_var = ap.list_var
 
     def assign(self, context, return_value):
-        context.trace(lambda: 'Return: %s' % safe_repr(return_value))
+        context.trace(lambda: 'Return: %s' % safe_repr_bounded(return_value))
         if self.scalar_vars or self.list_var:
             self._assign(context, ReturnValue(self.scalar_vars, self.list_var,
                                               return_value))
@@ -13,6 +13,7 @@
 #  limitations under the License.
 
 import inspect
+import os
 try:
     from java.util import Map
 except ImportError:
@@ -20,8 +21,8 @@ except ImportError:
 
 from robot.errors import DataError
 from robot.output import LOGGER
-from robot.utils import (get_error_message, is_dict_like, is_list_like,
-                         seq2str2, unic, Importer)
+from robot.utils import (abspath, get_error_message, is_dict_like,
+                         is_list_like, seq2str2, unic, Importer)
 
 
 class VariableFileSetter(object):
@@ -51,13 +52,46 @@ class VariableFileSetter(object):
 
 
 class VariableFileImporter(object):
+    """Imports variables from variable files.
+
+    Variables got from a variable file are cached during the execution based
+    on the path, the modification time and the arguments of the file. The
+    cache is cleared when a new execution starts. Variable files
+    can disable caching by setting `ROBOT_VARIABLE_FILE_CACHE` to a false
+    value, which is needed, for example, if `get_variables` returns different
+    variables on each call.
+    """
+    _cache = {}
+
+    @classmethod
+    def clear_cache(cls):
+        cls._cache.clear()
 
     def import_variables(self, path, args=None):
         LOGGER.info("Importing variable file '%s' with args %s" % (path, args))
+        key = self._get_cache_key(path, args)
+        if key in self._cache:
+            LOGGER.info("Using cached variables from variable file '%s'."
+                        % path)
+            return self._cache[key]
+        var_file, variables = self._import_variables(path, args)
+        if key and getattr(var_file, 'ROBOT_VARIABLE_FILE_CACHE', True):
+            self._cache[key] = variables
+        return variables
+
+    def _get_cache_key(self, path, args):
+        try:
+            key = (abspath(path), os.path.getmtime(path), tuple(args or ()))
+            hash(key)
+        except (OSError, TypeError):
+            return None
+        return key
+
+    def _import_variables(self, path, args):
         importer = Importer('variable file').import_class_or_module_by_path
         var_file = importer(path, instantiate_with_args=())
         try:
-            return self._get_variables(var_file, args)
+            return var_file, self._get_variables(var_file, args)
         except:
             amsg = 'with arguments %s ' % seq2str2(args) if args else ''
             raise DataError("Processing variable file '%s' %sfailed: %s"
@@ -87,7 +121,8 @@ class VariableFileImporter(object):
                         % (get_variables.__name__, type(variables).__name__))
 
     def _get_static_variable_names(self, var_file):
-        names = [attr for attr in dir(var_file) if not attr.startswith('_')]
+        names = [attr for attr in dir(var_file) if not attr.startswith('_')
+                 and attr != 'ROBOT_VARIABLE_FILE_CACHE']
         if hasattr(var_file, '__all__'):
             names = [name for name in names if name in var_file.__all__]
         return names
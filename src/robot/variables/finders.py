@@ -22,63 +22,102 @@ except ImportError:
 from robot.errors import DataError
 from robot.utils import get_env_var, get_error_message, is_list_like, normalize
 
-from .isvar import is_list_var, is_scalar_var
 from .notfound import raise_not_found
 
 
-class NumberFinder(object):
+class VariableFinder(object):
+    """Finds variable values using a single lookup per variable type.
+
+    Names are first looked up from the store, which is by far the most
+    common case. Only if that fails, the name is tried as a number,
+    list/scalar variable of the other type and with extended variable
+    syntax. How a name is interpreted depends only on the name itself,
+    so number values and parsed extended expressions are cached.
+    """
+
+    def __init__(self, variables):
+        self._store = variables.store
+        self._number = NumberFinder()
+        self._extended = ExtendedFinder(variables)
+        self._environment = EnvironmentFinder(self._store)
+        self._finders = {'$': self._find_scalar,
+                         '@': self._find_list,
+                         '%': self._environment.find}
 
     def find(self, name):
-        if name[0] != '$':
-            raise ValueError
-        number = normalize(name)[2:-1]
         try:
-            return self._get_int(number)
-        except ValueError:
-            return float(number)
+            finder = self._finders[name[0]]
+        except KeyError:
+            raise_not_found(name, self._store)
+        return finder(name)
 
-    def _get_int(self, number):
-        bases = {'0b': 2, '0o': 8, '0x': 16}
-        if number.startswith(tuple(bases)):
-            return int(number[2:], bases[number[:2]])
-        return int(number)
+    def _find_scalar(self, name):
+        try:
+            return self._store.find(name)
+        except KeyError:
+            pass
+        number = self._number.find(name)
+        if number is not NOT_FOUND:
+            return number
+        try:
+            return self._store.find('@'+name[1:])
+        except KeyError:
+            return self._extended.find(name)
 
+    def _find_list(self, name):
+        try:
+            return self._store.find(name)
+        except KeyError:
+            pass
+        scalar = '$'+name[1:]
+        try:
+            value = self._store.find(scalar)
+        except KeyError:
+            value = self._extended.find(scalar, not_found=name)
+        if not is_list_like(value):
+            raise DataError("Using scalar variable '%s' as list variable '@%s' "
+                            "requires its value to be list or list-like."
+                            % (scalar, scalar[1:]))
+        return value
 
-class ListAsScalarFinder(object):
 
-    def __init__(self, find_stored, find_extended):
-        self._find_stored = find_stored
-        self._find_extended = find_extended
+NOT_FOUND = object()
 
-    def find(self, name):
-        if not is_scalar_var(name):
-            raise ValueError
-        name = '@'+name[1:]
-        try:
-            return self._find_stored(name)
-        except KeyError:
-            return self._find_extended(name)
 
+class _NameCache(dict):
+    _max_size = 10000
+
+    def __setitem__(self, name, value):
+        if len(self) >= self._max_size:
+            self.clear()
+        dict.__setitem__(self, name, value)
 
-class ScalarAsListFinder(object):
 
-    def __init__(self, find_stored, find_extended):
-        self._find_stored = find_stored
-        self._find_extended = find_extended
+class NumberFinder(object):
+    _cache = _NameCache()
 
     def find(self, name):
-        if not is_list_var(name):
-            raise ValueError
-        name = '$'+name[1:]
         try:
-            value = self._find_stored(name)
+            return self._cache[name]
         except KeyError:
-            value = self._find_extended(name)
-        if not is_list_like(value):
-            raise DataError("Using scalar variable '%s' as list variable '@%s' "
-                            "requires its value to be list or list-like."
-                            % (name, name[1:]))
-        return value
+            number = self._cache[name] = self._get_number(name)
+            return number
+
+    def _get_number(self, name):
+        number = normalize(name)[2:-1]
+        try:
+            return self._get_int(number)
+        except ValueError:
+            try:
+                return float(number)
+            except ValueError:
+                return NOT_FOUND
+
+    def _get_int(self, number):
+        bases = {'0b': 2, '0o': 8, '0x': 16}
+        if number.startswith(tuple(bases)):
+            return int(number[2:], bases[number[:2]])
+        return int(number)
 
 
 class ExtendedFinder(object):
@@ -88,27 +127,50 @@ class ExtendedFinder(object):
     ([^\s\w].+)  # extended part (group 2)
     }$           # "}" and end of the string
     ''', re.UNICODE|re.VERBOSE)
+    _cache = _NameCache()
 
     def __init__(self, variables):
         self._variables = variables
 
-    def find(self, name):
-        res = self._extended_var_re.search(name)
-        if res is None:
-            raise ValueError
-        base_name = res.group(1)
-        expression = res.group(2)
+    def find(self, name, not_found=None):
+        extended = self._get_extended(name)
+        if not extended:
+            raise_not_found(not_found or name, self._variables.store)
         try:
-            variable = self._variables['${%s}' % base_name]
+            variable = self._variables['${%s}' % extended.base]
         except DataError, err:
             raise DataError("Resolving variable '%s' failed: %s"
                             % (name, unicode(err)))
         try:
-            return eval('_BASE_VAR_' + expression, {'_BASE_VAR_': variable})
+            return eval(extended.code, {'_BASE_VAR_': variable})
         except:
             raise DataError("Resolving variable '%s' failed: %s"
                             % (name, get_error_message()))
 
+    def _get_extended(self, name):
+        try:
+            return self._cache[name]
+        except KeyError:
+            match = self._extended_var_re.search(name)
+            extended = _Extended(*match.groups()) if match else None
+            self._cache[name] = extended
+            return extended
+
+
+class _Extended(object):
+
+    def __init__(self, base, expression):
+        self.base = base
+        self._expression = '_BASE_VAR_' + expression
+        self._code = None
+
+    @property
+    def code(self):
+        # Syntax errors are reported only after the base variable is found.
+        if not self._code:
+            self._code = compile(self._expression, '<string>', 'eval')
+        return self._code
+
 
 class EnvironmentFinder(object):
 
@@ -116,8 +178,6 @@ class EnvironmentFinder(object):
         self._store = store
 
     def find(self, name):
-        if name[0] != '%':
-            raise ValueError
         name = name[2:-1].strip()
         for getter in get_env_var, get_java_property:
             value = getter(name)
@@ -20,10 +20,17 @@ from .tablesetter import DelayedVariable
 
 
 class VariableStore(object):
+    """Stores variables and falls back to an optional parent store.
 
-    def __init__(self, variables):
+    Variables in the parent store are visible through this store unless
+    a variable with the same name is stored here. Only variables in this
+    store are modified or removed.
+    """
+
+    def __init__(self, variables, parent=None):
         self.store = NormalizedDict(ignore='_')
         self._variables = variables
+        self._parent = parent
 
     def resolve_delayed(self):
         for name, value in self.store.items():
@@ -39,14 +46,20 @@ class VariableStore(object):
         return self.store[name]
 
     def find(self, name):
-        return self._resolve_delayed(name, self.store[name])
+        try:
+            value = self.store[name]
+        except KeyError:
+            if self._parent is None:
+                raise
+            return self._parent.find(name)
+        return self._resolve_delayed(name, value)
 
     def clear(self):
         self.store.clear()
 
     def add(self, name, value, overwrite=True):
         validate_var(name)
-        if overwrite or name not in self.store:
+        if overwrite or name not in self:
             self.store[name] = value
 
     def remove(self, name):
@@ -54,10 +67,21 @@ class VariableStore(object):
             self.store.pop(name)
 
     def __len__(self):
-        return len(self.store)
+        if self._parent is None:
+            return len(self.store)
+        return len(self._parent) + sum(1 for name in self.store
+                                       if name not in self._parent)
 
     def __iter__(self):
-        return iter(self.store)
+        return iter(self._get_names())
+
+    def _get_names(self):
+        names = list(self.store)
+        if self._parent is not None:
+            names.extend(name for name in self._parent
+                         if name not in self.store)
+        return names
 
     def __contains__(self, name):
-        return name in self.store
+        return (name in self.store or
+                self._parent is not None and name in self._parent)
@@ -15,9 +15,7 @@
 from robot.errors import DataError
 
 from .filesetter import VariableFileSetter
-from .finders import (EnvironmentFinder, ExtendedFinder, ListAsScalarFinder,
-                      NumberFinder, ScalarAsListFinder)
-from .notfound import raise_not_found
+from .finders import VariableFinder
 from .replacer import VariableReplacer
 from .store import VariableStore
 from .tablesetter import VariableTableSetter
@@ -29,28 +27,24 @@ class Variables(object):
     Contains methods for replacing variables from list, scalars, and strings.
     On top of ${scalar} and @{list} variables these methods handle also
     %{environment} variables.
+
+    If `parent` variables are given, they are visible through these variables
+    without being copied. Setting a variable with the same name here hides
+    the parent variable.
     """
 
-    def __init__(self):
-        self.store = VariableStore(self)
+    def __init__(self, parent=None):
+        self._parent = parent
+        self.store = VariableStore(self, parent.store if parent is not None
+                                    else None)
         self.replacer = VariableReplacer(self)
+        self._finder = VariableFinder(self)
 
     def __setitem__(self, name, value):
         self.store.add(name, value)
 
     def __getitem__(self, name):
-        extended = ExtendedFinder(self)
-        for finder in (EnvironmentFinder(self.store),
-                       self.store,
-                       NumberFinder(),
-                       ListAsScalarFinder(self.store.find, extended.find),
-                       ScalarAsListFinder(self.store.find, extended.find),
-                       extended):
-            try:
-                return finder.find(name)
-            except (KeyError, ValueError):
-                pass
-        raise_not_found(name, self.store)
+        return self._finder.find(name)
 
     def resolve_delayed(self):
         self.store.resolve_delayed()
@@ -80,14 +74,10 @@ class Variables(object):
 
     def copy(self):
         # TODO: This is fugly!
-        variables = Variables()
+        variables = Variables(self._parent)
         variables.store.store = self.store.store.copy()
         return variables
 
-    def update(self, variables):
-        # TODO: Fugly!
-        self.store.store.update(variables.store.store)
-
     def __iter__(self):
         return iter(self.store)
 
@@ -0,0 +1,95 @@
+import unittest
+from os.path import dirname, join
+
+from robot.conf.gatherfailed import (GatherFailed, gather_failed_suites,
+                                     gather_failed_tests)
+from robot.errors import DataError
+from robot.utils.asserts import assert_equals, assert_raises_with_msg
+
+
+RESULTS = join(dirname(__file__), '..', 'result')
+GOLDEN = join(RESULTS, 'golden.xml')
+TEARDOWN_FAILED = join(RESULTS, 'suite_teardown_failed.xml')
+
+XML = """\
+<robot>
+<suite name="Root">
+<kw type="setup" name="Setup"><status status="PASS"/></kw>
+<suite name="Sub 1">
+<test name="T1"><status status="PASS"/></test>
+<test name="T2"><kw name="Kw"><status status="FAIL"/></kw>
+<status status="FAIL"/></test>
+<status status="FAIL"/>
+</suite>
+<suite name="Sub 2">
+<suite name="Sub 3">
+<test name="T3"><status status="PASS"/></test>
+<status status="PASS"/>
+</suite>
+<test name="T4"><kw type="teardown" name="Td"><status status="FAIL"/></kw>
+<status status="PASS"/></test>
+<kw type="teardown" name="Teardown"><status status="FAIL"/></kw>
+<status status="FAIL"/>
+</suite>
+<suite name="Sub 4">
+<test name="T5"><status status="PASS"/></test>
+<kw type="teardown" name="Teardown"><status status="NOT_RUN"/></kw>
+<status status="PASS"/>
+</suite>
+<status status="FAIL"/>
+</suite>
+<statistics/>
+<errors/>
+</robot>
+"""
+
+
+class TestGatherFailed(unittest.TestCase):
+
+    def test_failed_tests(self):
+        gatherer = GatherFailed().gather(XML)
+        assert_equals(gatherer.tests, ['Root.Sub 1.T2', 'Root.Sub 2.Sub 3.T3',
+                                       'Root.Sub 2.T4'])
+
+    def test_failed_suites(self):
+        gatherer = GatherFailed().gather(XML)
+        assert_equals(gatherer.suites, ['Root.Sub 1', 'Root.Sub 2'])
+
+    def test_suite_teardown_failed(self):
+        assert_equals(gather_failed_tests(TEARDOWN_FAILED),
+                      ['Suite Teardown Fail.Fail', 'Suite Teardown Fail.Pass',
+                       'Suite Teardown Fail.Teardowns'])
+        assert_equals(gather_failed_suites(TEARDOWN_FAILED),
+                      ['Suite Teardown Fail'])
+
+    def test_consistent_with_result_model(self):
+        from robot.api import ExecutionResult
+        for path in GOLDEN, TEARDOWN_FAILED:
+            suite = ExecutionResult(path).suite
+            expected = set(test.longname for test in self._tests(suite)
+                           if not test.passed)
+            assert_equals(set(GatherFailed().gather(path).tests), expected)
+
+    def _tests(self, suite):
+        for test in suite.tests:
+            yield test
+        for child in suite.suites:
+            for test in self._tests(child):
+                yield test
+
+    def test_none(self):
+        assert_equals(gather_failed_tests('NONE'), [])
+        assert_equals(gather_failed_suites('none'), [])
+
+    def test_all_passed(self):
+        xml = '<robot><suite name="S"><status status="PASS"/></suite></robot>'
+        assert_raises_with_msg(DataError, "Collecting failed tests from '%s' "
+                               "failed: All tests passed." % xml,
+                               gather_failed_tests, xml)
+
+    def test_invalid_file(self):
+        self.assertRaises(DataError, gather_failed_suites, 'non-existing.xml')
+
+
+if __name__ == '__main__':
+    unittest.main()
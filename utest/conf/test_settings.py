@@ -117,6 +117,12 @@ class TestRobotAndRebotSettings(unittest.TestCase):
             if hasattr(settings, attr):
                 assert_equals(getattr(settings, attr), None)
 
+    def test_gzipped_output_with_timestamp(self):
+        settings = RobotSettings({'output': 'out.xml.gz',
+                                  'timestampoutputs': True})
+        expected = 'out-%s.xml.gz' % settings.start_timestamp
+        assert_equals(os.path.basename(settings.output), expected)
+
     def test_log_levels(self):
         self._verify_log_level('TRACE')
         self._verify_log_level('DEBUG')
@@ -8,7 +8,7 @@ except ImportError:
         json = None
 import unittest
 
-from robot.utils.asserts import assert_equals, assert_raises
+from robot.utils.asserts import assert_equals, assert_raises, assert_true
 from robot.htmldata.jsonwriter import JsonDumper
 
 
@@ -79,6 +79,23 @@ class TestJsonDumper(unittest.TestCase):
         assert_equals(output.getvalue(), '[1,[a,{a:1}]]')
         assert_raises(ValueError, dumper.dump, [mapped1])
 
+    def test_dump_subclasses(self):
+        class String(unicode): pass
+        class Integer(int): pass
+        class List(list): pass
+        self._test(List([String(u'a"b'), Integer(42), List()]),
+                   '["a\\"b",42,[]]')
+
+    def test_escape_many(self):
+        self._test('a\n</b>\n\\"</', '"a\\n\\x3c/b>\\n\\\\\\"\\x3c/"')
+
+    def test_large_data_is_written_in_chunks(self):
+        output = WriteCounter()
+        data = range(10000)
+        JsonDumper(output).dump(data)
+        assert_equals(output.getvalue(), '[%s]' % ','.join(map(str, data)))
+        assert_true(1 < output.writes < 100)
+
     if json:
         def test_against_standard_json(self):
             data = ['\\\'\"\r\t\n' + ''.join(chr(i) for i in xrange(32, 127)),
@@ -91,5 +108,16 @@ class TestJsonDumper(unittest.TestCase):
             self._test(data, expected)
 
 
+class WriteCounter(StringIO):
+
+    def __init__(self):
+        StringIO.__init__(self)
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        StringIO.write(self, data)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -305,6 +305,34 @@ class TestTagPatterns(unittest.TestCase):
         patterns = TagPatterns([u'is\xe4', u'\xe4iti'])
         assert_equal(utils.seq2str(patterns), u"'is\xe4' and '\xe4iti'")
 
+    def test_match_is_normalized(self):
+        patterns = TagPatterns(['X_Y', 'A B*'])
+        assert_true(patterns.match('x y'))
+        assert_true(patterns.match(['__xy__']))
+        assert_true(patterns.match(Tags(['ab c'])))
+        assert_false(patterns.match('NONE'))
+
+    def test_wildcards_are_not_special_after_merging(self):
+        patterns = TagPatterns(['a.c', 'x*', 'y?', '(z)', 'w|v'])
+        for tag in ['a.c', 'x', 'xyz', 'y1', '(z)', 'w|v']:
+            assert_true(patterns.match(tag), tag)
+        for tag in ['abc', 'y', 'y12', 'z', 'w', 'v']:
+            assert_false(patterns.match(tag), tag)
+
+    def test_wildcards_with_and(self):
+        patterns = TagPatterns(['x*ANDy*ANDz'])
+        assert_false(patterns.match(['xxx', 'zzz', 'z']))
+        assert_true(patterns.match(['xxx', 'yyy', 'Z']))
+
+    def test_modified_tags_are_matched_correctly(self):
+        patterns = TagPatterns(['x'])
+        tags = Tags(['y'])
+        assert_false(patterns.match(tags))
+        tags.add('X')
+        assert_true(patterns.match(tags))
+        tags.remove('x')
+        assert_false(patterns.match(tags))
+
 
 class AndOrPatternGenerator(object):
     tags = ['0', '1']
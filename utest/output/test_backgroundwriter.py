@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+
+from robot.output.backgroundwriter import BackgroundOutput, BackgroundXmlWriter
+from robot.utils import ET, XmlWriter
+from robot.utils.asserts import assert_equals, assert_raises, assert_true
+
+
+class TestBackgroundXmlWriter(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.xml')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_same_output_as_normal_writer(self):
+        self._write(XmlWriter(self.path))
+        expected = self._read()
+        self._write(BackgroundXmlWriter(self.path))
+        assert_equals(self._read(), expected)
+
+    def test_many_chunks(self):
+        writer = BackgroundXmlWriter(self.path)
+        writer.start('root')
+        for index in range(10000):
+            writer.element('item', 'Content %d' % index, {'index': str(index)})
+            if index % 1000 == 0:
+                writer.sync()
+        writer.end('root')
+        writer.close()
+        items = ET.parse(self.path).getroot().findall('item')
+        assert_equals(len(items), 10000)
+        assert_equals(items[-1].text, 'Content 9999')
+
+    def test_aborted_file_is_well_formed(self):
+        writer = BackgroundXmlWriter(self.path)
+        writer.start('robot')
+        writer.start('suite', {'name': 'Suite'})
+        writer.element('msg', 'Hello')
+        writer.start('kw')
+        writer.output.write('<msg>Partial')
+        writer._close_if_aborted()
+        root = ET.parse(self.path).getroot()
+        assert_equals(root.tag, 'robot')
+        assert_equals([e.tag for e in root.find('suite')], ['msg', 'kw'])
+        assert_equals(list(root.find('suite/kw')), [])
+
+    def test_closing_after_abort_handling_does_nothing(self):
+        writer = BackgroundXmlWriter(self.path)
+        writer.start('robot')
+        writer.end('robot')
+        writer.close()
+        expected = self._read()
+        writer._close_if_aborted()
+        assert_equals(self._read(), expected)
+
+    def _write(self, writer):
+        writer.start('robot', {'generator': 'test'})
+        writer.start('suite', {'name': u'Hyv\xe4'})
+        writer.element('msg', 'a < b', {'level': 'INFO'})
+        writer.element('doc')
+        writer.end('suite')
+        writer.end('robot')
+        writer.close()
+
+    def _read(self):
+        with open(self.path) as output:
+            return output.read()
+
+
+class TestBackgroundOutput(unittest.TestCase):
+
+    def test_write_error_is_raised_when_closing(self):
+        output = BackgroundOutput(os.devnull)
+        output._file.close()
+        output._file = open(os.devnull)
+        output.write('data')
+        output.commit()
+        assert_raises(IOError, output.close)
+        assert_true(output.closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import unittest
+
+from robot.errors import DataError
+from robot.output.forloopsampler import ForLoopSampler, parse_sample_for_loops
+from robot.output.loggerhelper import Message
+from robot.utils.asserts import assert_equals, assert_raises
+
+
+class Keyword(object):
+
+    def __init__(self, name, type='kw', status='PASS'):
+        self.name = name
+        self.type = type
+        self.status = status
+        self.starttime = '20141018 12:00:00.000'
+        self.endtime = '20141018 12:00:00.010'
+
+
+class FakeLogger(object):
+
+    def __init__(self):
+        self.events = []
+
+    def start_keyword(self, kw):
+        self.events.append(('start', kw.name))
+
+    def end_keyword(self, kw):
+        self.events.append(('end', kw.name))
+
+    def log_message(self, msg):
+        self.events.append(('msg', msg.message))
+
+    def set_log_level(self, level):
+        return 'INFO'
+
+    def close(self):
+        self.events.append(('close', None))
+
+
+class TestParseSampleForLoops(unittest.TestCase):
+
+    def test_single_value(self):
+        assert_equals(parse_sample_for_loops('10'), (10, 10))
+
+    def test_first_and_last(self):
+        assert_equals(parse_sample_for_loops('5:0'), (5, 0))
+
+    def test_invalid(self):
+        for value in ['', 'x', '1:2:3', '-1', '1:']:
+            assert_raises(DataError, parse_sample_for_loops, value)
+
+
+class TestForLoopSampler(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = FakeLogger()
+        self.sampler = ForLoopSampler(self.logger, 1, 1)
+
+    def test_other_methods_are_delegated(self):
+        self.sampler.close()
+        assert_equals(self.logger.events, [('close', None)])
+        assert_equals(self.sampler.set_log_level('DEBUG'), 'INFO')
+
+    def test_short_loop_is_written_fully(self):
+        self._run_loop(2)
+        assert_equals(self._iterations(), ['0', '1'])
+
+    def test_removed_iterations_are_summarized(self):
+        self._run_loop(5)
+        assert_equals(self._iterations(), ['0', '3 iterations', '4'])
+        assert_equals(self._messages(), ['0', 'Elapsed time: total 00:00:00.030, '
+                                              'average 00:00:00.010, longest '
+                                              '00:00:00.010.', '4'])
+
+    def test_failed_iterations_are_written(self):
+        self._run_loop(8, failing=[4])
+        assert_equals(self._iterations(),
+                      ['0', '2 iterations', '3', '4', '2 iterations', '7'])
+
+    def test_warnings_are_written(self):
+        self._run_loop(5, warning=2)
+        assert_equals(self._iterations(), ['0', '1', '2', '1 iteration', '4'])
+
+    def test_messages_below_log_level_are_not_recorded(self):
+        sampler = ForLoopSampler(self.logger, 0, 1, 'INFO')
+        sampler.start_keyword(Keyword('for', 'for'))
+        sampler.start_keyword(Keyword('0', 'foritem'))
+        sampler.log_message(Message('debug', 'DEBUG'))
+        sampler.end_keyword(Keyword('0', 'foritem'))
+        sampler.end_keyword(Keyword('for', 'for'))
+        assert_equals(self._messages(), [])
+
+    def test_memory_usage_does_not_depend_on_iterations(self):
+        self.sampler.start_keyword(Keyword('for', 'for'))
+        for index in range(1000):
+            self._run_iteration(index)
+            loop = self.sampler._loops[-1]
+            assert_equals(len(loop._recorded), min(index, 1))
+        self.sampler.end_keyword(Keyword('for', 'for'))
+        assert_equals(self._iterations(), ['0', '998 iterations', '999'])
+
+    def test_nested_loops(self):
+        self.sampler.start_keyword(Keyword('outer', 'for'))
+        for index in range(3):
+            self.sampler.start_keyword(Keyword('o%d' % index, 'foritem'))
+            self._run_loop(3)
+            self.sampler.end_keyword(Keyword('o%d' % index, 'foritem'))
+        self.sampler.end_keyword(Keyword('outer', 'for'))
+        starts = [name for event, name in self.logger.events
+                  if event == 'start']
+        assert_equals(starts, ['outer',
+                               'o0', 'for', '0', '1 iteration', '2',
+                               '1 iteration',
+                               'o2', 'for', '0', '1 iteration', '2'])
+
+    def _run_loop(self, iterations, failing=(), warning=None):
+        self.sampler.start_keyword(Keyword('for', 'for'))
+        for index in range(iterations):
+            self._run_iteration(index, index in failing, index == warning)
+        self.sampler.end_keyword(Keyword('for', 'for'))
+
+    def _run_iteration(self, index, fail=False, warn=False):
+        item = Keyword(str(index), 'foritem')
+        self.sampler.start_keyword(item)
+        self.sampler.log_message(Message(str(index), 'WARN' if warn else 'INFO'))
+        item.status = 'FAIL' if fail else 'PASS'
+        self.sampler.end_keyword(item)
+
+    def _iterations(self):
+        return [name for event, name in self.logger.events
+                if event == 'start' and name != 'for']
+
+    def _messages(self):
+        return [msg for event, msg in self.logger.events if event == 'msg']
+
+
+if __name__ == '__main__':
+    unittest.main()
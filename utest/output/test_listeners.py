@@ -1,3 +1,4 @@
+import threading
 import unittest
 
 from robot.output.listeners import Listeners
@@ -107,6 +108,41 @@ class ListenAllNewStyle(ListenOutputs):
         print 'Closing...'
 
 
+class AsyncListener(object):
+
+    ROBOT_LISTENER_API_VERSION = 2
+    ROBOT_LISTENER_ASYNC = True
+
+    def __init__(self):
+        self.calls = []
+
+    def start_suite(self, name, attrs):
+        self._record('start_suite', name)
+
+    def start_keyword(self, name, attrs):
+        self._record('start_keyword', name)
+
+    def end_keyword(self, name, attrs):
+        if attrs['status'] == 'FAIL':
+            raise RuntimeError('Expected error')
+        self._record('end_keyword', name)
+
+    def close(self):
+        self._record('close', None)
+
+    def _record(self, method, name):
+        self.calls.append((method, name, threading.currentThread().getName()))
+
+
+class MessageCollector(object):
+
+    def __init__(self):
+        self.messages = []
+
+    def message(self, msg):
+        self.messages.append((msg.level, msg.message))
+
+
 class InvalidListenerOldStyle:
 
     def start_suite(self, wrong, number, of, args):
@@ -211,6 +247,62 @@ class TestInvalidOldStyleListener(unittest.TestCase):
             getattr(listenres, name)(*args)
 
 
+class TestSharedAttributes(unittest.TestCase):
+
+    def test_attributes_are_built_once_per_event(self):
+        listeners = Listeners([('test_listeners.ListenAllNewStyle', []),
+                               ('test_listeners.ListenAllNewStyle', [])])
+        received = []
+        for proxy in listeners._listeners:
+            proxy.start_keyword = lambda name, attrs: received.append(attrs)
+        listeners.start_keyword(KwMock())
+        assert_equals(len(received), 2)
+        assert_true(received[0] is received[1])
+        assert_equals(received[0]['args'], ['a1', 'a2'])
+
+
+class TestAsyncListener(unittest.TestCase):
+
+    def setUp(self):
+        self.listeners = Listeners([('test_listeners.AsyncListener', [])])
+        self.listener = self.listeners._listeners[0].logger
+        self.collector = MessageCollector()
+        LOGGER.register_logger(self.collector)
+
+    def tearDown(self):
+        LOGGER.unregister_logger(self.collector)
+
+    def test_calls_are_done_in_order_in_separate_thread(self):
+        self.listeners.start_suite(SuiteMock())
+        for i in range(2000):
+            self.listeners.start_keyword(KwMock())
+            self.listeners.end_keyword(KwMock())
+        self.listeners.close()
+        calls = self.listener.calls
+        assert_equals(len(calls), 4002)
+        assert_equals(calls[0][:2], ('start_suite', 'suitemock'))
+        assert_equals(calls[1][:2], ('start_keyword', 'kwmock'))
+        assert_equals(calls[2][:2], ('end_keyword', 'kwmock'))
+        assert_equals(calls[-1][:2], ('close', None))
+        main = threading.currentThread().getName()
+        assert_true(all(thread != main for _, _, thread in calls))
+
+    def test_failures_are_reported_in_main_thread(self):
+        kw = KwMock()
+        kw.status = 'FAIL'
+        self.listeners.end_keyword(kw)
+        self.listeners.close()
+        errors = [msg for msg in self.collector.messages if msg[0] == 'ERROR']
+        assert_equals(errors[0],
+                      ('ERROR', "Calling listener method 'end_keyword' of "
+                                "listener 'test_listeners.AsyncListener' "
+                                "failed: Expected error"))
+
+    def test_old_style_listeners_are_never_async(self):
+        listeners = Listeners([('test_listeners.ListenAllOldStyle', [])])
+        assert_equals(listeners._listeners[0]._async_caller, None)
+
+
 if utils.is_jython:
 
     class TestJavaListener(_BaseListenerTest, unittest.TestCase):
@@ -2,6 +2,8 @@ import unittest
 
 from robot.utils.asserts import assert_equals, assert_true, assert_false
 
+from robot.conf import RobotSettings
+from robot.output import output
 from robot.output.logger import Logger, CommandLineMonitor
 
 
@@ -236,5 +238,85 @@ class TestLogger(unittest.TestCase):
         assert_equals(len(logger._loggers.all_loggers()), number)
 
 
+class LevelLoggerMock(object):
+
+    def __init__(self, min_level):
+        self.min_level = min_level
+        self.messages = []
+
+    def message(self, msg):
+        self.messages.append((msg.message, msg.level))
+
+
+class TestMinLevel(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = Logger(register_console_logger=False)
+        self.logger.disable_message_cache()
+
+    def test_everything_is_logged_when_messages_are_cached(self):
+        logger = Logger(register_console_logger=False)
+        logger.register_logger(LevelLoggerMock('NONE'))
+        assert_true(logger.is_logged('TRACE'))
+
+    def test_lowest_level_of_registered_loggers_is_used(self):
+        self.logger.register_logger(LevelLoggerMock('INFO'),
+                                    LevelLoggerMock('DEBUG'))
+        assert_false(self.logger.is_logged('TRACE'))
+        assert_true(self.logger.is_logged('DEBUG'))
+        assert_true(self.logger.is_logged('info'))
+
+    def test_warnings_and_errors_are_always_logged(self):
+        self.logger.register_logger(LevelLoggerMock('NONE'))
+        assert_false(self.logger.is_logged('INFO'))
+        assert_true(self.logger.is_logged('WARN'))
+        assert_true(self.logger.is_logged('ERROR'))
+
+    def test_html_and_invalid_levels_are_not_ignored(self):
+        self.logger.register_logger(LevelLoggerMock('NONE'))
+        assert_true(self.logger.is_logged('HTML'))
+        assert_true(self.logger.is_logged('INVALID'))
+
+    def test_loggers_without_level_get_all_messages(self):
+        self.logger.register_logger(LevelLoggerMock('NONE'), LoggerMock())
+        assert_true(self.logger.is_logged('TRACE'))
+
+    def test_loggers_without_message_methods_do_not_affect_level(self):
+        self.logger.register_logger(LevelLoggerMock('INFO'), object())
+        assert_false(self.logger.is_logged('DEBUG'))
+
+    def test_level_is_updated(self):
+        logger = LevelLoggerMock('INFO')
+        self.logger.register_logger(logger)
+        logger.min_level = 'TRACE'
+        assert_false(self.logger.is_logged('TRACE'))
+        self.logger.update_min_level()
+        assert_true(self.logger.is_logged('TRACE'))
+        self.logger.unregister_logger(logger)
+        assert_false(self.logger.is_logged('INFO'))
+
+    def test_messages_below_level_are_not_written(self):
+        logger = LevelLoggerMock('INFO')
+        self.logger.register_logger(logger)
+        self.logger.write('debug', 'DEBUG')
+        self.logger.write('info', 'INFO')
+        assert_equals(logger.messages, [('info', 'INFO')])
+
+    def test_output_does_not_create_messages_below_level(self):
+        logger = LevelLoggerMock('INFO')
+        logger.log_message = logger.message
+        self.logger.register_logger(logger)
+        original = output.LOGGER
+        output.LOGGER = self.logger
+        try:
+            out = output.Output(RobotSettings(output='NONE'))
+            out.trace(lambda: 'trace')
+            out.debug('debug')
+            out.info('info')
+        finally:
+            output.LOGGER = original
+        assert_equals(logger.messages, [('info', 'INFO')])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,150 @@
+import unittest
+from StringIO import StringIO
+
+from robot.utils.asserts import assert_equals, assert_true
+
+from robot.output.profiler import (ExecutionProfile, KeywordStatistics,
+                                   _ProfileWriter)
+
+
+class FakeTimer(object):
+
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+class Item(object):
+
+    def __init__(self, name, type='kw', handler_type=None):
+        self.name = name
+        self.type = type
+        self.handler_type = handler_type
+
+
+class TestKeywordStatistics(unittest.TestCase):
+
+    def test_empty(self):
+        stat = KeywordStatistics('Name')
+        assert_equals(stat.calls, 0)
+        assert_equals(stat.min_time, 0.0)
+        assert_equals(stat.max_time, 0.0)
+        assert_equals(stat.average_time, 0.0)
+        assert_equals(stat.percentile(90), 0.0)
+
+    def test_aggregates(self):
+        stat = KeywordStatistics('Name')
+        for value in range(1, 11):
+            stat.add(value, value / 2.0)
+        assert_equals(stat.calls, 10)
+        assert_equals(stat.total_time, 55)
+        assert_equals(stat.self_time, 27.5)
+        assert_equals(stat.min_time, 1)
+        assert_equals(stat.max_time, 10)
+        assert_equals(stat.average_time, 5.5)
+        assert_equals(stat.percentile(50), 5)
+        assert_equals(stat.percentile(90), 9)
+        assert_equals(stat.percentile(100), 10)
+        assert_equals(stat.percentile(0), 1)
+
+    def test_percentiles_are_calculated_from_bounded_sample(self):
+        stat = KeywordStatistics('Name')
+        for value in range(1, 10001):
+            stat.add(value, value)
+        assert_equals(stat.calls, 10000)
+        assert_equals(stat.min_time, 1)
+        assert_equals(stat.max_time, 10000)
+        assert_equals(len(stat._sample), KeywordStatistics.sample_size)
+        assert_true(4000 < stat.percentile(50) < 6000)
+        assert_true(8500 < stat.percentile(90) < 9500)
+
+
+class TestExecutionProfile(unittest.TestCase):
+
+    def setUp(self):
+        self.timer = FakeTimer()
+        self.profile = ExecutionProfile(self.timer)
+
+    def _run(self, method, item, elapsed=0):
+        self.timer.time += elapsed
+        getattr(self.profile, method)(item)
+
+    def _run_example(self):
+        suite, test = Item('Suite'), Item('Test')
+        uk = Item('${x} = Resource.User KW', handler_type='user')
+        lib = Item('BuiltIn.Log', handler_type='library')
+        self._run('start_suite', suite)
+        self._run('start_test', test, 1)
+        self._run('start_keyword', uk, 1)
+        for _ in range(2):
+            self._run('start_keyword', lib, 1)
+            self._run('end_keyword', lib, 2)
+        self._run('end_keyword', uk, 1)
+        self._run('end_test', test, 1)
+        self._run('end_suite', suite, 1)
+
+    def test_keyword_statistics(self):
+        self._run_example()
+        uk = self.profile.keywords[('Resource.User KW', 'kw')]
+        assert_equals((uk.calls, uk.total_time, uk.self_time), (1, 7, 3))
+        lib = self.profile.keywords[('BuiltIn.Log', 'kw')]
+        assert_equals((lib.calls, lib.total_time, lib.self_time), (2, 4, 4))
+
+    def test_library_time_and_overhead(self):
+        self._run_example()
+        assert_equals(self.profile.elapsed_time, 11)
+        assert_equals(self.profile.library_time, 4)
+        assert_equals(self.profile.overhead_time, 7)
+
+    def test_collapsed_stacks(self):
+        self._run_example()
+        assert_equals(self.profile.stacks,
+                      {('Suite',): 2,
+                       ('Suite', 'Test'): 2,
+                       ('Suite', 'Test', 'Resource.User KW'): 3,
+                       ('Suite', 'Test', 'Resource.User KW', 'BuiltIn.Log'): 4})
+
+    def test_for_loop_iterations_are_aggregated(self):
+        loop = Item('${i} IN RANGE [ 2 ]', type='for')
+        self._run('start_keyword', loop)
+        for value in range(2):
+            item = Item('${i} = %d' % value, type='foritem')
+            self._run('start_keyword', item)
+            self._run('end_keyword', item, 1)
+        self._run('end_keyword', loop)
+        stat = self.profile.keywords[('${i} IN RANGE [ 2 ] (iteration)',
+                                      'foritem')]
+        assert_equals((stat.calls, stat.total_time), (2, 2))
+        assert_equals(self.profile.keywords[('${i} IN RANGE [ 2 ]', 'for')]
+                      .self_time, 0)
+
+
+class TestProfileWriter(unittest.TestCase):
+
+    def test_write(self):
+        stats, stacks = StringIO(), StringIO()
+        stats.name = 'profile.txt'
+        writer = _ProfileWriter(stats, stacks)
+        writer.close = lambda: None
+        writer.start_suite(Item('Suite'))
+        writer.start_keyword(Item('Lib.Kw;with semicolon',
+                                  handler_type='library'))
+        writer.end_keyword(Item('Lib.Kw;with semicolon'))
+        writer.end_suite(Item('Suite'))
+        lines = stats.getvalue().splitlines()
+        assert_true(lines[0].startswith('Elapsed time: '))
+        assert_equals(lines[4].split('\t'),
+                      ['Calls', 'Total', 'Self', 'Min', 'Median', 'P90',
+                       'P99', 'Max', 'Type', 'Name'])
+        assert_equals(lines[5].split('\t')[0], '1')
+        assert_equals(lines[5].split('\t')[-2:], ['kw', 'Lib.Kw;with semicolon'])
+        for line in stacks.getvalue().splitlines():
+            stack, micros = line.rsplit(' ', 1)
+            assert_true(stack in ('Suite', 'Suite;Lib.Kw,with semicolon'))
+            assert_true(int(micros) > 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+
+from robot.output.loggerhelper import Message
+from robot.output.recorder import OutputRecorder
+from robot.utils.asserts import assert_equals, assert_false, assert_true
+
+
+class Keyword(object):
+
+    def __init__(self, name):
+        self.name = name
+
+
+class FakeOutput(object):
+
+    def __init__(self):
+        self.events = []
+
+    def start_keyword(self, kw):
+        self.events.append(('start', kw.name))
+
+    def end_keyword(self, kw):
+        self.events.append(('end', kw.name))
+
+    def message(self, msg):
+        self.events.append(('message', msg.message))
+
+    def log_message(self, msg):
+        self.events.append(('log_message', msg.message))
+
+
+class TestOutputRecorder(unittest.TestCase):
+
+    def setUp(self):
+        self.recorder = OutputRecorder()
+        self.output = FakeOutput()
+
+    def test_replay_in_recorded_order(self):
+        self.recorder.start_keyword(Keyword('kw'))
+        self.recorder.log_message(Message('logged'))
+        self.recorder.info('written')
+        self.recorder.end_keyword(Keyword('kw'))
+        self.recorder.replay(self.output)
+        assert_equals(self.output.events, [('start', 'kw'),
+                                           ('log_message', 'logged'),
+                                           ('message', 'written'),
+                                           ('end', 'kw')])
+
+    def test_replayed_events_are_removed(self):
+        self.recorder.info('first')
+        self.recorder.replay(self.output)
+        self.recorder.info('second')
+        self.recorder.replay(self.output)
+        assert_equals(self.output.events, [('message', 'first'),
+                                           ('message', 'second')])
+
+    def test_recorded_items_are_copied(self):
+        kw = Keyword('original')
+        self.recorder.start_keyword(kw)
+        kw.name = 'changed'
+        self.recorder.replay(self.output)
+        assert_equals(self.output.events, [('start', 'original')])
+
+    def test_lazy_messages_are_evaluated_when_recorded(self):
+        state = ['original']
+        self.recorder.log_message(Message(lambda: state[0]))
+        state[0] = 'changed'
+        self.recorder.replay(self.output)
+        assert_equals(self.output.events, [('log_message', 'original')])
+
+    def test_has_warnings(self):
+        self.recorder.info('info')
+        assert_false(self.recorder.has_warnings)
+        self.recorder.warn('warning')
+        assert_true(self.recorder.has_warnings)
+
+    def test_events_after_closing_are_discarded(self):
+        self.recorder.start_keyword(Keyword('kw'))
+        self.recorder.close()
+        self.recorder.info('late')
+        self.recorder.end_keyword(Keyword('kw'))
+        self.recorder.replay(self.output)
+        assert_equals(self.output.events, [('start', 'kw')])
+
+
+if __name__ == '__main__':
+    unittest.main()
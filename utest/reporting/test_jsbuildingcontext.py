@@ -37,6 +37,33 @@ class TestStringContext(unittest.TestCase):
         assert_equals(ctx.strings, exp_strings)
 
 
+class TestHtml(unittest.TestCase):
+
+    def setUp(self):
+        self._context = JsBuildingContext(split_log=True)
+
+    def test_format(self):
+        assert_equals(self._context.html('*bold*'), 1)
+        assert_equals(self._context.html(''), 0)
+        assert_equals(self._context.strings, ('*', '*<p><b>bold</b></p>'))
+
+    def test_formatted_html_is_cached(self):
+        self._context.html('*bold*')
+        self._context.string('other')
+        assert_equals(self._context.html('*bold*'), 1)
+        assert_equals(self._context.strings, ('*', '*<p><b>bold</b></p>', '*other'))
+
+    def test_cache_is_string_cache_specific(self):
+        self._context.html('top')
+        self._context.start_splitting_if_needed(split=True)
+        assert_equals(self._context.html('split'), 1)
+        assert_equals(self._context.html('top'), 2)
+        assert_equals(self._context.strings, ('*', '*<p>split</p>', '*<p>top</p>'))
+        self._context.end_splitting(None)
+        assert_equals(self._context.html('top'), 1)
+        assert_equals(self._context.strings, ('*', '*<p>top</p>'))
+
+
 class TestTimestamp(unittest.TestCase):
 
     def setUp(self):
@@ -0,0 +1,69 @@
+import unittest
+from os.path import dirname, join
+from StringIO import StringIO
+
+from robot.errors import DataError
+from robot.result import ExecutionResult
+from robot.reporting.xunitwriter import StreamingXUnitWriter, XUnitWriter
+from robot.utils.asserts import assert_equals, assert_raises_with_msg
+
+
+RESULTS = join(dirname(__file__), '..', 'result')
+GOLDEN = join(RESULTS, 'golden.xml')
+TEARDOWN_FAILED = join(RESULTS, 'suite_teardown_failed.xml')
+
+
+class TestStreamingXUnitWriter(unittest.TestCase):
+
+    def test_same_output_as_model_based_writer(self):
+        for path in GOLDEN, TEARDOWN_FAILED:
+            self._verify(path)
+
+    def test_skip_noncritical(self):
+        for path in GOLDEN, TEARDOWN_FAILED:
+            self._verify(path, skip_noncritical=True)
+
+    def test_criticality_from_tags(self):
+        for path in GOLDEN, TEARDOWN_FAILED:
+            self._verify(path, skip_noncritical=True, critical_tags=['t1'])
+            self._verify(path, non_critical_tags=['*'])
+
+    def test_return_code(self):
+        for path in GOLDEN, TEARDOWN_FAILED:
+            writer = StreamingXUnitWriter(path).parse()
+            writer.close()
+            assert_equals(writer.return_code, ExecutionResult(path).return_code)
+
+    def test_empty_suite(self):
+        xml = '<robot><suite name="Empty"><status status="PASS"/></suite></robot>'
+        assert_raises_with_msg(DataError, "Suite 'Empty' contains no tests.",
+                               StreamingXUnitWriter(xml).parse)
+        StreamingXUnitWriter(xml, empty_suite_ok=True).parse().close()
+
+    def test_invalid_source(self):
+        self.assertRaises(DataError, StreamingXUnitWriter('<robot>').parse)
+
+    def _verify(self, path, skip_noncritical=False, critical_tags=None,
+                non_critical_tags=None):
+        result = ExecutionResult(path)
+        result.configure(suite_config={'critical_tags': critical_tags,
+                                       'non_critical_tags': non_critical_tags})
+        expected = Output()
+        XUnitWriter(result, skip_noncritical).write(expected)
+        writer = StreamingXUnitWriter(path, skip_noncritical, critical_tags,
+                                      non_critical_tags).parse()
+        actual = Output()
+        writer.write(actual)
+        writer.close()
+        assert_equals(actual.value, expected.value)
+
+
+class Output(StringIO):
+
+    def close(self):
+        self.value = self.getvalue()
+        StringIO.close(self)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,7 @@
 from __future__ import with_statement
+import gzip
+import os
+import tempfile
 import unittest
 from StringIO import StringIO
 
@@ -57,5 +60,26 @@ class TestResultSerializer(unittest.TestCase):
                                  self._xml_lines(GOLDEN_XML_TWICE))
 
 
+class TestGzipOutput(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.xml.gz')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_write_and_read_gzipped_output(self):
+        ExecutionResult(GOLDEN_XML).save(self.path)
+        with open(self.path, 'rb') as output:
+            assert_equals(output.read(2), '\x1f\x8b')
+        with gzip.open(self.path) as output:
+            assert_equals(ET.parse(output).getroot().tag, 'robot')
+        result = ExecutionResult(self.path)
+        expected = ExecutionResult(GOLDEN_XML)
+        assert_equals(result.suite.name, expected.suite.name)
+        assert_equals(result.suite.test_count, expected.suite.test_count)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,7 +2,8 @@ import unittest
 import os
 from os.path import abspath, join
 
-from robot.running.importer import ImportCache
+from robot.running.importer import ImportCache, Importer
+from robot.running.userkeyword import UserLibrary
 from robot.errors import FrameworkError
 from robot.utils.asserts import assert_equals, assert_true, assert_raises
 from robot.utils import normpath
@@ -69,5 +70,27 @@ class TestImportCache(unittest.TestCase):
         assert_equals(cache._keys[0], path)
 
 
+class TestImportResource(unittest.TestCase):
+    path = join(os.path.dirname(abspath(__file__)), '..', 'resources',
+                'test_resource.txt')
+
+    def test_resource_and_library_are_cached(self):
+        importer = Importer()
+        resource, library = importer.import_resource(self.path)
+        assert_true(isinstance(library, UserLibrary))
+        assert_equals(library.name, 'test_resource')
+        assert_equals(sorted(library.handlers.keys()),
+                      sorted(kw.name for kw in resource.keyword_table))
+        resource2, library2 = importer.import_resource(self.path)
+        assert_true(resource2 is resource)
+        assert_true(library2 is library)
+
+    def test_reset_clears_cache(self):
+        importer = Importer()
+        resource, library = importer.import_resource(self.path)
+        importer.reset()
+        assert_true(importer.import_resource(self.path)[1] is not library)
+
+
 if __name__ == '__main__':
     unittest.main()
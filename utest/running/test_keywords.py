@@ -16,6 +16,7 @@ class OutputStub:
 
 
 class MockHandler:
+    type = 'library'
 
     def __init__(self, name='Mock Handler', doc='Mock Doc', error=False):
         self.name = self.longname = name
@@ -24,7 +25,7 @@ class MockHandler:
         self.timeout = KeywordTimeout()
 
     def init_keyword(self, varz):
-        pass
+        return self
 
     def run(self, context, args):
         """Sets given args to self.ags and optionally returns something.
@@ -58,6 +59,7 @@ class _FakeContext(object):
         self.variables = self.namespace.variables
         self.in_teardown = False
         self.dry_run = False
+        self.started = []
 
     def get_handler(self, kwname):
         return MockHandler('Mocked.'+kwname, error=self.error)
@@ -65,7 +67,7 @@ class _FakeContext(object):
     def get_current_vars(self):
         return self.namespace.variables
 
-    def start_keyword(self, kw): pass
+    def start_keyword(self, kw): self.started.append(kw)
     def end_keyword(self, kw): pass
     def trace(self, msg): pass
     def info(self, msg): pass
@@ -94,10 +96,21 @@ class TestKeyword(unittest.TestCase):
         kw = Keyword('handler_name', args)
         assert_equals(kw.name, 'handler_name')
         assert_equals(kw.args, args)
-        kw.run(_FakeContext())
-        assert_equals(kw.name, 'Mocked.handler_name')
-        assert_equals(kw.doc, 'Mock Doc')
-        assert_equals(kw.handler_name, 'handler_name')
+        context = _FakeContext()
+        kw.run(context)
+        run = context.started[0]
+        assert_equals(run.name, 'Mocked.handler_name')
+        assert_equals(run.doc, 'Mock Doc')
+        assert_equals(run.status, 'PASS')
+        assert_equals(run.handler_name, 'handler_name')
+
+    def test_run_does_not_modify_keyword(self):
+        kw = Keyword('handler_name', ['arg'])
+        attrs = kw.__dict__.copy()
+        for _ in range(2):
+            kw.run(_FakeContext())
+        assert_equals(kw.__dict__, attrs)
+        assert_equals(kw.status, 'NOT_RUN')
 
 
 class TestSettingVariables(unittest.TestCase):
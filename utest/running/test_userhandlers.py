@@ -3,6 +3,7 @@ import unittest
 from robot.running.userkeyword import UserKeywordHandler, \
     EmbeddedArgsTemplate, EmbeddedArgs
 from robot.running.arguments import UserKeywordArgumentParser
+from robot.variables import Variables
 from robot.utils.asserts import *
 from robot.errors import DataError
 
@@ -122,6 +123,87 @@ class TestEmbeddedArgs(unittest.TestCase):
             assert_true(hasattr(embedded, attr), "'%s' missing" % attr)
 
 
+class FakeTimeout(object):
+
+    def __init__(self, value):
+        self.value = value
+        self.message = ''
+
+
+class TestInitKeyword(unittest.TestCase):
+
+    def setUp(self):
+        data = HandlerDataMock('Name')
+        data.doc = 'Doc with ${var}'
+        data.timeout = FakeTimeout('${timeout}')
+        self.handler = UserKeywordHandler(data, 'resource')
+
+    def test_returns_copy_with_variables_replaced(self):
+        copy = self.handler.init_keyword(self._variables('value', '1 min'))
+        assert_true(copy is not self.handler)
+        assert_equals(copy.doc, 'Doc with value')
+        assert_equals(copy.timeout.secs, 60)
+
+    def test_original_is_not_modified(self):
+        first = self.handler.init_keyword(self._variables('first', '1 min'))
+        second = self.handler.init_keyword(self._variables('second', '2 min'))
+        assert_equals(self.handler.doc, 'Doc with ${var}')
+        assert_false(hasattr(self.handler, 'timeout'))
+        assert_equals(first.doc, 'Doc with first')
+        assert_equals(first.timeout.secs, 60)
+        assert_equals(second.doc, 'Doc with second')
+        assert_equals(second.timeout.secs, 120)
+
+    def _variables(self, var, timeout):
+        variables = Variables()
+        variables['${var}'] = var
+        variables['${timeout}'] = timeout
+        return variables
+
+
+class TestResolveArguments(unittest.TestCase):
+
+    def setUp(self):
+        self.variables = Variables()
+        self.variables['${var}'] = 'value'
+
+    def test_plain_positional_arguments(self):
+        handler = self._handler('${a} ${b}')
+        assert_equals(handler._resolve_arguments(['x', 'y'], self.variables),
+                      ['x', 'y'])
+
+    def test_arguments_with_variables(self):
+        handler = self._handler('${a} ${b}')
+        assert_equals(handler._resolve_arguments(['${var}', r'\${var}'],
+                                                 self.variables),
+                      ['value', '${var}'])
+
+    def test_named_arguments(self):
+        handler = self._handler('${a} ${b}')
+        assert_equals(handler._resolve_arguments(['b=x', 'a=y'],
+                                                 self.variables),
+                      ['y', 'x'])
+
+    def test_defaults_and_varargs(self):
+        handler = self._handler('${a} ${b}=${var} @{c}')
+        assert_equals(handler._resolve_arguments(['x'], self.variables),
+                      ['x', 'value'])
+        assert_equals(handler._resolve_arguments(['x', 'y', 'z'],
+                                                 self.variables),
+                      ['x', 'y', 'z'])
+
+    def test_invalid_argument_count(self):
+        handler = self._handler('${a}')
+        assert_raises(DataError, handler._resolve_arguments, ['x', 'y'],
+                      self.variables)
+        assert_raises(DataError, handler._resolve_arguments, [],
+                      self.variables)
+
+    def _handler(self, args):
+        return UserKeywordHandler(HandlerDataMock('Name', args.split()),
+                                  'resource')
+
+
 class TestGetArgSpec(unittest.TestCase):
 
     def test_no_args(self):
@@ -1,6 +1,8 @@
 from __future__ import with_statement
+import gzip
 import os
 import sys
+import tempfile
 import unittest
 
 from robot.utils.asserts import assert_equals, assert_raises, assert_true
@@ -52,6 +54,21 @@ class TestETSource(unittest.TestCase):
         with ETSource(xml) as src:
             assert_equals(ET.parse(src).getroot().tag, 'tag')
 
+    def test_gzipped_file(self):
+        fd, path = tempfile.mkstemp(suffix='.gz')
+        os.close(fd)
+        try:
+            output = gzip.open(path, 'wb')
+            output.write('<tag>content</tag>')
+            output.close()
+            source = ETSource(path)
+            with source as src:
+                assert_equals(ET.parse(src).getroot().text, 'content')
+            self._verify_string_representation(source, path)
+            assert_true(source._opened.closed)
+        finally:
+            os.remove(path)
+
     def test_path_is_validated(self):
         def use(src):
             with src:
@@ -1,6 +1,6 @@
 import unittest
 
-from robot.utils.frange import frange, _digits
+from robot.utils.frange import frange, xfrange, _digits
 from robot.utils.asserts import assert_equals, assert_true, assert_raises
 
 
@@ -62,5 +62,28 @@ class TestFrange(unittest.TestCase):
             assert_equals(_digits(input), expected, input)
 
 
+class TestXFrange(unittest.TestCase):
+
+    def test_same_values_as_frange(self):
+        for input in [(6.0,), (6.01,), (-2.4, 2.1), (0, 0.5, 0.1), (10,),
+                      (1, 10, 2), (10, -5, -2), (1e20, 1e21, 2e20)]:
+            result = xfrange(*input)
+            assert_equals(list(result), frange(*input))
+            assert_equals(len(result), len(frange(*input)))
+
+    def test_values_are_generated_lazily(self):
+        result = xfrange(0, 1e12, 0.5)
+        assert_equals(len(result), 2000000000000)
+        iterator = iter(result)
+        assert_equals([iterator.next() for _ in range(3)], [0.0, 0.5, 1.0])
+
+    def test_too_big_values_for_xrange(self):
+        assert_equals(xfrange(10**30, 10**30+2), [10**30, 10**30+1])
+
+    def test_invalid_args(self):
+        assert_raises(TypeError, xfrange)
+        assert_raises(TypeError, xfrange, 1, 2, 3, 4)
+
+
 if __name__ == "__main__":
     unittest.main()
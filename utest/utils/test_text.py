@@ -4,7 +4,9 @@ from robot.utils.asserts import *
 
 from robot.utils.text import cut_long_message, _count_line_lengths, \
     _MAX_ERROR_LINES, _MAX_ERROR_LINE_LENGTH, _ERROR_CUT_EXPLN,\
-    get_console_length, pad_console_length
+    get_console_length, pad_console_length, format_assign_message, \
+    unic_bounded, seq2str2_bounded, safe_repr_bounded, _MAX_ASSIGN_LENGTH
+from robot.utils import text, unic, seq2str2, safe_repr
 
 
 class NoCutting(unittest.TestCase):
@@ -161,5 +163,86 @@ class TestConsoleWidth(unittest.TestCase):
         assert_equal(pad_console_length(self.mixed_26, 11), u'012345\u6c49...')
 
 
+class TestBoundedFormatting(unittest.TestCase):
+    values = ['', 'x' * 30, u'\xe4iti', 'bytes\xff', 42, None, 1.5, [], (),
+              {}, [1, 'a', u'b', (1,), ('x', [])], {'key': ['value'] * 5},
+              range(20), ('a' * 30,), [[[u'deep' * 5]]]]
+
+    def test_same_as_full_formatting_when_short(self):
+        for value in self.values:
+            assert_equal(unic_bounded(value, 1000), unic(value))
+            assert_equal(safe_repr_bounded(value, 1000), safe_repr(value))
+            if isinstance(value, (list, tuple)):
+                assert_equal(seq2str2_bounded(value, 1000), seq2str2(value))
+
+    def test_long_values_are_cut(self):
+        for value in self.values:
+            for limit in 0, 1, 5, 10, 25:
+                for bounded, full in [(unic_bounded, unic),
+                                      (safe_repr_bounded, safe_repr)]:
+                    assert_equal(bounded(value, limit),
+                                 self._cut(full(value), limit))
+                if isinstance(value, (list, tuple)):
+                    assert_equal(seq2str2_bounded(value, limit),
+                                 self._cut(seq2str2(value), limit))
+
+    def test_safe_repr_is_used_for_strings(self):
+        # IronPython's safe_repr adds `u` prefixes missing from repr.
+        original = text.safe_repr
+        text.safe_repr = lambda item: 'r(%s)' % original(item)
+        try:
+            assert_equal(safe_repr_bounded(u'foo', 100), "r(u'foo')")
+            assert_equal(safe_repr_bounded([u'a', 'b', 1], 100),
+                         "[r(u'a'), r('b'), 1]")
+            assert_equal(unic_bounded([u'a'], 100), "[u'a']")
+        finally:
+            text.safe_repr = original
+
+    def test_no_limit(self):
+        value = range(1000)
+        assert_equal(unic_bounded(value), unic(value))
+        assert_equal(seq2str2_bounded(value), seq2str2(value))
+
+    def test_recursive_containers(self):
+        lst = [1]
+        lst.append(lst)
+        dct = {}
+        dct['self'] = dct
+        for value in lst, dct, (lst,):
+            assert_equal(unic_bounded(value, 100), unic(value))
+
+    def test_unrepresentable_object(self):
+        class Unrepr(object):
+            def __repr__(self):
+                raise RuntimeError('oops')
+        class NonAsciiRepr(object):
+            def __repr__(self):
+                return 'Hyv\xc3\xa4'
+        for value in [Unrepr()], NonAsciiRepr(), [NonAsciiRepr()]:
+            assert_equal(safe_repr_bounded(value, 100), safe_repr(value))
+            assert_equal(unic_bounded(value, 100), unic(value))
+
+    def test_format_assign_message(self):
+        assert_equal(format_assign_message('${x}', 'value'), '${x} = value')
+        assert_equal(format_assign_message('@{x}', [1, 2]), '@{x} = [ 1 | 2 ]')
+        long = 'x' * (_MAX_ASSIGN_LENGTH + 1)
+        assert_equal(format_assign_message('${x}', long),
+                     '${x} = %s...' % long[:-1])
+        assert_equal(format_assign_message('${x}', long, cut_long=False),
+                     '${x} = %s' % long)
+
+    def test_format_assign_message_does_not_format_whole_value(self):
+        class Item(object):
+            formatted = 0
+            def __unicode__(self):
+                Item.formatted += 1
+                return u'item'
+        format_assign_message('@{x}', [Item() for _ in range(10000)])
+        assert_true(Item.formatted < 100)
+
+    def _cut(self, text, limit):
+        return text if len(text) <= limit else text[:limit] + '...'
+
+
 if __name__ == '__main__':
     unittest.main()
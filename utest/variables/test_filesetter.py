@@ -0,0 +1,85 @@
+from __future__ import with_statement
+import unittest
+import tempfile
+import shutil
+import os
+from os.path import join
+
+from robot.conf import RobotSettings
+from robot.variables import init_global_variables
+from robot.variables.filesetter import VariableFileImporter
+from robot.utils.asserts import assert_equal, assert_true
+
+
+COUNTING_VARIABLE_FILE = '''
+import os
+counter = os.path.join(os.path.dirname(__file__), 'counter')
+
+def get_variables(*args):
+    with open(counter, 'a') as file:
+        file.write('x')
+    return {'args': list(args), 'count': len(open(counter).read())}
+%s
+'''
+
+
+class TestVariableFileCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp(prefix='robot-filesetter-')
+        self.path = join(self.tempdir, 'variables.py')
+        self._create_variable_file()
+        VariableFileImporter.clear_cache()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+        VariableFileImporter.clear_cache()
+
+    def test_variables_are_cached(self):
+        first = self._import()
+        second = self._import()
+        assert_true(first is second)
+        assert_equal(dict(second), {'args': [], 'count': 1})
+
+    def test_arguments_are_part_of_key(self):
+        assert_equal(dict(self._import('a')), {'args': ['a'], 'count': 1})
+        assert_equal(dict(self._import('b')), {'args': ['b'], 'count': 2})
+        assert_equal(dict(self._import('a')), {'args': ['a'], 'count': 1})
+
+    def test_modified_file_is_imported_again(self):
+        self._import()
+        self._create_variable_file()
+        mtime = os.path.getmtime(self.path) + 10
+        os.utime(self.path, (mtime, mtime))
+        assert_equal(dict(self._import()), {'args': [], 'count': 2})
+
+    def test_unhashable_arguments_are_not_cached(self):
+        self._import(['list'])
+        assert_equal(dict(self._import(['list'])),
+                     {'args': [['list']], 'count': 2})
+
+    def test_caching_can_be_disabled(self):
+        self._create_variable_file('ROBOT_VARIABLE_FILE_CACHE = False')
+        self._import()
+        assert_equal(dict(self._import()), {'args': [], 'count': 2})
+
+    def test_cache_setting_is_not_variable(self):
+        with open(self.path, 'w') as file:
+            file.write('ROBOT_VARIABLE_FILE_CACHE = True\nvar = 1\n')
+        assert_equal(self._import(), [('var', 1)])
+
+    def test_cache_is_cleared_when_execution_starts(self):
+        self._import()
+        init_global_variables(RobotSettings())
+        assert_equal(dict(self._import()), {'args': [], 'count': 2})
+
+    def _create_variable_file(self, extra_content=''):
+        with open(self.path, 'w') as file:
+            file.write(COUNTING_VARIABLE_FILE % extra_content)
+
+    def _import(self, *args):
+        return VariableFileImporter().import_variables(self.path, list(args))
+
+
+if __name__ == '__main__':
+    unittest.main()
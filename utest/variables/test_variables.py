@@ -217,6 +217,51 @@ class TestVariables(unittest.TestCase):
         assert_equal(self.varz.replace_list(['${name}', 42]), [exp, 42])
         assert_equal(self.varz.replace_string('${name}'), str(exp))
 
+    def test_scalar_variable_as_list(self):
+        self.varz['${name}'] = exp = ['spam', 'eggs']
+        assert_equal(self.varz['@{name}'], exp)
+        self.varz['${name}'] = 'not list'
+        assert_raises(DataError, self.varz.__getitem__, '@{name}')
+
+    def test_extended_variables_use_current_base_value(self):
+        for value in ['first', 'second']:
+            self.varz['${obj}'] = value
+            assert_equal(self.varz['${obj.upper()}'], value.upper())
+            assert_equal(self.varz['@{obj.split("o")}'], value.split('o'))
+
+    def test_stored_variable_wins_over_number_and_extended_syntax(self):
+        assert_equal(self.varz['${42}'], 42)
+        assert_equal(self.varz['${0x10}'], 16)
+        self.varz['${42}'] = 'stored'
+        assert_equal(self.varz['${42}'], 'stored')
+        self.varz['${obj}'] = PythonObject('a', 1)
+        assert_equal(self.varz['${obj.a}'], 'a')
+        self.varz['${obj.a}'] = 'stored'
+        assert_equal(self.varz['${obj.a}'], 'stored')
+
+    def test_extended_variable_errors(self):
+        for name, base in [('${nonex.attr}', '${nonex}'),
+                           ('${nonex + 1}', '${nonex }')]:
+            for _ in range(2):
+                self._verify_error(name, "Resolving variable '%s' failed: "
+                                         "Variable '%s' not found."
+                                         % (name, base))
+        self.varz['${x}'] = 1
+        for _ in range(2):
+            self._verify_error('${x + }', "Resolving variable '${x + }' "
+                                          "failed: SyntaxError: ", prefix=True)
+        self._verify_error('${nonex}', "Variable '${nonex}' not found.")
+        self._verify_error('@{nonex}', "Variable '@{nonex}' not found.")
+
+    def _verify_error(self, name, message, prefix=False):
+        try:
+            self.varz[name]
+        except DataError, err:
+            error = unicode(err)
+            assert_equal(error[:len(message)] if prefix else error, message)
+        else:
+            raise AssertionError('DataError not raised')
+
     def test_copy(self):
         varz = Variables()
         varz['${foo}'] = 'bar'
@@ -237,5 +282,55 @@ class TestVariables(unittest.TestCase):
             assert_equal(self.varz.replace_list(['${obj.name}']), ['my name'])
 
 
+class TestParentVariables(unittest.TestCase):
+
+    def setUp(self):
+        self.parent = Variables()
+        self.parent['${parent}'] = 'parent'
+        self.parent['${both}'] = 'parent'
+        self.varz = Variables(self.parent)
+        self.varz['${child}'] = 'child'
+        self.varz['${both}'] = 'child'
+
+    def test_parent_variables_are_visible(self):
+        assert_equal(self.varz['${parent}'], 'parent')
+        assert_equal(self.varz.replace_string('${parent}-${child}'),
+                     'parent-child')
+        assert_true('${parent}' in self.varz.store)
+
+    def test_own_variables_hide_parent_variables(self):
+        assert_equal(self.varz['${both}'], 'child')
+        assert_equal(self.parent['${both}'], 'parent')
+
+    def test_parent_variables_are_not_copied(self):
+        self.parent['${parent}'] = 'new'
+        self.parent['${new}'] = 'new'
+        assert_equal(self.varz['${parent}'], 'new')
+        assert_equal(self.varz['${new}'], 'new')
+        assert_equal(self.varz.copy()['${new}'], 'new')
+
+    def test_setting_does_not_modify_parent(self):
+        self.varz['${parent}'] = 'child'
+        assert_equal(self.varz['${parent}'], 'child')
+        assert_equal(self.parent['${parent}'], 'parent')
+
+    def test_not_overwriting_parent_variables(self):
+        self.varz.store.add('${parent}', 'child', overwrite=False)
+        assert_equal(self.varz['${parent}'], 'parent')
+
+    def test_iteration_and_length(self):
+        assert_equal(sorted(self.varz), ['${both}', '${child}', '${parent}'])
+        assert_equal(len(self.varz), 3)
+
+    def test_clear_and_remove_affect_only_own_variables(self):
+        self.varz.store.remove('${both}')
+        self.varz.store.remove('${parent}')
+        assert_equal(self.varz['${both}'], 'parent')
+        assert_equal(self.parent['${parent}'], 'parent')
+        self.varz.clear()
+        assert_equal(sorted(self.varz), ['${both}', '${parent}'])
+        assert_raises(DataError, self.varz.__getitem__, '${child}')
+
+
 if __name__ == '__main__':
     unittest.main()